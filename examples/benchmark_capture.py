@@ -0,0 +1,98 @@
+"""
+pyunigps compressed capture benchmarking utility
+
+Compares the time taken to read (parsing=False) and parse (parsing=True)
+the same capture when stored uncompressed, gzip, xz or zstd compressed
+and opened with open_capture(). If the 'parse' times are similar for all
+codecs, the bottleneck remains in parsing rather than decompression.
+
+Usage (kwargs optional): python3 benchmark_capture.py infile=capture.log cycles=200
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2021
+:license: BSD 3-Clause
+"""
+
+import gzip
+import lzma
+import os
+import tempfile
+from sys import argv
+from time import perf_counter_ns
+
+from pyunigps import UNIReader, open_capture
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+INFILE = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "pygpsdata_mixed_rtcm3.log"
+)
+
+
+def timeit(path: str, parsing: bool) -> tuple:
+    """
+    Read all frames from capture.
+
+    :param str path: capture file path
+    :param bool parsing: parse frames
+    :return: tuple of (frames, elapsed seconds)
+    :rtype: tuple
+    """
+
+    start = perf_counter_ns()
+    count = 0
+    with open_capture(path) as stream:
+        for _ in UNIReader(stream, parsing=parsing):
+            count += 1
+    return count, (perf_counter_ns() - start) / 1e9
+
+
+def benchmark(**kwargs):
+    """
+    Compressed capture benchmark.
+
+    :param str infile: (kwarg) raw capture file (tests/pygpsdata_mixed_rtcm3.log)
+    :param int cycles: (kwarg) number of copies of infile in test capture (200)
+    """
+
+    infile = kwargs.get("infile", INFILE)
+    cyc = int(kwargs.get("cycles", 200))
+    with open(infile, "rb") as stream:
+        data = stream.read() * cyc
+
+    codecs = {"none": bytes, "gzip": gzip.compress, "xz": lzma.compress}
+    if zstandard is not None:
+        codecs["zstd"] = zstandard.ZstdCompressor().compress
+
+    print(f"\nCapture size: {len(data):,} bytes\n")
+    print(f"{'codec':<6} {'size':>12} {'read s':>8} {'parse s':>8} {'frames/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec, compress in codecs.items():
+            path = os.path.join(tmp, f"capture.{codec}")
+            with open(path, "wb") as out:
+                out.write(compress(data))
+            _, tread = timeit(path, False)
+            count, tparse = timeit(path, True)
+            print(
+                f"{codec:<6} {os.path.getsize(path):>12,} {tread:>8.3f} "
+                f"{tparse:>8.3f} {count / tparse:>12,.0f}"
+            )
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as benchmark() method
+    """
+
+    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+pyunigps import time benchmarking utility
+
+Uses 'python -X importtime' to measure the cold start cost of
+'import pyunigps' from this source tree against the same import from a
+baseline release (e.g. a checkout or unpacked sdist of v0.1.1, which
+loaded the pynmeagps and pyrtcm backends and had no optional feature
+modules), and reports which of the heavier standard library packages
+each one loads.
+
+Usage (kwargs optional): python3 benchmark_import.py baseline=/path/to/pyunigps-0.1.1/src runs=15
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2021
+:license: BSD 3-Clause
+"""
+
+import os
+import subprocess
+import sys
+from sys import argv
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+HEAVY = (
+    "argparse",
+    "gzip",
+    "json",
+    "lzma",
+    "multiprocessing",
+    "pynmeagps",
+    "pyrtcm",
+    "socketserver",
+)
+STMT = (
+    "import sys, pyunigps; "
+    f"print(pyunigps.__version__, *(m for m in {HEAVY!r} if m in sys.modules))"
+)
+
+
+def importtime(path: str, runs: int) -> tuple:
+    """
+    Get best of n cumulative import times of pyunigps from source path.
+
+    :param str path: source path containing the pyunigps package
+    :param int runs: number of runs
+    :return: tuple of (best cumulative import time in ms, version,
+        heavy packages loaded)
+    :rtype: tuple
+    """
+
+    env = dict(os.environ, PYTHONPATH=path)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # time cached bytecode, not compiling
+    totals = []
+    for _ in range(runs + 1):  # first run is warm-up
+        res = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", STMT],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+        total = 0
+        for line in res.stderr.splitlines():
+            # top level imports only: "import time: self | cumulative | name"
+            parts = line.split("|")
+            if len(parts) == 3 and not parts[2].startswith("  "):
+                try:
+                    total += int(parts[1])
+                except ValueError:
+                    pass  # column headings
+        totals.append(total)
+    version, *loaded = res.stdout.split()
+    return min(totals[1:]) / 1000, version, loaded
+
+
+def benchmark(**kwargs):
+    """
+    Import time benchmark.
+
+    :param str baseline: (kwarg) source path of baseline release (None)
+    :param int runs: (kwarg) number of runs of each import (15)
+    """
+
+    runs = int(kwargs.get("runs", 15))
+    baseline = kwargs.get("baseline", None)
+    print(f"\nBest of {runs} cold imports of pyunigps:\n")
+    curr, version, loaded = importtime(SRC, runs)
+    print(f"{'this tree (v' + version + ')':<24} {curr:>8.1f} ms  loads {loaded}")
+    if baseline is None:
+        print("\nSpecify baseline=<source path> to compare with a baseline release")
+        return
+    base, version, loaded = importtime(baseline, runs)
+    print(f"{'baseline (v' + version + ')':<24} {base:>8.1f} ms  loads {loaded}")
+    print(f"{'difference':<24} {curr - base:>+8.1f} ms ({(curr - base) / base:+.0%})")
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as benchmark() method
+    """
+
+    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
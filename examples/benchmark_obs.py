@@ -0,0 +1,117 @@
+"""
+pyunigps observation decode benchmarking utility
+
+Compares the time taken to decode the same observations from
+uncompressed OBSVM (40 bytes/obs) and compressed OBSVMCMP (24 bytes/obs)
+logs, both as full UNIMessage attribute parses (OBSVMCMP using the
+bit-packed block definition) and as per-observation
+arrays using decode_obsvm() / decode_obsvcmp().
+
+Usage (kwargs optional): python3 benchmark_obs.py cycles=1000 numobs=60
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2021
+:license: BSD 3-Clause
+"""
+
+import struct
+from random import randint, uniform
+from sys import argv
+from time import perf_counter_ns
+
+from pyunigps import UNIMessage, UNIReader, decode_obsvcmp, decode_obsvm
+
+
+def make_logs(numobs: int) -> tuple:
+    """
+    Create OBSVM and OBSVMCMP frames containing random observations.
+
+    :param int numobs: number of observations
+    :return: tuple of (OBSVM frame, OBSVMCMP frame)
+    :rtype: tuple
+    """
+
+    obs = b""
+    cmp = b""
+    for _ in range(numobs):
+        prn = randint(1, 63)
+        psr = round(uniform(2e7, 2.5e7) * 128) / 128
+        adr = round(uniform(-1e6, 1e6) * 256) / 256
+        dopp = round(uniform(-4000, 4000) * 256) / 256
+        cn0 = randint(20, 51)
+        lock = round(uniform(0, 10000) * 32) / 32
+        obs += struct.pack(
+            "<HHddHHfHHfI", 0, prn, psr, adr, 17, 20, dopp, cn0 * 100, 0, lock, 0
+        )
+        val = (
+            (round(dopp * 256) & 0xFFFFFFF) << 32
+            | round(psr * 128) << 60
+            | (round(adr * 256) & 0xFFFFFFFF) << 96
+            | prn << 136
+            | round(lock * 32) << 144
+            | (cn0 - 20) << 165
+        )
+        cmp += val.to_bytes(24, "little")
+    count = numobs.to_bytes(4, "little")
+    return (
+        UNIMessage(msgid=12, wno=2406, tow=0, payload=count + obs).serialize(),
+        UNIMessage(msgid=138, wno=2406, tow=0, payload=count + cmp).serialize(),
+    )
+
+
+def timeit(func, cyc: int) -> float:
+    """
+    Time function call.
+
+    :param func: function
+    :param int cyc: number of calls
+    :return: elapsed seconds
+    :rtype: float
+    """
+
+    start = perf_counter_ns()
+    for _ in range(cyc):
+        func()
+    return (perf_counter_ns() - start) / 1e9
+
+
+def benchmark(**kwargs):
+    """
+    Observation decode benchmark.
+
+    :param int cycles: (kwarg) number of decodes (1000)
+    :param int numobs: (kwarg) observations per log (60)
+    """
+
+    cyc = int(kwargs.get("cycles", 1000))
+    numobs = int(kwargs.get("numobs", 60))
+    obsvm, obsvmcmp = make_logs(numobs)
+    payobs = UNIReader.parse(obsvm).payload
+    paycmp = UNIReader.parse(obsvmcmp).payload
+
+    print(f"\n{cyc:,} logs of {numobs} observations")
+    print(f"OBSVM {len(obsvm):,} bytes, OBSVMCMP {len(obsvmcmp):,} bytes\n")
+    for name, func in (
+        ("OBSVM parse", lambda: UNIReader.parse(obsvm)),
+        ("OBSVMCMP parse", lambda: UNIReader.parse(obsvmcmp)),
+        ("OBSVM decode_obsvm", lambda: decode_obsvm(payobs)),
+        ("OBSVMCMP decode_obsvcmp", lambda: decode_obsvcmp(paycmp)),
+    ):
+        secs = timeit(func, cyc)
+        print(f"{name:<25} {secs:>8.3f} s {cyc * numobs / secs:>14,.0f} obs/s")
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as benchmark() method
+    """
+
+    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ Created on 6 Oct 2025
 :license: BSD 3-Clause
 """
 
-from pynmeagps import SocketWrapper
+from importlib import import_module
 
 from pyunigps._version import __version__
 from pyunigps.exceptions import (
@@ -17,10 +17,71 @@ from pyunigps.exceptions import (
     UNIStreamError,
     UNITypeError,
 )
+from pyunigps.unicache import UNIPayloadCache
+from pyunigps.unicorrections import UNICorrectionStore
+from pyunigps.uniephemeris import UNIEphemerisStore
+from pyunigps.unifilter import UNIChangeFilter, UNIFieldFilter
 from pyunigps.unihelpers import *
 from pyunigps.unimessage import UNIMessage
+from pyunigps.uniobs import decode_obsvcmp, decode_obsvm
+from pyunigps.uniopaque import UNIOpaqueMessage
+from pyunigps.uniorbit import satpos
+from pyunigps.uniparser import UNIParser
 from pyunigps.unireader import UNIReader
+from pyunigps.uniregistry import REGISTRY, UNIPayloadRegistry
 from pyunigps.unitypes_core import *
 from pyunigps.unitypes_get import *
+from pyunigps.uniview import UNIMessageView
 
 version = __version__  # pylint: disable=invalid-name
+
+LAZY_IMPORTS = {
+    "JSON_ENCODER": "pyunigps.uniexport",
+    "SocketWrapper": "pynmeagps",
+    "UNIColumnCache": "pyunigps.unicolumns",
+    "UNIDemux": "pyunigps.unidemux",
+    "UNIJSONWriter": "pyunigps.uniexport",
+    "UNIRecorder": "pyunigps.unicapture",
+    "UNIReplayer": "pyunigps.unicapture",
+    "UNIRingReader": "pyunigps.uniring",
+    "UNIRingWriter": "pyunigps.uniring",
+    "UNISocketServer": "pyunigps.uniserver",
+    "json_default": "pyunigps.uniexport",
+    "open_capture": "pyunigps.unicapture",
+    "to_columns": "pyunigps.unicolumns",
+}
+"""
+Attributes imported from their module on first use, so that importing
+pyunigps does not load the standard library packages (e.g. socketserver,
+gzip, lzma, argparse, multiprocessing, json) or the NMEA backend which
+only these optional features need
+"""
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import attribute in LAZY_IMPORTS on first use.
+
+    :param str name: attribute name
+    :return: attribute
+    :rtype: object
+    :raises: AttributeError if attribute does not exist
+    """
+
+    module = LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(module), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list:
+    """
+    List module attributes, including those imported on first use.
+
+    :return: attribute names
+    :rtype: list
+    """
+
+    return sorted(set(globals()) | set(LAZY_IMPORTS))
@@ -0,0 +1,182 @@
+"""
+UNIPayloadCache class.
+
+Opt-in bounded LRU cache of decoded UNI payloads, for messages such as
+ephemerides, ionosphere/UTC parameters, VERSION and BASEPOS which are
+re-broadcast with payloads that rarely change.
+
+Entries are keyed on (msgid, msgmode, parsebitfield, header version, payload
+bytes), as the header version may select the payload layout. On a
+hit, the previously decoded payload attributes are reused and only the
+new header (time) fields are applied, avoiding a full attribute decode.
+
+Usage::
+
+    cache = UNIPayloadCache(maxsize=512, maxbytes=1048576)
+    unr = UNIReader(stream, cache=cache)
+    ...
+    print(cache.hits, cache.misses)
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+from collections import OrderedDict
+from sys import getsizeof
+
+from pyunigps.exceptions import ParameterError
+from pyunigps.unitypes_core import UNI_MSGIDS
+
+CACHE_DEFAULT_IDS = (
+    "VERSION",
+    "GPSEPH",
+    "QZSSEPH",
+    "BD3EPH",
+    "BDSEPH",
+    "GLOEPH",
+    "GALEPH",
+    "IRNSSEPH",
+    "GPSION",
+    "BD3ION",
+    "BDSION",
+    "GALION",
+    "GPSUTC",
+    "BD3UTC",
+    "BDSUTC",
+    "GALUTC",
+    "BASEPOS",
+)
+"""Slowly varying messages cached by default"""
+
+
+class UNIPayloadCache:
+    """
+    UNIPayloadCache class.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        maxbytes: int = 1048576,
+        msgids: tuple | None = CACHE_DEFAULT_IDS,
+    ):
+        """
+        Constructor.
+
+        :param int maxsize: maximum number of cached payloads (256)
+        :param int maxbytes: approximate maximum memory used by cached
+            payloads and their decoded attributes, in bytes (1 MB)
+        :param tuple | None msgids: msgids (as int or name) eligible for
+            caching, None = all (CACHE_DEFAULT_IDS)
+        :raises: ParameterError if limits are invalid
+        """
+
+        if maxsize < 1 or maxbytes < 1:
+            raise ParameterError("maxsize and maxbytes must be >= 1")
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        if msgids is None:
+            self._msgids = None
+        else:
+            names = {val: key for key, val in UNI_MSGIDS.items()}
+            self._msgids = {names.get(mid, mid) for mid in msgids}
+        self._cache = OrderedDict()  # key: (message, size)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def cacheable(self, msgid: int) -> bool:
+        """
+        Check if msgid is eligible for caching.
+
+        :param int msgid: msgid
+        :return: True if eligible
+        :rtype: bool
+        """
+
+        return self._msgids is None or msgid in self._msgids
+
+    def get(self, key: tuple) -> object:
+        """
+        Get cached template message and mark as most recently used.
+
+        :param tuple key: (msgid, msgmode, parsebitfield, version, payload)
+        :return: cached UNIMessage or None if not cached
+        :rtype: UNIMessage
+        """
+
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: tuple, msg: object):
+        """
+        Add decoded message to cache, evicting least recently used entries
+        as necessary to stay within size and memory limits.
+
+        :param tuple key: (msgid, msgmode, parsebitfield, version, payload)
+        :param UNIMessage msg: decoded message
+        """
+
+        size = _msgsize(msg) + getsizeof(key[-1])
+        if size > self._maxbytes or key in self._cache:
+            return
+        self._cache[key] = (msg, size)
+        self._bytes += size
+        while len(self._cache) > self._maxsize or self._bytes > self._maxbytes:
+            _, (_, osize) = self._cache.popitem(last=False)
+            self._bytes -= osize
+
+    def clear(self):
+        """
+        Clear cache and reset counters.
+        """
+
+        self._cache.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def currsize(self) -> int:
+        """
+        Getter for number of cached payloads.
+
+        :return: number of entries
+        :rtype: int
+        """
+
+        return len(self._cache)
+
+    @property
+    def currbytes(self) -> int:
+        """
+        Getter for approximate memory used by cached payloads.
+
+        :return: size in bytes
+        :rtype: int
+        """
+
+        return self._bytes
+
+
+def _msgsize(msg: object) -> int:
+    """
+    Estimate memory used by decoded message, as the size of its attribute
+    dict plus the shallow size of each attribute value (attribute names
+    are shared between messages so are not counted).
+
+    :param UNIMessage msg: decoded message
+    :return: size in bytes
+    :rtype: int
+    """
+
+    attrs = msg.__dict__
+    return getsizeof(msg) + getsizeof(attrs) + sum(map(getsizeof, attrs.values()))
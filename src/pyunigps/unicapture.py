@@ -0,0 +1,417 @@
+"""
+UNIRecorder and UNIReplayer classes.
+
+UNIRecorder stores each raw frame read by UNIReader together with
+its host monotonic receive time in a compact binary capture file,
+written through a large buffer. UNIReplayer feeds the recorded frames
+back to any stream consumer at the original rate (speed=1), N times
+faster (speed=N) or as fast as possible (speed=0), reproducing the
+bursty arrival pattern of the original stream.
+
+Capture file format (little-endian):
+
++----------+---------+----------+------------------------------------+
+|  magic   | version | reserved | records...                         |
++==========+=========+==========+====================================+
+| b'UNICAP'| 1 byte  |  1 byte  | variable                           |
++----------+---------+----------+------------------------------------+
+
+record:
+
++--------------+---------+----------+
+|  timestamp   | length  |  frame   |
++==============+=========+==========+
+|   8 bytes    | 4 bytes | variable |
++--------------+---------+----------+
+
+timestamp = host monotonic receive time in nanoseconds.
+
+open_capture() opens a plain, gzip, xz or zstd compressed capture (raw
+receiver data or UNIRecorder capture) as a buffered binary stream which
+UNIReader can read from directly, decompressing on the fly rather than
+via a temporary file. The compression is detected from the file's magic
+bytes. zstd support requires either the Python 3.14 'compression.zstd'
+module or the optional 'zstandard' package.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import gzip
+import lzma
+import struct
+from io import BufferedReader
+from time import monotonic_ns, sleep
+
+from pyunigps.exceptions import ParameterError, UNIStreamError
+
+CAPTURE_MAGIC = b"UNICAP"
+"""Capture file magic bytes"""
+CAPTURE_VERSION = 1
+"""Capture file format version"""
+CAPTURE_HDR = CAPTURE_MAGIC + bytes((CAPTURE_VERSION, 0))
+"""Capture file header"""
+CAPTURE_BUFSIZE = 1048576
+"""Default capture file buffer size in bytes (1 MB)"""
+RECORD = struct.Struct("<QI")
+"""Capture record header (timestamp ns, frame length)"""
+GZIP_MAGIC = b"\x1f\x8b"
+"""gzip magic bytes"""
+XZ_MAGIC = b"\xfd\x37\x7a\x58\x5a\x00"
+"""xz magic bytes"""
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+"""zstd magic bytes"""
+
+
+def _zstd_reader(stream):
+    """
+    Get zstd decompressing reader from whichever zstd codec is available.
+
+    :param object stream: compressed binary stream
+    :return: decompressing binary stream
+    :rtype: object
+    :raises: ParameterError if no zstd codec is installed
+    """
+
+    try:
+        from compression import (  # pylint: disable=import-outside-toplevel
+            zstd,
+        )
+
+        return zstd.ZstdFile(stream)
+    except ImportError:
+        pass
+    try:
+        import zstandard  # pylint: disable=import-outside-toplevel
+
+        return zstandard.ZstdDecompressor().stream_reader(stream)
+    except ImportError as err:
+        raise ParameterError(
+            "zstd capture requires Python>=3.14 or the 'zstandard' package"
+        ) from err
+
+
+def open_capture(filename: str, bufsize: int = CAPTURE_BUFSIZE) -> BufferedReader:
+    """
+    Open plain or compressed (gzip, xz, zstd) capture file for reading,
+    detecting the compression from the file's magic bytes.
+
+    The returned stream supports read(n) and readline() and can be passed
+    directly to UNIReader or UNIReplayer. It should be closed after use.
+
+    :param str filename: capture file path
+    :param int bufsize: read buffer size in bytes (1 MB)
+    :return: buffered (decompressing) binary stream
+    :rtype: BufferedReader
+    :raises: ParameterError if zstd compressed and no zstd codec is installed
+    """
+
+    raw = open(filename, "rb", buffering=bufsize)  # pylint: disable=consider-using-with
+    magic = raw.peek(len(XZ_MAGIC))[: len(XZ_MAGIC)]
+    try:
+        if magic.startswith(GZIP_MAGIC):
+            stream = gzip.GzipFile(fileobj=raw, mode="rb")
+        elif magic.startswith(XZ_MAGIC):
+            stream = lzma.LZMAFile(raw, mode="rb")
+        elif magic.startswith(ZSTD_MAGIC):
+            stream = _zstd_reader(raw)
+        else:
+            return raw
+    except ParameterError:
+        raw.close()
+        raise
+    return _CaptureStream(stream, raw, bufsize)
+
+
+class _CaptureStream(BufferedReader):
+    """
+    Buffered decompressing stream which also closes the underlying file.
+    """
+
+    def __init__(self, stream, fileobj, bufsize: int):
+        """
+        Constructor.
+
+        :param object stream: decompressing stream
+        :param object fileobj: underlying compressed file
+        :param int bufsize: read buffer size in bytes
+        """
+
+        super().__init__(stream, buffer_size=bufsize)
+        self._fileobj = fileobj
+
+    def close(self):
+        """
+        Close decompressing stream and underlying file.
+        """
+
+        super().close()
+        self._fileobj.close()
+
+
+class UNIRecorder:
+    """
+    UNIRecorder class.
+    """
+
+    def __init__(self, output, bufsize: int = CAPTURE_BUFSIZE):
+        """
+        Constructor.
+
+        :param object output: capture file path, or writeable binary stream
+        :param int bufsize: write buffer size in bytes, if output is a path (1 MB)
+        """
+
+        if isinstance(output, str):
+            self._stream = open(  # pylint: disable=consider-using-with
+                output, "wb", buffering=bufsize
+            )
+            self._owner = True
+        else:
+            self._stream = output
+            self._owner = False
+        self._stream.write(CAPTURE_HDR)
+        self._count = 0
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def write(self, raw: bytes, timestamp: int | None = None):
+        """
+        Write single frame to capture.
+
+        :param bytes raw: raw frame
+        :param int | None timestamp: receive time in ns (None = now)
+        """
+
+        if timestamp is None:
+            timestamp = monotonic_ns()
+        self._stream.write(RECORD.pack(timestamp, len(raw)))
+        self._stream.write(raw)
+        self._count += 1
+
+    def record(self, reader, limit: int = 0) -> int:
+        """
+        Record frames from UNIReader until end of stream or limit reached.
+        Each frame is timestamped as soon as it is returned by the reader.
+
+        :param UNIReader reader: reader (typically with parsing=False)
+        :param int limit: maximum number of frames to record, 0 = unlimited (0)
+        :return: number of frames recorded
+        :rtype: int
+        """
+
+        count = 0
+        while limit == 0 or count < limit:
+            raw, _ = reader.read()
+            if raw is None:
+                break
+            self.write(raw, monotonic_ns())
+            count += 1
+        return count
+
+    def close(self):
+        """
+        Flush capture and close file, if opened by recorder.
+        """
+
+        self._stream.flush()
+        if self._owner:
+            self._stream.close()
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of frames recorded.
+
+        :return: frame count
+        :rtype: int
+        """
+
+        return self._count
+
+
+class UNIReplayer:
+    """
+    UNIReplayer class.
+    """
+
+    def __init__(self, capture, speed: float = 1.0, bufsize: int = CAPTURE_BUFSIZE):
+        """
+        Constructor.
+
+        :param object capture: capture file path, or readable binary stream
+        :param float speed: replay speed multiplier, 0 = as fast as possible (1.0)
+        :param int bufsize: read buffer size in bytes, if capture is a path (1 MB)
+        :raises: ParameterError if speed is invalid, UNIStreamError if
+            capture header is invalid
+        """
+
+        if speed < 0:
+            raise ParameterError(f"Invalid replay speed {speed} - must be >= 0")
+        if isinstance(capture, str):
+            self._stream = open(  # pylint: disable=consider-using-with
+                capture, "rb", buffering=bufsize
+            )
+            self._owner = True
+        else:
+            self._stream = capture
+            self._owner = False
+        hdr = self._stream.read(len(CAPTURE_HDR))
+        if hdr[0:6] != CAPTURE_MAGIC:
+            raise UNIStreamError(f"Invalid capture file header {hdr}")
+        if hdr[6] != CAPTURE_VERSION:
+            raise UNIStreamError(f"Unsupported capture file version {hdr[6]}")
+        self._speed = speed
+        self._start = None  # (first capture timestamp, replay start time)
+        self._buffer = bytearray()
+        self._eof = False
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def __iter__(self):
+        """
+        Iterator.
+        """
+
+        return self
+
+    def __next__(self) -> tuple:
+        """
+        Return next recorded frame, paced according to replay speed.
+
+        :return: tuple of (capture timestamp in ns, raw frame)
+        :rtype: tuple
+        :raises: StopIteration, UNIStreamError if capture is truncated
+        """
+
+        hdr = self._stream.read(RECORD.size)
+        if len(hdr) == 0:
+            raise StopIteration
+        if len(hdr) < RECORD.size:
+            raise UNIStreamError("Capture file truncated in record header")
+        timestamp, length = RECORD.unpack(hdr)
+        raw = self._stream.read(length)
+        if len(raw) < length:
+            raise UNIStreamError(
+                f"Capture file truncated. {length} bytes expected, {len(raw)} read."
+            )
+        self._pace(timestamp)
+        return timestamp, raw
+
+    def _pace(self, timestamp: int):
+        """
+        Wait until frame is due for replay.
+
+        :param int timestamp: capture timestamp in ns
+        """
+
+        if self._speed == 0:
+            return
+        if self._start is None:
+            self._start = (timestamp, monotonic_ns())
+            return
+        due = self._start[1] + (timestamp - self._start[0]) / self._speed
+        wait = due - monotonic_ns()
+        if wait > 0:
+            sleep(wait / 1e9)
+
+    def replay(self, output) -> int:
+        """
+        Replay all frames to stream consumer.
+
+        :param object output: writeable stream (e.g. Serial, socket wrapper,
+            file) or callable taking raw frame as its only argument
+        :return: number of frames replayed
+        :rtype: int
+        """
+
+        send = output if callable(output) else output.write
+        count = 0
+        for _, raw in self:
+            send(raw)
+            count += 1
+        return count
+
+    def read(self, size: int) -> bytes:
+        """
+        Read bytes from replayed stream, allowing UNIReplayer to be used
+        directly as a UNIReader datastream.
+
+        :param int size: number of bytes to read
+        :return: bytes (fewer than requested at end of capture)
+        :rtype: bytes
+        """
+
+        while len(self._buffer) < size and self._fill():
+            pass
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def readline(self) -> bytes:
+        """
+        Read bytes from replayed stream up to and including LF terminator.
+
+        :return: bytes
+        :rtype: bytes
+        """
+
+        while b"\x0a" not in self._buffer and self._fill():
+            pass
+        end = self._buffer.find(b"\x0a") + 1 or len(self._buffer)
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return data
+
+    def _fill(self) -> bool:
+        """
+        Append next replayed frame to read buffer.
+
+        :return: False if end of capture
+        :rtype: bool
+        """
+
+        if self._eof:
+            return False
+        try:
+            _, raw = next(self)
+        except StopIteration:
+            self._eof = True
+            return False
+        self._buffer += raw
+        return True
+
+    def close(self):
+        """
+        Close capture file, if opened by replayer.
+        """
+
+        if self._owner:
+            self._stream.close()
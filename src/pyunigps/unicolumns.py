@@ -0,0 +1,332 @@
+"""
+UNIColumnCache class.
+
+Persistent cache of parsed captures as columnar tables, so that repeated
+analysis of the same capture loads arrays from disk rather than
+re-parsing every message::
+
+    cache = UNIColumnCache("/var/cache/pyunigps")
+    tables = cache.open("capture.log")  # parses on first open only
+    psr = tables["OBSVM.group"]["psr"]
+
+The first open of a capture parses all UNI messages which have a payload
+definition and writes one table per message identity, with one column
+per attribute in payload definition order (header attributes first).
+Each repeating group is written as a child table named
+'<identity>.<group>', with a '_row' column holding the index of the
+parent row, so e.g. all observations in a capture form a single table.
+
+Tables are saved as numpy .npz archives (requires numpy), or as Feather
+or Parquet files (requires pyarrow), in a cache entry keyed on a hash of
+the capture file content, the library version and all payload
+definitions (see UNIPayloadRegistry.digest()), so a changed capture or
+definition is never served stale data. Bytes values (e.g. unparsed
+bitfields) are saved as fixed-width numpy void ('V') columns or Arrow
+binary columns.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=import-outside-toplevel, too-many-positional-arguments
+
+import hashlib
+import json
+import os
+import shutil
+
+from pyunigps.exceptions import ParameterError
+from pyunigps.unicapture import CAPTURE_BUFSIZE, open_capture
+from pyunigps.unireader import UNIReader
+from pyunigps.uniregistry import REGISTRY
+from pyunigps.unitypes_core import ERR_LOG, GET, UNI_PROTOCOL
+
+FORMATS = {"npz": ".npz", "feather": ".feather", "parquet": ".parquet"}
+"""Table file formats and extensions"""
+MANIFEST = "manifest.json"
+"""Cache entry manifest file name, written last"""
+ROW = "_row"
+"""Parent row index column of group tables"""
+
+
+def _numpy():
+    """
+    Import numpy on demand.
+
+    :return: numpy module
+    :rtype: module
+    :raises: ParameterError if numpy is not installed
+    """
+
+    try:
+        import numpy
+
+        return numpy
+    except ImportError as err:
+        raise ParameterError("'npz' format requires the 'numpy' package") from err
+
+
+def _pyarrow():
+    """
+    Import pyarrow on demand.
+
+    :return: pyarrow module
+    :rtype: module
+    :raises: ParameterError if pyarrow is not installed
+    """
+
+    try:
+        import pyarrow
+
+        return pyarrow
+    except ImportError as err:
+        raise ParameterError(
+            "'feather' and 'parquet' formats require the 'pyarrow' package"
+        ) from err
+
+
+def to_columns(messages: object, parsebitfield: bool = True) -> dict:
+    """
+    Convert parsed UNI messages to columnar tables.
+
+    Messages of the same identity with a different payload layout from
+    the first (i.e. a firmware-specific layout selected by the header
+    version) are added to a separate table named '<identity>.v<version>'.
+
+    :param object messages: iterable of parsed UNIMessage objects
+    :param bool parsebitfield: messages were parsed with bitfields (True)
+    :return: dict of table name: dict of column name: list of values
+    :rtype: dict
+    """
+
+    tables = {}
+    schemas = {}
+    for msg in messages:
+        vals = msg.to_dict()
+        name = vals.pop("identity")
+        schema = REGISTRY.schema(GET, name, msg.version, parsebitfield)
+        if schemas.setdefault(name, schema) != schema:
+            name = f"{name}.v{msg.version}"
+        _add_row(tables, name, vals, None)
+    return tables
+
+
+def _add_row(tables: dict, name: str, vals: dict, parent: int | None):
+    """
+    Add record and its repeating groups to tables.
+
+    :param dict tables: tables
+    :param str name: table name
+    :param dict vals: record values, groups as lists of dicts
+    :param int | None parent: parent row index, None for message table
+    """
+
+    table = tables.get(name)
+    if table is None:
+        table = tables[name] = {} if parent is None else {ROW: []}
+        for key, val in vals.items():
+            if not isinstance(val, list):
+                table[key] = []
+    row = len(next(iter(table.values())))
+    if parent is not None:
+        table[ROW].append(parent)
+    for key, val in vals.items():
+        if isinstance(val, list):
+            for rec in val:
+                _add_row(tables, f"{name}.{key}", rec, row)
+        else:
+            table[key].append(val)
+
+
+class UNIColumnCache:
+    """
+    UNIColumnCache class.
+    """
+
+    def __init__(
+        self,
+        cachedir: str,
+        fmt: str = "npz",
+        parsebitfield: bool = True,
+        quitonerror: int = ERR_LOG,
+        errorhandler: object = None,
+    ):
+        """
+        Constructor.
+
+        :param str cachedir: cache directory (created if necessary)
+        :param str fmt: table format - "npz", "feather" or "parquet" ("npz")
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param object errorhandler: error handling object or function (None)
+        :raises: ParameterError if format is invalid or its package is not installed
+        """
+
+        if fmt not in FORMATS:
+            raise ParameterError(
+                f"Invalid format {fmt} - must be one of {tuple(FORMATS)}"
+            )
+        if fmt == "npz":
+            _numpy()
+        else:
+            _pyarrow()
+        self._cachedir = cachedir
+        self._fmt = fmt
+        self._parsebf = parsebitfield
+        self._quitonerror = quitonerror
+        self._errorhandler = errorhandler
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cachedir, exist_ok=True)
+
+    def key(self, filename: str) -> str:
+        """
+        Get cache key for capture file.
+
+        :param str filename: capture file path
+        :return: hexadecimal key
+        :rtype: str
+        """
+
+        hsh = hashlib.blake2b(digest_size=20)
+        hsh.update(f"{REGISTRY.digest()}:{self._fmt}:{int(self._parsebf)}:".encode())
+        with open(filename, "rb") as stream:
+            while block := stream.read(CAPTURE_BUFSIZE):
+                hsh.update(block)
+        return hsh.hexdigest()
+
+    def open(self, filename: str) -> dict:
+        """
+        Get tables for capture file, from cache if available, otherwise
+        by parsing the capture and saving its tables to the cache.
+
+        :param str filename: capture file path (plain or compressed)
+        :return: dict of table name: table, where each table is a dict of
+            column name: numpy array ("npz") or a pyarrow.Table
+        :rtype: dict
+        """
+
+        entry = os.path.join(self._cachedir, self.key(filename))
+        if os.path.exists(os.path.join(entry, MANIFEST)):
+            self.hits += 1
+            return self._load(entry)
+        self.misses += 1
+        with open_capture(filename) as stream:
+            reader = UNIReader(
+                stream,
+                protfilter=UNI_PROTOCOL,
+                quitonerror=self._quitonerror,
+                errorhandler=self._errorhandler,
+                parsebitfield=self._parsebf,
+                framefilter=_defined,
+            )
+            tables = to_columns((parsed for _, parsed in reader), self._parsebf)
+        self._save(entry, tables, os.path.basename(filename))
+        return self._load(entry)
+
+    def _save(self, entry: str, tables: dict, source: str):
+        """
+        Save tables to new cache entry.
+
+        :param str entry: cache entry directory
+        :param dict tables: dict of table name: dict of column name: list of values
+        :param str source: capture file name
+        """
+
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        ext = FORMATS[self._fmt]
+        manifest = {"format": self._fmt, "source": source, "tables": {}}
+        for name, cols in tables.items():
+            path = os.path.join(tmp, name + ext)
+            if self._fmt == "npz":
+                np = _numpy()
+                with open(path, "wb") as outfile:
+                    np.savez(outfile, **{k: _array(np, v) for k, v in cols.items()})
+            else:
+                pa = _pyarrow()
+                table = pa.table({k: pa.array(v) for k, v in cols.items()})
+                if self._fmt == "feather":
+                    import pyarrow.feather
+
+                    pyarrow.feather.write_feather(table, path)
+                else:
+                    import pyarrow.parquet
+
+                    pyarrow.parquet.write_table(table, path)
+            manifest["tables"][name] = len(next(iter(cols.values())))
+        with open(os.path.join(tmp, MANIFEST), "w", encoding="utf-8") as outfile:
+            json.dump(manifest, outfile)
+        try:
+            os.replace(tmp, entry)  # atomic for concurrent builders
+        except OSError:  # entry already built by another process
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _load(self, entry: str) -> dict:
+        """
+        Load tables from cache entry.
+
+        :param str entry: cache entry directory
+        :return: dict of table name: table
+        :rtype: dict
+        """
+
+        with open(os.path.join(entry, MANIFEST), encoding="utf-8") as infile:
+            manifest = json.load(infile)
+        ext = FORMATS[manifest["format"]]
+        tables = {}
+        for name in manifest["tables"]:
+            path = os.path.join(entry, name + ext)
+            if manifest["format"] == "npz":
+                with _numpy().load(path, allow_pickle=False) as npz:
+                    tables[name] = {col: npz[col] for col in npz.files}
+            elif manifest["format"] == "feather":
+                import pyarrow.feather
+
+                tables[name] = pyarrow.feather.read_table(path, memory_map=True)
+            else:
+                import pyarrow.parquet
+
+                tables[name] = pyarrow.parquet.read_table(path, memory_map=True)
+        return tables
+
+    def clear(self):
+        """
+        Remove all cache entries.
+        """
+
+        for name in os.listdir(self._cachedir):
+            path = os.path.join(self._cachedir, name)
+            if os.path.exists(os.path.join(path, MANIFEST)) or name.endswith(".tmp"):
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def _defined(raw: bytes) -> bool:
+    """
+    Frame filter for UNI messages with a payload definition.
+
+    :param bytes raw: raw UNI frame
+    :return: True if msgid is defined
+    :rtype: bool
+    """
+
+    return REGISTRY.defined(raw[4] | (raw[5] << 8))
+
+
+def _array(np: object, vals: list) -> object:
+    """
+    Convert column to numpy array, bytes as fixed-width void type.
+
+    :param module np: numpy
+    :param list vals: column values
+    :return: array
+    :rtype: numpy.ndarray
+    """
+
+    if vals and isinstance(vals[0], (bytes, bytearray)):
+        return np.array(vals, dtype=f"V{max(1, max(map(len, vals)))}")
+    return np.array(vals)
@@ -0,0 +1,695 @@
+"""
+UNICorrectionStore class.
+
+Streaming in-memory state store for Galileo HAS (E6MASKBLOCK,
+E6ORBITBLOCK, E6CLOCKFULLBLOCK, E6CLOCKSUBBLOCK, E6CBIASBLOCK,
+E6PBIASBLOCK) and BDS PPP-B2b (PPPB2BINFO1-4) corrections.
+
+Each message is applied as an incremental update to the satellites it
+covers. Orbit, clock and bias corrections are held in dicts keyed on
+(constellation, PRN), so lookups by satellite are constant time however
+many messages have been received. HAS masks are keyed on mask ID and
+PPP-B2b masks on IODP; blocks which reference a mask not yet received are
+counted as 'unresolved' and discarded. A message is decoded in full
+before any of its corrections are applied, so a truncated message leaves
+the store unchanged.
+
+The payloads are decoded as the bit streams defined in the respective
+signal-in-space ICDs:
+
+- E6*BLOCK: 32-bit HAS MT1 header (TOH, flags, mask ID, IOD set ID)
+  followed by the block
+- PPPB2BINFOn: PPP-B2b message data starting with the 6-bit message type
+
+Fixed layouts are declared as bit-packed block definitions (see
+BITS_MSB in the payload definition language) and decoded from compiled
+shift/mask tables. The number and layout of HAS per-satellite records
+depend on a previously received mask, so are read satellite by satellite.
+
+PPPB2BINFO5-7 (URA and combined clock/orbit messages) are not applied -
+they are counted as 'unsupported'.
+
+Usage::
+
+    ssr = UNICorrectionStore()
+    for _, parsed in UNIReader(stream):
+        ssr.update(parsed)
+        ...
+    corr = ssr.satellite("GAL", 11)
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+from pyunigps.exceptions import UNIMessageError
+from pyunigps.unihelpers import compile_bitblock
+from pyunigps.unitypes_core import (
+    S11,
+    S12,
+    S13,
+    S15,
+    SCALROUND,
+    U1,
+    U2,
+    U3,
+    U4,
+    U5,
+    U6,
+    U8,
+    U9,
+    U10,
+    U12,
+    U16,
+    U17,
+    U37,
+    U40,
+    U63,
+)
+
+HAS_GNSS = {0: "GPS", 2: "GAL"}
+"""HAS GNSS ID"""
+HAS_VALIDITY = (5, 10, 15, 20, 30, 60, 90, 120, 180, 240, 300, 600, 900, 1800, 3600, 0)
+"""HAS validity interval (s) by index"""
+HAS_BLOCKS = {
+    "E6MASKBLOCK": "mask",
+    "E6ORBITBLOCK": "orbit",
+    "E6CLOCKFULLBLOCK": "clockfull",
+    "E6CLOCKSUBBLOCK": "clocksub",
+    "E6CBIASBLOCK": "cbias",
+    "E6PBIASBLOCK": "pbias",
+}
+"""HAS block type by message identity"""
+B2B_MESSAGES = (
+    "PPPB2BINFO1",
+    "PPPB2BINFO2",
+    "PPPB2BINFO3",
+    "PPPB2BINFO4",
+    "PPPB2BINFO5",
+    "PPPB2BINFO6",
+    "PPPB2BINFO7",
+)
+"""PPP-B2b message identities"""
+B2B_SLOTS = (("BDS", 0, 63), ("GPS", 63, 37), ("GAL", 100, 37), ("GLONASS", 137, 37))
+"""PPP-B2b satellite slot ranges as (constellation, offset, number)"""
+B2B_CLOCK_SATS = 23
+"""Satellites per PPP-B2b clock correction message"""
+
+# bit-packed block definitions (MSB first)
+HAS_HEADER = {"toh": U12, "flags": U6, "reserved": U4, "maskid": U5, "iodset": U5}
+"""HAS MT1 header"""
+HAS_SYSMASK = {"gnssid": U4, "satmask": U40, "sigmask": U16, "cmaf": U1}
+"""HAS mask block system entry, followed by optional cell mask and nav message"""
+HAS_ORBIT_SAT = {
+    "GPS": {"gnssiod": U8, "radial": S13, "along": S12, "cross": S12},
+    "GAL": {"gnssiod": U10, "radial": S13, "along": S12, "cross": S12},
+}
+"""HAS orbit correction per satellite, by GNSS (IOD width differs)"""
+HAS_CLOCK_SAT = {"c0": S13}
+"""HAS clock correction per satellite"""
+HAS_CLOCKSUB_SYS = {"gnssid": U4, "multiplier": U2}
+"""HAS clock subset system entry, followed by satellite submask"""
+HAS_CBIAS_SIG = {"bias": S11}
+"""HAS code bias per signal"""
+HAS_PBIAS_SIG = {"bias": S11, "discontinuity": U2}
+"""HAS phase bias per signal"""
+B2B_HEADER = {"mestype": U6, "epoch": U17, "reserved": U4, "iodssr": U2}
+"""PPP-B2b message header"""
+B2B_BODY = {
+    1: {"iodp": U4, "BDS": U63, "GPS": U37, "GAL": U37, "GLONASS": U37},
+    2: {
+        "group": (
+            6,
+            {
+                "slot": U9,
+                "iodn": U10,
+                "iodcorr": U3,
+                "radial": [S15, 0.0016],
+                "along": [S13, 0.0064],
+                "cross": [S13, 0.0064],
+                "uraclass": U3,
+                "uraval": U3,
+            },
+        )
+    },
+    3: {
+        "numsat": U5,
+        "group": (
+            "numsat",
+            {
+                "slot": U9,
+                "numsig": U4,
+                "signals": ("numsig", {"signal": U4, "bias": [S12, 0.017]}),
+            },
+        ),
+    },
+    4: {
+        "iodp": U4,
+        "subtype": U5,
+        "group": (B2B_CLOCK_SATS, {"iodcorr": U3, "c0": S15}),
+    },
+}
+"""PPP-B2b message body by message type"""
+
+
+class _BitStream:
+    """
+    Most significant bit first bit stream reader.
+    """
+
+    def __init__(self, data: bytes):
+        """
+        Constructor.
+
+        :param bytes data: data
+        """
+
+        self._val = int.from_bytes(data, "big")
+        self._len = len(data) * 8
+        self.pos = 0
+
+    def u(self, bits: int) -> int:
+        """
+        Read unsigned integer.
+
+        :param int bits: width in bits
+        :return: value
+        :rtype: int
+        :raises: UNIMessageError if data is exhausted
+        """
+
+        if self.pos + bits > self._len:
+            raise UNIMessageError("Correction message truncated")
+        self.pos += bits
+        return (self._val >> (self._len - self.pos)) & ((1 << bits) - 1)
+
+    def unpack(self, bdict: dict) -> dict:
+        """
+        Read bit-packed block.
+
+        :param dict bdict: bit-packed block definition
+        :return: dict of attribute values, repeating groups as lists of dicts
+        :rtype: dict
+        :raises: UNIMessageError if data is exhausted
+        """
+
+        return self._unpack(compile_bitblock(bdict)[0])
+
+    def _unpack(self, table: tuple) -> dict:
+        """
+        Recursively read compiled bit-packed block table.
+
+        :param tuple table: compiled block table
+        :return: dict of attribute values
+        :rtype: dict
+        """
+
+        vals = {}
+        for entry in table:
+            if entry[0] == "run":
+                _, fields, bits = entry
+                run = self.u(bits)
+                for anam, rel, width, mask, sign, scale in fields:
+                    val = (run >> (bits - rel - width)) & mask
+                    if val & sign:
+                        val -= sign << 1
+                    if scale != 1:
+                        val = round(val * scale, SCALROUND)
+                    vals[anam] = val
+            else:
+                _, numr, sub, anam = entry
+                num = numr if isinstance(numr, int) else vals[numr]
+                vals[anam] = [self._unpack(sub) for _ in range(num)]
+        return vals
+
+
+def b2b_slot(slot: int) -> tuple:
+    """
+    Convert PPP-B2b satellite slot number to (constellation, PRN).
+
+    :param int slot: slot number 1-174
+    :return: tuple of (constellation, PRN), or None if invalid
+    :rtype: tuple
+    """
+
+    for gnss, offset, num in B2B_SLOTS:
+        if offset < slot <= offset + num:
+            return gnss, slot - offset
+    return None
+
+
+def _clock(c0: int, res: float, tag: dict) -> dict:
+    """
+    Get clock correction, or None if flagged as unavailable.
+
+    :param int c0: raw clock correction
+    :param float res: scaled resolution (m)
+    :param dict tag: common correction attributes
+    :return: dict of correction attributes, or None
+    :rtype: dict
+    """
+
+    if c0 in (-4096, 4095, -16384):  # not available or do not use
+        return None
+    return {**tag, "c0": round(c0 * res, 6)}
+
+
+class UNICorrectionStore:
+    """
+    UNICorrectionStore class.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self._hasmasks = {}  # maskid: list of (gnss, prns, signals, cells)
+        self._b2bmasks = {}  # iodp: list of (gnss, prn)
+        self._orbit = {}  # (gnss, prn): dict
+        self._clock = {}  # (gnss, prn): dict
+        self._cbias = {}  # (gnss, prn): {signal: bias}
+        self._pbias = {}  # (gnss, prn): {signal: (bias, discontinuity)}
+        self.updates = 0
+        self.unresolved = 0
+        self.unsupported = 0
+
+    def update(self, msg: object) -> bool:
+        """
+        Apply parsed HAS or PPP-B2b message. Other messages are ignored.
+
+        :param UNIMessage msg: parsed message
+        :return: True if store was updated
+        :rtype: bool
+        :raises: UNIMessageError if payload is truncated
+        """
+
+        identity = getattr(msg, "identity", None)
+        if identity is None or msg.payload is None:
+            return False
+        if identity in HAS_BLOCKS:
+            return self.apply_has(HAS_BLOCKS[identity], msg.payload)
+        if identity in B2B_MESSAGES:
+            return self.apply_b2b(msg.payload)
+        return False
+
+    def load(self, reader: object) -> int:
+        """
+        Update store from all messages output by UNIReader
+        (or other iterable of (raw, parsed) tuples).
+
+        :param UNIReader reader: reader
+        :return: number of updates
+        :rtype: int
+        """
+
+        count = 0
+        for _, parsed in reader:
+            count += self.update(parsed)
+        return count
+
+    def _commit(self, changes: list):
+        """
+        Apply decoded corrections to store.
+
+        :param list changes: list of (store, key, value), value None = remove
+        """
+
+        for store, key, val in changes:
+            if val is None:
+                store.pop(key, None)
+            else:
+                store[key] = val
+        self.updates += 1
+
+    def apply_has(self, block: str, data: bytes) -> bool:
+        """
+        Apply HAS block.
+
+        :param str block: block type - "mask", "orbit", "clockfull",
+            "clocksub", "cbias" or "pbias"
+        :param bytes data: MT1 header and block
+        :return: True if store was updated
+        :rtype: bool
+        :raises: UNIMessageError if data is truncated
+        """
+
+        bits = _BitStream(data)
+        hdr = bits.unpack(HAS_HEADER)
+        if block == "mask":
+            self._commit([(self._hasmasks, hdr["maskid"], self._has_mask(bits))])
+            return True
+        mask = self._hasmasks.get(hdr["maskid"])
+        if mask is None:
+            self.unresolved += 1
+            return False
+        tag = {
+            "source": "HAS",
+            "iod": hdr["iodset"],
+            "toh": hdr["toh"],
+            "validity": HAS_VALIDITY[bits.u(4)],
+        }
+        self._commit(getattr(self, f"_has_{block}")(bits, mask, tag))
+        return True
+
+    @staticmethod
+    def _has_mask(bits: _BitStream) -> list:
+        """
+        Decode HAS mask block.
+
+        :param _BitStream bits: bit stream
+        :return: list of (gnss, prns, signals, cells) per system
+        :rtype: list
+        """
+
+        systems = []
+        for _ in range(bits.u(4)):
+            sysm = bits.unpack(HAS_SYSMASK)
+            prns = [i + 1 for i in range(40) if sysm["satmask"] >> (39 - i) & 1]
+            sigs = [i for i in range(16) if sysm["sigmask"] >> (15 - i) & 1]
+            cells = None
+            if sysm["cmaf"]:  # cell mask available
+                cells = [[bits.u(1) for _ in sigs] for _ in prns]
+            bits.u(3)  # nav message
+            gnss = HAS_GNSS.get(sysm["gnssid"], "UNKNOWN")
+            systems.append((gnss, prns, sigs, cells))
+        return systems
+
+    def _has_orbit(self, bits: _BitStream, mask: list, tag: dict) -> list:
+        """
+        Decode HAS orbit corrections block.
+
+        :param _BitStream bits: bit stream
+        :param list mask: HAS mask
+        :param dict tag: common correction attributes
+        :return: list of changes
+        :rtype: list
+        """
+
+        changes = []
+        for gnss, prns, _, _ in mask:
+            bdef = HAS_ORBIT_SAT.get(gnss, HAS_ORBIT_SAT["GAL"])
+            for prn in prns:
+                orb = bits.unpack(bdef)
+                radial, along, cross = orb["radial"], orb["along"], orb["cross"]
+                if radial == -4096 or along == -2048 or cross == -2048:
+                    val = None  # not available
+                else:
+                    val = {
+                        **tag,
+                        "gnssiod": orb["gnssiod"],
+                        "radial": radial * 0.0025,
+                        "along": along * 0.008,
+                        "cross": cross * 0.008,
+                    }
+                changes.append((self._orbit, (gnss, prn), val))
+        return changes
+
+    def _has_clockfull(self, bits: _BitStream, mask: list, tag: dict) -> list:
+        """
+        Decode HAS clock full-set corrections block.
+
+        :param _BitStream bits: bit stream
+        :param list mask: HAS mask
+        :param dict tag: common correction attributes
+        :return: list of changes
+        :rtype: list
+        """
+
+        mults = [bits.u(2) + 1 for _ in mask]
+        return [
+            (
+                self._clock,
+                (gnss, prn),
+                _clock(bits.unpack(HAS_CLOCK_SAT)["c0"], 0.0025 * mult, tag),
+            )
+            for (gnss, prns, _, _), mult in zip(mask, mults)
+            for prn in prns
+        ]
+
+    def _has_clocksub(self, bits: _BitStream, mask: list, tag: dict) -> list:
+        """
+        Decode HAS clock subset corrections block.
+
+        :param _BitStream bits: bit stream
+        :param list mask: HAS mask
+        :param dict tag: common correction attributes
+        :return: list of changes
+        :rtype: list
+        """
+
+        systems = {gnss: prns for gnss, prns, _, _ in mask}
+        changes = []
+        for _ in range(bits.u(4)):
+            sysc = bits.unpack(HAS_CLOCKSUB_SYS)
+            gnss = HAS_GNSS.get(sysc["gnssid"], "UNKNOWN")
+            res = 0.0025 * (sysc["multiplier"] + 1)
+            submask = [prn for prn in systems.get(gnss, []) if bits.u(1)]
+            for prn in submask:
+                changes.append(
+                    (
+                        self._clock,
+                        (gnss, prn),
+                        _clock(bits.unpack(HAS_CLOCK_SAT)["c0"], res, tag),
+                    )
+                )
+        return changes
+
+    def _has_bias(self, bits: _BitStream, mask: list, tag: dict, phase: bool) -> list:
+        """
+        Decode HAS code or phase biases block.
+
+        :param _BitStream bits: bit stream
+        :param list mask: HAS mask
+        :param dict tag: common correction attributes
+        :param bool phase: phase (True) or code (False) biases
+        :return: list of changes
+        :rtype: list
+        """
+
+        store = self._pbias if phase else self._cbias
+        bdef = HAS_PBIAS_SIG if phase else HAS_CBIAS_SIG
+        changes = []
+        for gnss, prns, sigs, cells in mask:
+            for i, prn in enumerate(prns):
+                biases = {}
+                for j, sig in enumerate(sigs):
+                    if cells is not None and not cells[i][j]:
+                        continue
+                    vals = bits.unpack(bdef)
+                    if vals["bias"] == -1024:  # not available
+                        continue
+                    if phase:
+                        biases[sig] = (
+                            round(vals["bias"] * 0.01, 6),
+                            vals["discontinuity"],
+                        )
+                    else:
+                        biases[sig] = round(vals["bias"] * 0.02, 6)
+                changes.append((store, (gnss, prn), {**tag, "biases": biases}))
+        return changes
+
+    def _has_cbias(self, bits: _BitStream, mask: list, tag: dict) -> list:
+        """
+        Decode HAS code biases block.
+
+        :param _BitStream bits: bit stream
+        :param list mask: HAS mask
+        :param dict tag: common correction attributes
+        :return: list of changes
+        :rtype: list
+        """
+
+        return self._has_bias(bits, mask, tag, False)
+
+    def _has_pbias(self, bits: _BitStream, mask: list, tag: dict) -> list:
+        """
+        Decode HAS phase biases block.
+
+        :param _BitStream bits: bit stream
+        :param list mask: HAS mask
+        :param dict tag: common correction attributes
+        :return: list of changes
+        :rtype: list
+        """
+
+        return self._has_bias(bits, mask, tag, True)
+
+    def apply_b2b(self, data: bytes) -> bool:
+        """
+        Apply PPP-B2b message. Message types 5-7 are not applied, and are
+        counted as 'unsupported'.
+
+        :param bytes data: message data starting with 6-bit message type
+        :return: True if store was updated
+        :rtype: bool
+        :raises: UNIMessageError if data is truncated
+        """
+
+        bits = _BitStream(data)
+        hdr = bits.unpack(B2B_HEADER)
+        mestype = hdr["mestype"]
+        if mestype not in B2B_BODY:
+            self.unsupported += 1
+            return False
+        body = bits.unpack(B2B_BODY[mestype])
+        tag = {"source": "B2B", "epoch": hdr["epoch"], "iodssr": hdr["iodssr"]}
+
+        if mestype == 1:  # satellite mask
+            sats = []
+            for gnss, _, num in B2B_SLOTS:
+                satmask = body[gnss]
+                sats += [
+                    (gnss, i + 1) for i in range(num) if satmask >> (num - 1 - i) & 1
+                ]
+            changes = [(self._b2bmasks, body["iodp"], sats)]
+        elif mestype == 2:  # orbit corrections
+            changes = [
+                (
+                    self._orbit,
+                    key,
+                    {
+                        **tag,
+                        "iod": sat["iodcorr"],
+                        "gnssiod": sat["iodn"],
+                        "radial": sat["radial"],
+                        "along": sat["along"],
+                        "cross": sat["cross"],
+                        "ura": (sat["uraclass"], sat["uraval"]),
+                    },
+                )
+                for sat in body["group"]
+                if (key := b2b_slot(sat["slot"])) is not None
+            ]
+        elif mestype == 3:  # code biases
+            changes = [
+                (
+                    self._cbias,
+                    key,
+                    {
+                        **tag,
+                        "biases": {
+                            sig["signal"]: sig["bias"] for sig in sat["signals"]
+                        },
+                    },
+                )
+                for sat in body["group"]
+                if (key := b2b_slot(sat["slot"])) is not None
+            ]
+        else:  # clock corrections
+            sats = self._b2bmasks.get(body["iodp"])
+            if sats is None:
+                self.unresolved += 1
+                return False
+            first = body["subtype"] * B2B_CLOCK_SATS
+            changes = [
+                (
+                    self._clock,
+                    key,
+                    _clock(sat["c0"], 0.0016, {**tag, "iod": sat["iodcorr"]}),
+                )
+                for key, sat in zip(sats[first : first + B2B_CLOCK_SATS], body["group"])
+            ]
+        self._commit(changes)
+        return True
+
+    def orbit(self, gnss: str, prn: int) -> dict:
+        """
+        Get orbit correction for satellite.
+
+        :param str gnss: constellation e.g. "GAL"
+        :param int prn: PRN
+        :return: dict of correction attributes, or None
+        :rtype: dict
+        """
+
+        return self._orbit.get((gnss, prn))
+
+    def clock(self, gnss: str, prn: int) -> dict:
+        """
+        Get clock correction for satellite.
+
+        :param str gnss: constellation e.g. "GAL"
+        :param int prn: PRN
+        :return: dict of correction attributes, or None
+        :rtype: dict
+        """
+
+        return self._clock.get((gnss, prn))
+
+    def code_biases(self, gnss: str, prn: int) -> dict:
+        """
+        Get code biases for satellite.
+
+        :param str gnss: constellation e.g. "GAL"
+        :param int prn: PRN
+        :return: dict of correction attributes, or None
+        :rtype: dict
+        """
+
+        return self._cbias.get((gnss, prn))
+
+    def phase_biases(self, gnss: str, prn: int) -> dict:
+        """
+        Get phase biases for satellite.
+
+        :param str gnss: constellation e.g. "GAL"
+        :param int prn: PRN
+        :return: dict of correction attributes, or None
+        :rtype: dict
+        """
+
+        return self._pbias.get((gnss, prn))
+
+    def satellite(self, gnss: str, prn: int) -> dict:
+        """
+        Get all corrections for satellite. The clock correction is only
+        included if it has the same IOD as the orbit correction.
+
+        :param str gnss: constellation e.g. "GAL"
+        :param int prn: PRN
+        :return: dict of orbit, clock, cbias and pbias corrections
+        :rtype: dict
+        """
+
+        key = (gnss, prn)
+        orbit = self._orbit.get(key)
+        clock = self._clock.get(key)
+        if orbit is None or clock is None or clock["iod"] != orbit["iod"]:
+            clock = None
+        return {
+            "orbit": orbit,
+            "clock": clock,
+            "cbias": self._cbias.get(key),
+            "pbias": self._pbias.get(key),
+        }
+
+    def satellites(self) -> list:
+        """
+        Get list of satellites with orbit corrections.
+
+        :return: list of (gnss, prn) tuples
+        :rtype: list
+        """
+
+        return list(self._orbit)
+
+    def clear(self):
+        """
+        Clear store.
+        """
+
+        for store in (
+            self._hasmasks,
+            self._b2bmasks,
+            self._orbit,
+            self._clock,
+            self._cbias,
+            self._pbias,
+        ):
+            store.clear()
+        self.updates = 0
+        self.unresolved = 0
+        self.unsupported = 0
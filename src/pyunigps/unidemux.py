@@ -0,0 +1,363 @@
+"""
+UNIDemux class and unidemux command line utility.
+
+Splits a mixed UNI, NMEA and RTCM3 capture into one output file per
+protocol (e.g. 'uni.log', 'nmea.log', 'rtcm3.log') or per message
+identity (e.g. 'uni_OBSVM.log', 'nmea_GNGGA.log', 'rtcm3_1077.log')::
+
+    with UNIDemux("split", split="msgid", validate=VALCKSUM) as demux:
+        demux.run(open_capture("capture.log"))
+    for filename, (frames, nbytes) in demux.stats.items():
+        ...
+
+Input is framed in large blocks by UNIParser without parsing, and each
+output file is written through its own large buffered writer, so the
+split runs at close to disk speed. Frames are copied to their output
+byte for byte, optionally after validating their checksum (CRC32 for UNI,
+XOR for NMEA, CRC24Q for RTCM3). Message identities which are not safe
+to use in a filename (e.g. a corrupt NMEA address field) are written to
+an 'unknown' file for the protocol, e.g. 'nmea_unknown.log'.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments, too-many-arguments
+
+import os
+import re
+import sys
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from functools import reduce
+from logging import getLogger
+from operator import xor
+
+from pyunigps._version import __version__ as VERSION
+from pyunigps.exceptions import ParameterError, UNIParseError
+from pyunigps.unicapture import open_capture
+from pyunigps.unihelpers import frame_id, isvalid_checksum
+from pyunigps.uniparser import UNIParser
+from pyunigps.unitypes_core import (
+    ERR_LOG,
+    ERR_RAISE,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    UNI_MSGIDS,
+    UNI_PROTOCOL,
+    VALCKSUM,
+    VALNONE,
+)
+
+SPLITS = ("protocol", "msgid")
+"""Output split modes"""
+PROTOCOL_NAMES = {UNI_PROTOCOL: "uni", NMEA_PROTOCOL: "nmea", RTCM3_PROTOCOL: "rtcm3"}
+"""Output file name stem for each protocol"""
+READSIZE = 1 << 20
+"""Input block size in bytes"""
+WRITESIZE = 1 << 20
+"""Output buffer size in bytes per output file"""
+SAFE_ID = re.compile(r"[A-Za-z0-9_-]+")
+"""Message identities which can be used in output filenames"""
+UNKNOWN_ID = "unknown"
+"""Output filename identity for message identities which are not safe"""
+
+
+def _valid_nmea(raw: bytes) -> bool:
+    """
+    Validate NMEA checksum.
+
+    :param bytes raw: raw NMEA sentence
+    :return: True if valid
+    :rtype: bool
+    """
+
+    star = raw.rfind(b"*")
+    if star < 0:
+        return False
+    try:
+        return reduce(xor, raw[1:star], 0) == int(raw[star + 1 : star + 3], 16)
+    except ValueError:
+        return False
+
+
+def _valid_rtcm3(raw: bytes) -> bool:
+    """
+    Validate RTCM3 CRC24Q checksum (using pyrtcm library).
+
+    :param bytes raw: raw RTCM3 message
+    :return: True if valid
+    :rtype: bool
+    """
+
+    from pyrtcm import calc_crc24q  # pylint: disable=import-outside-toplevel
+
+    return calc_crc24q(raw) == 0
+
+
+VALIDATORS = {
+    UNI_PROTOCOL: isvalid_checksum,
+    NMEA_PROTOCOL: _valid_nmea,
+    RTCM3_PROTOCOL: _valid_rtcm3,
+}
+"""Checksum validator for each protocol"""
+
+
+class UNIDemux:
+    """
+    UNIDemux class.
+    """
+
+    def __init__(
+        self,
+        outdir: str,
+        split: str = "protocol",
+        prefix: str = "",
+        protfilter: int = NMEA_PROTOCOL | UNI_PROTOCOL | RTCM3_PROTOCOL,
+        validate: int = VALNONE,
+        quitonerror: int = ERR_LOG,
+        errorhandler: object = None,
+        bufsize: int = WRITESIZE,
+    ):
+        """
+        Constructor.
+
+        :param str outdir: output directory (created if necessary)
+        :param str split: "protocol" = one file per protocol,
+            "msgid" = one file per message identity ("protocol")
+        :param str prefix: output file name prefix ("")
+        :param int protfilter: NMEA_PROTOCOL (1), UNI_PROTOCOL (2),
+            RTCM3_PROTOCOL (4), can be OR'd (7)
+        :param int validate: VALCKSUM (1) = discard frames with invalid
+            checksum, VALNONE (0) = copy all frames (0)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param object errorhandler: error handling object or function (None)
+        :param int bufsize: output buffer size in bytes per file (1048576)
+        :raises: ParameterError if split is invalid
+        """
+
+        if split not in SPLITS:
+            raise ParameterError(f"Invalid split {split} - must be one of {SPLITS}")
+        self._outdir = outdir
+        self._bymsgid = split == "msgid"
+        self._prefix = prefix
+        self._validate = validate
+        self._quitonerror = quitonerror
+        self._errorhandler = errorhandler
+        self._bufsize = bufsize
+        self._logger = getLogger(__name__)
+        self._parser = UNIParser(
+            protfilter=protfilter,
+            parsing=False,
+            quitonerror=quitonerror,
+            errorhandler=errorhandler,
+        )
+        self._outputs = {}  # output key: [stream, filename, frames, bytes]
+        self._files = {}  # filename: [stream, filename, frames, bytes]
+        self._pending = []
+        self.rejected = 0
+        os.makedirs(outdir, exist_ok=True)
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def feed(self, data: bytes) -> int:
+        """
+        Demultiplex next chunk of data. An incomplete frame at the end of
+        the chunk is retained until the rest of it is fed. If an error is
+        raised, the remaining frames are written by the next feed().
+
+        :param bytes data: next chunk of data
+        :return: number of frames written
+        :rtype: int
+        :raises: UNIParseError (if quitonerror = ERR_RAISE and data is invalid)
+        """
+
+        outputs = self._outputs
+        validate = self._validate & VALCKSUM
+        frames = self._pending + self._parser.feed(data)
+        self._pending = []
+        count = 0
+        for i, (raw, _) in enumerate(frames):
+            protocol, msgid = frame_id(raw)
+            if validate and not VALIDATORS[protocol](raw):
+                self.rejected += 1
+                self._pending = frames[i + 1 :]  # resume here if error is raised
+                self._handle(
+                    UNIParseError(
+                        f"{PROTOCOL_NAMES[protocol]} {msgid} message checksum invalid"
+                    )
+                )
+                self._pending = []
+                continue
+            key = (protocol, msgid) if self._bymsgid else protocol
+            out = outputs.get(key)
+            if out is None:
+                out = outputs[key] = self._open(protocol, msgid)
+            out[0].write(raw)
+            out[2] += 1
+            out[3] += len(raw)
+            count += 1
+        return count
+
+    def run(self, stream: object, readsize: int = READSIZE) -> dict:
+        """
+        Demultiplex binary stream until EOF.
+
+        :param object stream: binary input stream e.g. from open_capture()
+        :param int readsize: input block size in bytes (1048576)
+        :return: output statistics (see stats)
+        :rtype: dict
+        """
+
+        read = getattr(stream, "read1", stream.read)
+        while block := read(readsize):
+            self.feed(block)
+        return self.stats
+
+    def _open(self, protocol: int, msgid: object) -> list:
+        """
+        Open output file for new protocol or message identity.
+
+        :param int protocol: protocol
+        :param object msgid: message identifier
+        :return: list of [stream, filename, frames, bytes], shared by all
+            message identifiers written to the same file
+        :rtype: list
+        """
+
+        name = PROTOCOL_NAMES[protocol]
+        if self._bymsgid:
+            if protocol == UNI_PROTOCOL:
+                msgid = str(UNI_MSGIDS.get(msgid, msgid))
+            if not SAFE_ID.fullmatch(msgid):  # e.g. corrupt NMEA address field
+                msgid = UNKNOWN_ID
+            name = f"{name}_{msgid}"
+        filename = os.path.join(self._outdir, f"{self._prefix}{name}.log")
+        out = self._files.get(filename)
+        if out is None:
+            # pylint: disable=consider-using-with
+            out = [open(filename, "wb", buffering=self._bufsize), filename, 0, 0]
+            self._files[filename] = out
+        return out
+
+    def _handle(self, err: Exception):
+        """
+        Handle error.
+
+        :param Exception err: error
+        :raises: Exception if quitonerror = ERR_RAISE (2)
+        """
+
+        if self._quitonerror == ERR_RAISE:
+            raise err
+        if self._quitonerror == ERR_LOG:
+            if self._errorhandler is None:
+                self._logger.error(err)
+            else:
+                self._errorhandler(err)
+
+    def close(self):
+        """
+        Flush and close all output files.
+        """
+
+        for out in self._files.values():
+            out[0].close()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for output statistics.
+
+        :return: dict of output filename: (frames, bytes) written
+        :rtype: dict
+        """
+
+        return {out[1]: (out[2], out[3]) for out in self._files.values()}
+
+
+def main(argv: list | None = None) -> int:
+    """
+    unidemux command line entry point.
+
+    :param list | None argv: command line arguments (None = sys.argv)
+    :return: exit code
+    :rtype: int
+    """
+
+    arp = ArgumentParser(
+        prog="unidemux",
+        description="Split UNI, NMEA and RTCM3 data into per-protocol or per-message files.",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    arp.add_argument("-V", "--version", action="version", version=VERSION)
+    arp.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help='input files (plain or compressed), "-" for stdin',
+    )
+    arp.add_argument("-d", "--outdir", default=".", help="output directory")
+    arp.add_argument("-s", "--split", default="protocol", choices=SPLITS)
+    arp.add_argument("--prefix", default="", help="output file name prefix")
+    arp.add_argument(
+        "-p",
+        "--protfilter",
+        type=int,
+        default=NMEA_PROTOCOL | UNI_PROTOCOL | RTCM3_PROTOCOL,
+        help="1 = NMEA, 2 = UNI, 4 = RTCM3, can be OR'd",
+    )
+    arp.add_argument(
+        "--validate",
+        type=int,
+        default=VALNONE,
+        choices=(0, 1),
+        help="1 = discard frames with invalid checksum",
+    )
+    arp.add_argument(
+        "--quitonerror",
+        type=int,
+        default=ERR_LOG,
+        choices=(0, 1, 2),
+        help="0 = ignore, 1 = log, 2 = raise",
+    )
+    args = arp.parse_args(argv)
+
+    with UNIDemux(
+        args.outdir,
+        split=args.split,
+        prefix=args.prefix,
+        protfilter=args.protfilter,
+        validate=args.validate,
+        quitonerror=args.quitonerror,
+    ) as demux:
+        for inp in args.inputs:
+            if inp == "-":
+                demux.run(sys.stdin.buffer)
+            else:
+                with open_capture(inp) as stream:
+                    demux.run(stream)
+    for filename, (frames, nbytes) in sorted(demux.stats.items()):
+        print(f"{filename}: {frames} frames, {nbytes} bytes")
+    if demux.rejected:
+        print(f"{demux.rejected} frames rejected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,517 @@
+"""
+unidump command line utility.
+
+Reads UNI, NMEA and RTCM3 data from files, a TCP socket or stdin and
+writes the selected messages to stdout or a file as raw binary, text,
+JSON Lines (NDJSON) or CSV::
+
+    unidump capture.log --format json --msgfilter OBSVM,GPSEPH > obs.ndjson
+    unidump tcp://localhost:50007 --protfilter 2 --format text
+    cat capture.log | unidump --format raw --msgfilter 12 > obsvm.log
+
+Input is framed in large blocks by UNIParser without parsing, and the
+protocol and message filters are applied to the raw frame headers, so
+only the selected messages are ever parsed. Raw output needs no parsing
+at all. Message filters are matched as for UNISocketServer subscriptions,
+so NMEA identities may be given with or without talker (e.g. 'GGA').
+
+CSV output is labelled by a header row, written before the first row
+of each distinct set of columns (i.e. for each message identity and
+number of group repeats). Repeating group columns are indexed, e.g.
+'prn_01'. For file input, '--workers N' parses and formats batches of
+frames in N processes, output being written in input order.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments, too-many-arguments
+
+import csv
+import io
+import os
+import socket
+import sys
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from functools import partial
+from logging import getLogger
+from multiprocessing import Pool
+
+from pyunigps._version import __version__ as VERSION
+from pyunigps.exceptions import ParameterError
+from pyunigps.uniexport import JSON_ENCODER, json_default, message_dict
+from pyunigps.unihelpers import frame_id, match_msgfilter, parse_msgfilter
+from pyunigps.uniparser import UNIParser
+from pyunigps.unireader import UNI_ERRORS, UNIReader, nmea_backend, rtcm_backend
+from pyunigps.unitypes_core import (
+    ERR_LOG,
+    ERR_RAISE,
+    GET,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    UNI_PROTOCOL,
+    VALCKSUM,
+)
+
+FORMATS = ("raw", "text", "json", "csv")
+"""Output formats"""
+READSIZE = 1 << 20
+"""Input block size in bytes"""
+BATCHSIZE = 2000
+"""Number of frames per worker batch"""
+
+_backends = {}  # lazily loaded NMEA and RTCM3 parsers, per process
+
+
+def parse_frame(
+    raw: bytes, msgmode: int = GET, validate: int = VALCKSUM, parsebitfield=True
+) -> object:
+    """
+    Parse raw UNI, NMEA or RTCM3 frame.
+
+    :param bytes raw: raw frame
+    :param int msgmode: message mode (GET)
+    :param int validate: VALCKSUM (1) = validate checksum, VALNONE (0) = ignore (1)
+    :param bool parsebitfield: parse bitfields (True)
+    :return: parsed message
+    :rtype: object
+    """
+
+    if raw[0] == 0xAA:
+        return UNIReader.parse(
+            raw, msgmode=msgmode, validate=validate, parsebitfield=parsebitfield
+        )
+    if raw[0] == 0x24:
+        if "nmea" not in _backends:
+            _backends["nmea"] = nmea_backend()
+        return _backends["nmea"][0].parse(raw, validate=validate, msgmode=msgmode)
+    if "rtcm" not in _backends:
+        _backends["rtcm"] = rtcm_backend()
+    return _backends["rtcm"][0].parse(raw, validate=validate, labelmsm=1)
+
+
+def _errors() -> tuple:
+    """
+    Get parsing errors of all loaded backends.
+
+    :return: tuple of exception classes
+    :rtype: tuple
+    """
+
+    errors = UNI_ERRORS
+    for _, errs in _backends.values():
+        errors += errs
+    return errors
+
+
+def _csv_value(val: object) -> object:
+    """
+    Format CSV value.
+
+    :param object val: value
+    :return: formatted value
+    :rtype: object
+    """
+
+    if isinstance(val, (int, float, str)):
+        return val
+    return json_default(val)
+
+
+def _parse_frames(
+    frames: list, msgmode: int, validate: int, parsebitfield: bool, quitonerror: int
+):
+    """
+    Parse batch of raw frames, omitting any which fail to parse.
+
+    :param list frames: raw frames
+    :param int msgmode: message mode
+    :param int validate: VALCKSUM (1) = validate checksum, VALNONE (0) = ignore
+    :param bool parsebitfield: parse bitfields
+    :param int quitonerror: ERR_IGNORE (0), ERR_LOG (1), ERR_RAISE (2)
+    :return: generator of parsed messages
+    :raises: Exception if quitonerror = ERR_RAISE and frame is invalid
+    """
+
+    for raw in frames:
+        try:
+            yield parse_frame(raw, msgmode, validate, parsebitfield)
+        except _errors() as err:
+            if quitonerror == ERR_RAISE:
+                raise
+            if quitonerror == ERR_LOG:
+                getLogger(__name__).error(err)
+
+
+def format_frames(
+    frames: list,
+    fmt: str = "text",
+    msgmode: int = GET,
+    validate: int = VALCKSUM,
+    parsebitfield: bool = True,
+    quitonerror: int = ERR_LOG,
+    headers: set | None = None,
+) -> str:
+    """
+    Parse and format batch of raw frames as text, JSON Lines or CSV.
+    Messages which fail to parse are omitted.
+
+    :param list frames: raw frames
+    :param str fmt: output format - "text", "json" or "csv" ("text")
+    :param int msgmode: message mode (GET)
+    :param int validate: VALCKSUM (1) = validate checksum, VALNONE (0) = ignore (1)
+    :param bool parsebitfield: parse bitfields (True)
+    :param int quitonerror: ERR_IGNORE (0), ERR_LOG (1), ERR_RAISE (2) (1)
+    :param set | None headers: CSV headers already written, to which any
+        new headers are added (None = none written)
+    :return: formatted output
+    :rtype: str
+    :raises: Exception if quitonerror = ERR_RAISE and frame is invalid
+    """
+
+    if fmt == "csv":
+        rows = csv_rows(frames, msgmode, validate, parsebitfield, quitonerror)
+        return csv_output(rows, set() if headers is None else headers)
+    out = io.StringIO()
+    for parsed in _parse_frames(frames, msgmode, validate, parsebitfield, quitonerror):
+        if fmt == "text":
+            out.write(f"{parsed}\n")
+        else:
+            out.write(JSON_ENCODER.encode(message_dict(parsed)) + "\n")
+    return out.getvalue()
+
+
+def csv_rows(
+    frames: list,
+    msgmode: int = GET,
+    validate: int = VALCKSUM,
+    parsebitfield: bool = True,
+    quitonerror: int = ERR_LOG,
+) -> list:
+    """
+    Parse batch of raw frames and format as CSV rows, each with its
+    header. Messages which fail to parse are omitted.
+
+    :param list frames: raw frames
+    :param int msgmode: message mode (GET)
+    :param int validate: VALCKSUM (1) = validate checksum, VALNONE (0) = ignore (1)
+    :param bool parsebitfield: parse bitfields (True)
+    :param int quitonerror: ERR_IGNORE (0), ERR_LOG (1), ERR_RAISE (2) (1)
+    :return: list of (header as tuple of column names, row as CSV line)
+    :rtype: list
+    :raises: Exception if quitonerror = ERR_RAISE and frame is invalid
+    """
+
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    rows = []
+    for parsed in _parse_frames(frames, msgmode, validate, parsebitfield, quitonerror):
+        names, vals = zip(*_flatten(message_dict(parsed)))
+        writer.writerow(_csv_value(val) for val in vals)
+        rows.append((names, out.getvalue()))
+        out.seek(0)
+        out.truncate()
+    return rows
+
+
+def csv_output(rows: list, headers: set) -> str:
+    """
+    Join CSV rows, preceding each row whose header has not already been
+    written by its header.
+
+    :param list rows: list of (header, row) as returned by csv_rows()
+    :param set headers: headers already written, to which any new headers are added
+    :return: CSV output
+    :rtype: str
+    """
+
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    for names, row in rows:
+        if names not in headers:
+            headers.add(names)
+            writer.writerow(names)
+        out.write(row)
+    return out.getvalue()
+
+
+def _flatten(vals: dict, suffix: str = ""):
+    """
+    Flatten (nested) message values in order, indexing the names of
+    attributes in repeating groups e.g. 'prn_01'.
+
+    :param dict vals: message values
+    :param str suffix: group index suffix ("")
+    :return: generator of (name, value) tuples
+    """
+
+    for key, val in vals.items():
+        if isinstance(val, dict):
+            yield from _flatten(val, suffix)
+        elif isinstance(val, list):
+            for i, item in enumerate(val, 1):
+                idx = f"{suffix}_{i:02d}"
+                if isinstance(item, dict):
+                    yield from _flatten(item, idx)
+                else:
+                    yield f"{key}{idx}", item
+        else:
+            yield f"{key}{suffix}", val
+
+
+class UNIDumper:
+    """
+    UNIDumper class.
+    """
+
+    def __init__(
+        self,
+        inputs: list,
+        output: object,
+        fmt: str = "text",
+        protfilter: int = NMEA_PROTOCOL | UNI_PROTOCOL | RTCM3_PROTOCOL,
+        msgfilter: object = None,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        parsebitfield: bool = True,
+        quitonerror: int = ERR_LOG,
+        workers: int = 1,
+        limit: int = 0,
+    ):
+        """
+        Constructor.
+
+        :param list inputs: input file paths, "-" for stdin or "tcp://host:port"
+        :param object output: binary output stream
+        :param str fmt: output format - "raw", "text", "json" or "csv" ("text")
+        :param int protfilter: NMEA_PROTOCOL (1), UNI_PROTOCOL (2),
+            RTCM3_PROTOCOL (4), can be OR'd (7)
+        :param object msgfilter: iterable of message identities, UNI msgids or
+            RTCM3 message types to output e.g. ("OBSVM", "106", "GNGGA", "GLL",
+            "1077"), None = all (None)
+        :param int msgmode: message mode (GET)
+        :param int validate: VALCKSUM (1) = validate checksum, VALNONE (0) = ignore (1)
+        :param bool parsebitfield: parse bitfields (True)
+        :param int quitonerror: ERR_IGNORE (0), ERR_LOG (1), ERR_RAISE (2) (1)
+        :param int workers: number of parsing processes, file input only (1)
+        :param int limit: maximum number of messages to output, 0 = all (0)
+        :raises: ParameterError if arguments are invalid
+        """
+
+        if fmt not in FORMATS:
+            raise ParameterError(f"Invalid format {fmt} - must be one of {FORMATS}")
+        if workers > 1 and any(inp == "-" or "://" in inp for inp in inputs):
+            raise ParameterError("Multiple workers are only supported for file input")
+        self._inputs = inputs
+        self._output = output
+        self._fmt = fmt
+        self._protfilter = protfilter
+        self._msgfilter = None if not msgfilter else parse_msgfilter(msgfilter)
+        opts = {
+            "msgmode": msgmode,
+            "validate": validate,
+            "parsebitfield": parsebitfield,
+            "quitonerror": quitonerror,
+        }
+        # CSV rows are joined with their headers in this process, in order
+        if fmt == "csv":
+            self._format = partial(csv_rows, **opts)
+        else:
+            self._format = partial(format_frames, fmt=fmt, **opts)
+        self._quitonerror = quitonerror
+        self._workers = workers
+        self._limit = limit
+        self._headers = set()  # CSV headers written
+        self.count = 0
+
+    def run(self) -> int:
+        """
+        Read all inputs and write selected messages to output.
+
+        :return: number of messages output
+        :rtype: int
+        """
+
+        if self._workers > 1 and self._fmt != "raw":
+            with Pool(self._workers) as pool:
+                for out in pool.imap(self._format, self._batches()):
+                    self._write(out)
+        else:
+            for frames in self._frames():
+                if self._fmt == "raw":
+                    self._output.write(b"".join(frames))
+                else:
+                    self._write(self._format(frames))
+                self._output.flush()
+        return self.count
+
+    def _write(self, out: object):
+        """
+        Write formatted batch to output.
+
+        :param object out: formatted output, or list of CSV rows
+        """
+
+        if self._fmt == "csv":
+            out = csv_output(out, self._headers)
+        self._output.write(out.encode("utf-8"))
+
+    def _batches(self):
+        """
+        Generator of batches of selected raw frames for worker processes.
+
+        :return: generator of lists of raw frames
+        """
+
+        batch = []
+        for frames in self._frames():
+            batch += frames
+            if len(batch) >= BATCHSIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _frames(self):
+        """
+        Generator of selected raw frames from each block of input.
+
+        :return: generator of lists of raw frames
+        """
+
+        msgfilter = self._msgfilter
+        for inp in self._inputs:
+            parser = UNIParser(
+                protfilter=self._protfilter,
+                parsing=False,
+                quitonerror=self._quitonerror,
+            )
+            for block in self._blocks(inp):
+                frames = [raw for raw, _ in parser.feed(block)]
+                if msgfilter is not None:
+                    frames = [
+                        f for f in frames if match_msgfilter(*frame_id(f), msgfilter)
+                    ]
+                if self._limit:
+                    frames = frames[: self._limit - self.count]
+                self.count += len(frames)
+                if frames:
+                    yield frames
+                if self._limit and self.count >= self._limit:
+                    return
+
+    @staticmethod
+    def _blocks(inp: str):
+        """
+        Generator of blocks of data from input.
+
+        :param str inp: file path, "-" for stdin or "tcp://host:port"
+        :return: generator of bytes
+        """
+
+        if inp.startswith("tcp://"):
+            host, port = inp[6:].rsplit(":", 1)
+            with socket.create_connection((host.strip("[]"), int(port))) as sock:
+                while block := sock.recv(READSIZE):
+                    yield block
+        elif inp == "-":
+            stream = sys.stdin.buffer
+            read = getattr(stream, "read1", stream.read)
+            while block := read(READSIZE):
+                yield block
+        else:
+            with open(inp, "rb") as stream:
+                while block := stream.read(READSIZE):
+                    yield block
+
+
+def main(argv: list | None = None) -> int:
+    """
+    unidump command line entry point.
+
+    :param list | None argv: command line arguments (None = sys.argv)
+    :return: exit code
+    :rtype: int
+    """
+
+    arp = ArgumentParser(
+        prog="unidump",
+        description="Filter and convert UNI, NMEA and RTCM3 data.",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    arp.add_argument("-V", "--version", action="version", version=VERSION)
+    arp.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help='input files, "-" for stdin or tcp://host:port',
+    )
+    arp.add_argument("-o", "--output", default="-", help='output file, "-" for stdout')
+    arp.add_argument("-f", "--format", default="text", choices=FORMATS)
+    arp.add_argument(
+        "-p",
+        "--protfilter",
+        type=int,
+        default=NMEA_PROTOCOL | UNI_PROTOCOL | RTCM3_PROTOCOL,
+        help="1 = NMEA, 2 = UNI, 4 = RTCM3, can be OR'd",
+    )
+    arp.add_argument(
+        "-m",
+        "--msgfilter",
+        default="",
+        help="comma separated message identities or UNI msgids e.g. OBSVM,106,GNGGA,1077",
+    )
+    arp.add_argument("--msgmode", type=int, default=GET, choices=(0, 1, 2))
+    arp.add_argument("--validate", type=int, default=VALCKSUM, choices=(0, 1))
+    arp.add_argument("--parsebitfield", type=int, default=1, choices=(0, 1))
+    arp.add_argument(
+        "--quitonerror",
+        type=int,
+        default=ERR_LOG,
+        choices=(0, 1, 2),
+        help="0 = ignore, 1 = log, 2 = raise",
+    )
+    arp.add_argument(
+        "-w", "--workers", type=int, default=1, help="parsing processes (files only)"
+    )
+    arp.add_argument(
+        "-l", "--limit", type=int, default=0, help="maximum messages, 0 = all"
+    )
+    args = arp.parse_args(argv)
+
+    if args.output == "-":
+        output = sys.stdout.buffer
+    else:
+        output = open(args.output, "wb")  # pylint: disable=consider-using-with
+    try:
+        UNIDumper(
+            args.inputs,
+            output,
+            fmt=args.format,
+            protfilter=args.protfilter,
+            msgfilter=[m for m in args.msgfilter.split(",") if m],
+            msgmode=args.msgmode,
+            validate=args.validate,
+            parsebitfield=bool(args.parsebitfield),
+            quitonerror=args.quitonerror,
+            workers=args.workers,
+            limit=args.limit,
+        ).run()
+    except ParameterError as err:
+        arp.error(str(err))
+    except BrokenPipeError:  # e.g. output piped to head
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+UNIEphemerisStore class.
+
+Indexed in-memory store of decoded GPSEPH, QZSSEPH, BD3EPH, BDSEPH,
+GLOEPH, GALEPH and IRNSSEPH messages.
+
+Ephemeris sets are indexed by (constellation, PRN) and, within each
+satellite, by reference epoch (toe) and issue of data (IODE). Each
+satellite holds at most 'maxsets' sets, so a lookup of the valid
+ephemeris at a given time is a dict lookup plus a scan of a few entries,
+irrespective of how many messages have been received. Sets are evicted
+when they are superseded by a new upload with the same toe, when their
+validity window ends before that of the newest set, or when 'maxsets' is
+exceeded.
+
+Epochs are held internally as seconds of GPS time. BDS week/toe values
+are converted from BDT.
+
+Usage::
+
+    eph = UNIEphemerisStore()
+    for _, parsed in UNIReader(stream):
+        eph.update(parsed)
+        ...
+    msg = eph.get("GPS", 5, wno, tow)
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+from pyunigps.exceptions import ParameterError
+
+WEEK_SECS = 604800
+"""Seconds in GNSS week"""
+BDS_WEEK_OFFSET = 1356
+"""BDT week 0 as GPS week"""
+BDS_SECS_OFFSET = 14
+"""GPST - BDT in seconds"""
+
+EPH_GNSS = {
+    "GPSEPH": "GPS",
+    "QZSSEPH": "QZSS",
+    "BD3EPH": "BDS",
+    "BDSEPH": "BDS",
+    "GLOEPH": "GLONASS",
+    "GALEPH": "GAL",
+    "IRNSSEPH": "IRNSS",
+}
+"""Constellation for each ephemeris message identity"""
+
+EPH_VALIDITY = {
+    "GPS": 7200,
+    "QZSS": 7200,
+    "BDS": 3600,
+    "GLONASS": 1800,
+    "GAL": 14400,
+    "IRNSS": 7200,
+}
+"""Default validity either side of toe, in seconds, by constellation"""
+
+
+def eph_epoch(gnss: str, msg: object) -> tuple:
+    """
+    Get PRN, issue of data and reference epoch (in GPS seconds)
+    of ephemeris message.
+
+    :param str gnss: constellation e.g. "GPS"
+    :param UNIMessage msg: parsed ephemeris message
+    :return: tuple of (prn, iode, epoch)
+    :rtype: tuple
+    """
+
+    if gnss == "GLONASS":
+        return msg.slot, msg.issue, msg.eweek * WEEK_SECS + msg.etime / 1000
+    epoch = msg.week * WEEK_SECS + msg.toe
+    if gnss == "BDS":
+        epoch += BDS_WEEK_OFFSET * WEEK_SECS + BDS_SECS_OFFSET
+    return msg.prn, msg.iode1, epoch
+
+
+class UNIEphemerisStore:
+    """
+    UNIEphemerisStore class.
+    """
+
+    def __init__(self, maxsets: int = 3, validity: dict | None = None):
+        """
+        Constructor.
+
+        :param int maxsets: maximum ephemeris sets held per satellite (3)
+        :param dict | None validity: validity in seconds either side of toe,
+            by constellation, overriding EPH_VALIDITY (None)
+        :raises: ParameterError if maxsets < 1
+        """
+
+        if maxsets < 1:
+            raise ParameterError(f"Invalid maxsets {maxsets} - must be >= 1")
+        self._maxsets = maxsets
+        self._validity = {**EPH_VALIDITY, **(validity or {})}
+        # (gnss, prn): list of (epoch, iode, message) sorted by epoch
+        self._sets = {}
+        self.updates = 0
+
+    def update(self, msg: object) -> bool:
+        """
+        Add parsed ephemeris message to store. Messages other than
+        ephemerides and repeats of sets already held are ignored.
+
+        :param UNIMessage msg: parsed message
+        :return: True if store was updated
+        :rtype: bool
+        """
+
+        gnss = EPH_GNSS.get(getattr(msg, "identity", None))
+        if gnss is None or msg.payload is None:
+            return False
+        prn, iode, epoch = eph_epoch(gnss, msg)
+        sets = self._sets.setdefault((gnss, prn), [])
+        for i, (ep, iod, _) in enumerate(sets):
+            if ep == epoch:
+                if iod == iode:
+                    return False  # repeat of set already held
+                sets[i] = (epoch, iode, msg)  # superseded by new upload
+                break
+        else:
+            sets.append((epoch, iode, msg))
+            sets.sort(key=lambda s: s[0])
+            valid = self._validity[gnss]
+            start = sets[-1][0] - valid  # start of newest validity window
+            while len(sets) > self._maxsets or sets[0][0] + valid < start:
+                sets.pop(0)
+        self.updates += 1
+        return True
+
+    def load(self, reader: object) -> int:
+        """
+        Update store from all messages output by UNIReader
+        (or other iterable of (raw, parsed) tuples).
+
+        :param UNIReader reader: reader
+        :return: number of updates
+        :rtype: int
+        """
+
+        count = 0
+        for _, parsed in reader:
+            count += self.update(parsed)
+        return count
+
+    def get(
+        self, gnss: str, prn: int, wno: int | None = None, tow: float = 0
+    ) -> object:
+        """
+        Get ephemeris for satellite valid at given GPS time, i.e. the set
+        with the nearest toe within its validity window. If wno is None,
+        the most recent set is returned.
+
+        :param str gnss: constellation e.g. "GPS"
+        :param int prn: PRN (slot for GLONASS)
+        :param int | None wno: GPS week number (None)
+        :param float tow: GPS time of week in seconds (0)
+        :return: ephemeris message, or None if no valid set is held
+        :rtype: UNIMessage
+        """
+
+        sets = self._sets.get((gnss, prn))
+        if not sets:
+            return None
+        if wno is None:
+            return sets[-1][2]
+        tim = wno * WEEK_SECS + tow
+        valid = self._validity[gnss]
+        best = None
+        bestdiff = valid
+        for epoch, _, msg in sets:
+            diff = abs(tim - epoch)
+            if diff <= bestdiff:
+                best, bestdiff = msg, diff
+        return best
+
+    def prune(self, wno: int, tow: float = 0) -> int:
+        """
+        Evict all sets whose validity window ended before given GPS time.
+
+        :param int wno: GPS week number
+        :param float tow: GPS time of week in seconds (0)
+        :return: number of sets evicted
+        :rtype: int
+        """
+
+        tim = wno * WEEK_SECS + tow
+        count = 0
+        for (gnss, prn), sets in list(self._sets.items()):
+            valid = self._validity[gnss]
+            keep = [s for s in sets if s[0] + valid >= tim]
+            count += len(sets) - len(keep)
+            if keep:
+                self._sets[(gnss, prn)] = keep
+            else:
+                del self._sets[(gnss, prn)]
+        return count
+
+    def satellites(self, gnss: str | None = None) -> list:
+        """
+        Get list of satellites for which ephemerides are held.
+
+        :param str | None gnss: constellation, None = all (None)
+        :return: list of (gnss, prn) tuples
+        :rtype: list
+        """
+
+        return [key for key in self._sets if gnss is None or key[0] == gnss]
+
+    def clear(self):
+        """
+        Clear store.
+        """
+
+        self._sets = {}
+        self.updates = 0
+
+    def __len__(self) -> int:
+        """
+        Number of ephemeris sets held.
+
+        :return: number of sets
+        :rtype: int
+        """
+
+        return sum(len(sets) for sets in self._sets.values())
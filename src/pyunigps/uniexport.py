@@ -0,0 +1,95 @@
+"""
+Structured export of parsed messages.
+
+UNIMessage.to_dict() and as_tuple() return message attributes in payload
+definition order, with repeating groups as lists rather than '_NN'
+suffixed attributes. This module adds a compact JSON encoder and a JSON
+Lines (NDJSON) writer which emits one message per line, e.g. for
+forwarding to a message bus::
+
+    writer = UNIJSONWriter(outfile)
+    for _, parsed in UNIReader(stream):
+        writer.write(parsed)
+
+Bytes values (e.g. unparsed bitfields or unknown payloads) are encoded as
+hexadecimal strings, and dates and times as ISO 8601 strings. NMEA and
+RTCM3 messages, which have no to_dict() method, are exported as their
+identity plus public attributes.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import json
+from datetime import date, time
+from io import TextIOBase
+
+
+def json_default(obj: object) -> object:
+    """
+    Encode values not natively supported by JSON.
+
+    :param object obj: value
+    :return: JSON-compatible value
+    :rtype: object
+    :raises: TypeError if value cannot be encoded
+    """
+
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).hex()
+    if isinstance(obj, (date, time)):  # e.g. NMEA date and time fields
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+JSON_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), default=json_default, check_circular=False
+)
+"""Compact JSON encoder"""
+
+
+def message_dict(msg: object) -> dict:
+    """
+    Get parsed message as dict.
+
+    :param object msg: parsed UNI, NMEA or RTCM3 message
+    :return: dict of message attributes
+    :rtype: dict
+    """
+
+    if hasattr(msg, "to_dict"):
+        return msg.to_dict()
+    vals = {"identity": msg.identity}
+    vals.update((key, val) for key, val in vars(msg).items() if key[0] != "_")
+    return vals
+
+
+class UNIJSONWriter:
+    """
+    UNIJSONWriter class.
+    """
+
+    def __init__(self, stream: object):
+        """
+        Constructor.
+
+        :param object stream: output stream, text or binary
+        """
+
+        self._stream = stream
+        self._text = isinstance(stream, TextIOBase)
+        self.count = 0
+
+    def write(self, msg: object):
+        """
+        Write message as single line of JSON.
+
+        :param object msg: parsed UNI, NMEA or RTCM3 message
+        """
+
+        line = JSON_ENCODER.encode(message_dict(msg)) + "\n"
+        self._stream.write(line if self._text else line.encode("utf-8"))
+        self.count += 1
@@ -0,0 +1,295 @@
+"""
+UNI raw frame filters.
+
+Frame filters are callables which take a complete raw UNI frame and
+return True if the frame should be passed on or False if it should be
+discarded. They can be used as a UNIReader 'framefilter', in which case
+discarded frames are never parsed, or as a standalone pipeline stage.
+
+UNIChangeFilter suppresses frames whose payload (ignoring the timeinfo
+header) is unchanged since the last frame with the same msgid, subject
+to an optional heartbeat interval.
+
+UNIFieldFilter passes only frames whose payload fields satisfy given
+conditions, evaluated directly on the raw frame at offsets precompiled
+from the payload definition, so non-matching frames are never decoded.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import operator
+import struct
+
+from pyunigps.exceptions import ParameterError, UNITypeError
+from pyunigps.uniregistry import (
+    REGISTRY,
+    field_lookup,
+    field_positions,
+    field_value,
+)
+from pyunigps.unitypes_core import GET, UNI_MSGIDS
+
+CHANGE_DEFAULT_IDS = (
+    "VERSION",
+    "BASEINFO",
+    "BASEPOS",
+    "GPSION",
+    "BD3ION",
+    "BDSION",
+    "GALION",
+    "GPSUTC",
+    "BD3UTC",
+    "BDSUTC",
+    "GALUTC",
+    "GPSEPH",
+    "QZSSEPH",
+    "BD3EPH",
+    "BDSEPH",
+    "GLOEPH",
+    "GALEPH",
+    "IRNSSEPH",
+    "TROPINFO",
+    "HWSTATUS",
+)
+"""Slowly varying messages filtered by default"""
+WEEK_MS = 604800000
+"""Milliseconds in GNSS week"""
+FIELD_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda val, vals: val in vals,
+    "&": lambda val, mask: bool(val & mask),
+}
+"""Field filter comparison operators"""
+
+
+def _msgid_set(msgids: tuple | None) -> set | None:
+    """
+    Convert tuple of msgids (as int or name) to set of integer msgids.
+
+    :param tuple | None msgids: msgids as int or name
+    :return: set of msgids, or None for all
+    :rtype: set | None
+    :raises: ParameterError if name is not a recognised msgid
+    """
+
+    if msgids is None:
+        return None
+    names = {val: key for key, val in UNI_MSGIDS.items()}
+    try:
+        return {mid if isinstance(mid, int) else names[mid] for mid in msgids}
+    except KeyError as err:
+        raise ParameterError(f"Unknown msgid {err}") from err
+
+
+class UNIChangeFilter:
+    """
+    UNIChangeFilter class.
+    """
+
+    def __init__(self, msgids: tuple | None = CHANGE_DEFAULT_IDS, heartbeat: float = 0):
+        """
+        Constructor.
+
+        :param tuple | None msgids: msgids (as int or name) subject to
+            change-only filtering, None = all (CHANGE_DEFAULT_IDS)
+        :param float heartbeat: pass an unchanged frame if at least this
+            many seconds (GNSS header time) have elapsed since the last frame
+            passed for the msgid, 0 = never (0)
+        :raises: ParameterError if heartbeat is negative or msgid is unknown
+        """
+
+        if heartbeat < 0:
+            raise ParameterError(f"Invalid heartbeat {heartbeat} - must be >= 0")
+        self._msgids = _msgid_set(msgids)
+        self._heartbeat = int(heartbeat * 1000)
+        self._last = {}  # msgid: (payload, header time in ms)
+        self.passed = 0
+        self.suppressed = 0
+
+    def __call__(self, raw: bytes) -> bool:
+        """
+        Check if frame has changed since last frame with same msgid.
+
+        :param bytes raw: complete raw UNI frame
+        :return: True to pass frame, False to suppress
+        :rtype: bool
+        """
+
+        msgid = raw[4] | (raw[5] << 8)
+        if self._msgids is not None and msgid not in self._msgids:
+            self.passed += 1
+            return True
+        payload = raw[24:-4]
+        # GNSS time from timeinfo header (wno, tow) in ms
+        now = int.from_bytes(raw[10:12], "little") * WEEK_MS + int.from_bytes(
+            raw[12:16], "little"
+        )
+        last = self._last.get(msgid)
+        if (
+            last is not None
+            and last[0] == payload
+            and (self._heartbeat == 0 or 0 <= now - last[1] < self._heartbeat)
+        ):
+            self.suppressed += 1
+            return False
+        self._last[msgid] = (bytes(payload), now)
+        self.passed += 1
+        return True
+
+    def reset(self):
+        """
+        Forget all previously seen payloads.
+        """
+
+        self._last = {}
+
+
+class UNIFieldFilter:
+    """
+    UNIFieldFilter class.
+    """
+
+    def __init__(self, conditions: dict, passthrough: bool = False):
+        """
+        Constructor.
+
+        Conditions are given per msgid as a list of (attribute, operator, value)
+        tuples, all of which must be satisfied for the frame to pass. Operators
+        are '==', '!=', '<', '<=', '>', '>=', 'in' (value is a container) and
+        '&' (any bit of value set). e.g.::
+
+            {"OBSVM": [("prn", "==", 12), ("cn0", ">=", 40)],
+             "GPSEPH": [("health", "==", 0)]}
+
+        An unindexed attribute name in a repeating group (e.g. 'prn') matches if
+        any repeat satisfies the condition; an indexed name (e.g. 'prn_03')
+        matches that repeat only. Conditions are evaluated on the raw value,
+        scaled if the attribute is scaled. Strings are compared without
+        null padding.
+
+        Only attributes at a fixed offset, or in a (non-nested) repeating group
+        of fixed size, can be filtered on. Messages with no payload definition
+        (e.g. BESTNAV, SATSINFO) cannot be filtered on. If a frame's header
+        version selects a layout in which a filtered attribute is not at a
+        fixed offset, the frame is rejected and counted in 'incompatible'.
+
+        :param dict conditions: dict of msgid (as int or name): list of conditions
+        :param bool passthrough: pass UNI frames with msgids not in conditions,
+            otherwise discard them (False)
+        :raises: ParameterError if msgid, attribute or operator is invalid
+        """
+
+        self._conditions = {}
+        for msgid, conds in conditions.items():
+            (mid,) = _msgid_set((msgid,))
+            for cond in conds:
+                if len(cond) != 3 or cond[1] not in FIELD_OPS:
+                    raise ParameterError(f"Invalid condition {cond}")
+            self._conditions[mid] = tuple(conds)
+        self._passthrough = passthrough
+        self._compiled = {}  # (msgid, version): compiled conditions
+        for mid in self._conditions:
+            self._compile(mid, 0)  # validate attribute names
+        self.passed = 0
+        self.rejected = 0
+        self.incompatible = 0
+
+    def _compile(self, msgid: int, version: int) -> tuple:
+        """
+        Compile conditions for msgid and header version into tuples of
+        (offset, reader, scale, shift, mask, group, index, operator, value).
+
+        :param int msgid: msgid
+        :param int version: header version
+        :return: compiled conditions
+        :rtype: tuple
+        :raises: ParameterError if attribute cannot be filtered on
+        """
+
+        identity = UNI_MSGIDS[msgid]
+        try:
+            if not REGISTRY.table(GET, identity, version):
+                raise KeyError(identity)
+            fields = REGISTRY.layout(GET, identity, version)
+        except (KeyError, UNITypeError) as err:
+            raise ParameterError(f"No payload definition for {identity}") from err
+        compiled = []
+        for anam, opr, value in self._conditions[msgid]:
+            _, loc, index = field_lookup(fields, anam)
+            if loc is None:
+                raise ParameterError(
+                    f"Attribute {anam} not found at fixed offset in {identity}"
+                )
+            compiled.append(loc + (index, FIELD_OPS[opr], value))
+        compiled = tuple(compiled)
+        self._compiled[(msgid, version)] = compiled
+        return compiled
+
+    def __call__(self, raw: bytes) -> bool:
+        """
+        Check if frame satisfies conditions.
+
+        :param bytes raw: complete raw UNI frame
+        :return: True to pass frame, False to discard
+        :rtype: bool
+        """
+
+        msgid = raw[4] | (raw[5] << 8)
+        if msgid not in self._conditions:
+            if self._passthrough:
+                self.passed += 1
+                return True
+            self.rejected += 1
+            return False
+        version = int.from_bytes(raw[16:20], "little")
+        conds = self._compiled.get((msgid, version))
+        if conds is None:
+            try:
+                conds = self._compile(msgid, version)
+            except ParameterError:  # not filterable in this version's layout
+                conds = self._compiled[(msgid, version)] = False
+        if conds is False:
+            self.incompatible += 1
+            self.rejected += 1
+            return False
+        try:
+            ok = all(self._check(raw, cond) for cond in conds)
+        except (struct.error, IndexError):  # truncated payload
+            ok = False
+        if ok:
+            self.passed += 1
+        else:
+            self.rejected += 1
+        return ok
+
+    @staticmethod
+    def _check(raw: bytes, cond: tuple) -> bool:
+        """
+        Evaluate compiled condition on raw frame.
+
+        :param bytes raw: complete raw UNI frame
+        :param tuple cond: compiled condition
+        :return: True if condition is satisfied
+        :rtype: bool
+        """
+
+        index, opr, value = cond[6:9]
+        positions = field_positions(raw, cond, 24, len(raw) - 4)
+        if index:
+            positions = positions[index - 1 : index]
+        for pos in positions:
+            val = field_value(raw, cond, pos)
+            if isinstance(val, str):
+                val = val.rstrip("\x00")
+            if opr(val, value):
+                return True
+        return False
@@ -10,14 +10,26 @@ Created on 6 Oct 2025
 """
 
 import struct
+import zlib
 from datetime import datetime, timezone
 from types import NoneType
-from typing import Any
 
 import pyunigps.exceptions as qge
-from pyunigps.unitypes_core import ATTTYPE, U1, U2, U4
+from pyunigps.unitypes_core import (
+    ATTTYPE,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    U1,
+    U2,
+    U4,
+    UNI_HDR,
+    UNI_MSGIDS,
+    UNI_PROTOCOL,
+)
 
 GPSEPOCH0 = datetime(1980, 1, 6, tzinfo=timezone.utc)
+BITBLOCKS = {}
+"""Compiled bit-packed block tables, keyed on id of block definition"""
 # ARC table for CRC calculation in calc_crc
 CRCTABLE = [
     0x00000000,
@@ -345,14 +357,14 @@ def atttyp(att: str) -> str:
     return att[0:1]
 
 
-def bytes2val(valb: bytes, att: str) -> Any:
+def bytes2val(valb: bytes, att: str) -> object:
     """
     Convert bytes to value for given UNI attribute type.
 
     :param bytes valb: attribute value in byte format e.g. b'\\\\x19\\\\x00\\\\x00\\\\x00'
     :param str att: attribute type e.g. 'U004'
     :return: attribute value as int, float, str or bytes
-    :rtype: Any
+    :rtype: object
     :raises: UNITypeError
 
     """
@@ -382,10 +394,12 @@ def calc_crc(message: bytes) -> bytes:
 
     """
 
-    size = len(message)
-    crc = 0
-    for i in range(size):
-        crc = CRCTABLE[(crc ^ message[i]) & 0xFF] ^ (crc >> 8)
+    # Equivalent to the CRCTABLE lookup below with an initial value of 0
+    # and no final XOR, computed in C by zlib:
+    # crc = 0
+    # for byte in message:
+    #     crc = CRCTABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    crc = zlib.crc32(message, 0xFFFFFFFF) ^ 0xFFFFFFFF
     return val2bytes(crc, U4)
 
     # poly = 0x04C11DB7
@@ -401,6 +415,71 @@ def calc_crc(message: bytes) -> bytes:
     # return crc
 
 
+def compile_bitblock(bdict: dict) -> tuple:
+    """
+    Compile bit-packed block definition into shift/mask table. Tables are
+    compiled once per definition and cached.
+
+    The table is a tuple of entries, either:
+
+    - ("run", fields, bits) - contiguous fixed-width fields, where fields is
+      a tuple of (name, bit offset in run, width, mask, sign bit, scale)
+    - ("group", numr, table, name) - nested repeating group of sub-table
+
+    :param dict bdict: bit-packed block definition
+    :return: tuple of (table, fixed size in bits or -1 if variable)
+    :rtype: tuple
+    """
+
+    cmp = BITBLOCKS.get(id(bdict))
+    if cmp is None or cmp[0] is not bdict:
+        cmp = (bdict,) + _compile_bits(bdict)
+        BITBLOCKS[id(bdict)] = cmp
+    return cmp[1], cmp[2]
+
+
+def _compile_bits(bdict: dict) -> tuple:
+    """
+    Recursively compile bit-packed block definition.
+
+    :param dict bdict: bit-packed block definition
+    :return: tuple of (table, fixed size in bits or -1 if variable)
+    :rtype: tuple
+    """
+
+    table = []
+    run = []
+    pos = 0
+    total = 0
+    for anam, adef in bdict.items():
+        if isinstance(adef, tuple):  # nested repeating group
+            if run:
+                table.append(("run", tuple(run), pos))
+                run = []
+                total += pos
+                pos = 0
+            numr, gdict = adef
+            sub, subbits = _compile_bits(gdict)
+            table.append(("group", numr, sub, anam))
+            if isinstance(numr, int) and total >= 0 and subbits >= 0:
+                total += numr * subbits
+            else:
+                total = -1
+        else:
+            scale = 1
+            if isinstance(adef, list):
+                adef, scale = adef
+            width = attsiz(adef)
+            sign = 1 << (width - 1) if atttyp(adef) == "S" else 0
+            run.append((anam, pos, width, (1 << width) - 1, sign, scale))
+            pos += width
+    if run:
+        table.append(("run", tuple(run), pos))
+        if total >= 0:
+            total += pos
+    return tuple(table), total
+
+
 def escapeall(val: bytes) -> str:
     """
     Escape all byte characters e.g. b'\\\\x73' rather than b`s`
@@ -413,6 +492,30 @@ def escapeall(val: bytes) -> str:
     return "b'{}'".format("".join(f"\\x{b:02x}" for b in val))
 
 
+def frame_id(raw: bytes) -> tuple:
+    """
+    Get protocol and message identifier of a complete raw UNI, NMEA or RTCM3
+    frame, without parsing it.
+
+    e.g. UNI -> (2, 17); NMEA -> (1, 'GNGGA'); RTCM3 -> (4, 1005)
+
+    :param bytes raw: raw frame, as returned by UNIReader
+    :return: tuple of (protocol, msgid), or (0, None) if not recognised
+    :rtype: tuple
+    """
+
+    if raw[0:3] == UNI_HDR and len(raw) > 5:
+        return UNI_PROTOCOL, raw[4] | (raw[5] << 8)
+    if raw[0:1] == b"\x24":
+        end = raw.find(b",")
+        return NMEA_PROTOCOL, bytes(raw[1 : end if end > 0 else 6]).decode(
+            "utf-8", errors="backslashreplace"
+        )
+    if raw[0:1] == b"\xd3" and len(raw) > 4:
+        return RTCM3_PROTOCOL, (raw[3] << 4) | (raw[4] >> 4)
+    return 0, None
+
+
 def get_bits(bitfield: bytes, bitmask: int) -> int:
     """
     Get integer value of specified (masked) bit(s) in a UNI bitfield (attribute type 'X')
@@ -447,7 +550,7 @@ def isvalid_checksum(message: bytes) -> bool:
 
     lenm = len(message)
     ckm = message[lenm - 4 : lenm]
-    return ckm == calc_crc(message[: lenm - 4])
+    return ckm == calc_crc(memoryview(message)[: lenm - 4])
 
 
 def key_from_val(dictionary: dict, value) -> str:
@@ -469,13 +572,31 @@ def key_from_val(dictionary: dict, value) -> str:
     raise KeyError(f"No key found for value {value}")
 
 
-def nomval(att: str) -> Any:
+def match_msgfilter(protocol: int, msgid: object, msgfilter: set | None) -> bool:
+    """
+    Check if message identifier, as returned by frame_id(), is selected by
+    message filter, as returned by parse_msgfilter(). NMEA identities match
+    with or without talker, e.g. 'GGA' matches 'GNGGA' and 'GPGGA'.
+
+    :param int protocol: frame protocol
+    :param object msgid: frame message identifier
+    :param set | None msgfilter: message filter, None = all
+    :return: True if selected
+    :rtype: bool
+    """
+
+    if msgfilter is None or msgid in msgfilter:
+        return True
+    return protocol == NMEA_PROTOCOL and msgid[2:] in msgfilter
+
+
+def nomval(att: str) -> object:
     """
     Get nominal value for given UNI attribute type.
 
     :param str att: attribute type e.g. 'U004'
     :return: attribute value as int, float, str or bytes
-    :rtype: Any
+    :rtype: object
     :raises: UNITypeError
 
     """
@@ -493,11 +614,38 @@ def nomval(att: str) -> Any:
     return val
 
 
-def val2bytes(val: Any, att: str) -> bytes:
+def parse_msgfilter(msgids: object) -> set:
+    """
+    Convert message identities to message filter for match_msgfilter().
+    UNI identities and numeric UNI msgids or RTCM3 message types are
+    converted to int, NMEA identities (with or without talker) are retained
+    as str.
+
+    e.g. ("OBSVM", "106", "GGA", 1077) -> {12, 106, 'GGA', 1077}
+
+    :param object msgids: iterable of message identities as str or int
+    :return: message filter
+    :rtype: set
+    """
+
+    names = {val: key for key, val in UNI_MSGIDS.items()}
+    msgfilter = set()
+    for mid in msgids:
+        mid = str(mid).strip()
+        if mid.isdigit():
+            msgfilter.add(int(mid))
+        elif mid in names:
+            msgfilter.add(names[mid])
+        elif mid != "":
+            msgfilter.add(mid)
+    return msgfilter
+
+
+def val2bytes(val: object, att: str) -> bytes:
     """
     Convert value to bytes for given UNI attribute type.
 
-    :param Any val: attribute value e.g. 25
+    :param object val: attribute value e.g. 25
     :param str att: attribute type e.g. 'U004'
     :return: attribute value as bytes
     :rtype: bytes
@@ -13,20 +13,31 @@ Created on 26 Sep 2020
 # pylint: disable=too-many-positional-arguments, too-many-locals, too-many-arguments
 
 import struct
+from copy import copy
 from types import NoneType
 
 from pyunigps.exceptions import UNIMessageError, UNITypeError
 from pyunigps.unihelpers import (
-    attsiz,
     bytes2val,
     calc_crc,
     escapeall,
     nomval,
     timeinfo2bytes,
+    timeinfo2vals,
     utc2wnotow,
     val2bytes,
 )
+from pyunigps.uniregistry import (
+    BITFIELD,
+    GROUP,
+    REGISTRY,
+    SINGLE,
+    field_lookup,
+    field_positions,
+    field_value,
+)
 from pyunigps.unitypes_core import (
+    BITS_MSB,
     GET,
     POLL,
     SCALROUND,
@@ -36,9 +47,21 @@ from pyunigps.unitypes_core import (
     UNI_HDR,
     UNI_MSGIDS,
 )
-from pyunigps.unitypes_get import UNI_PAYLOADS_GET
-from pyunigps.unitypes_poll import UNI_PAYLOADS_POLL
-from pyunigps.unitypes_set import UNI_PAYLOADS_SET
+
+HEADER_FIELDS = (
+    "cpuidle",
+    "timeref",
+    "timestatus",
+    "wno",
+    "tow",
+    "version",
+    "leapsecond",
+    "delay",
+)
+"""Message header attributes"""
+LAZY = 2
+"""Projection state of unpickled message - no attributes decoded yet,
+but decoded in full on first access or str()"""
 
 
 class UNIMessage:
@@ -59,6 +82,7 @@ class UNIMessage:
         checksum: bytes | NoneType = None,
         msgmode: int = GET,
         parsebitfield: bool = True,
+        projection: tuple | NoneType = None,
         **kwargs,
     ):
         """
@@ -83,6 +107,9 @@ class UNIMessage:
         :param bytes | NoneType checksum: CRC (will be derived if None)
         :param int msgmode: message mode (0 = GET, 1 = SET, 2 = POLL)
         :param bool parsebitfield: 0 = parse as bytes, 1 = parse as individual bits
+        :param tuple | NoneType projection: if 'payload' is passed, names of the
+            only attributes to decode initially; all other attributes are decoded
+            on first access (None)
         :param kwargs: optional keywords representing payload attributes
         :raises: UNITypeError, UNIMessageError
         """
@@ -116,11 +143,17 @@ class UNIMessage:
         self._mode = msgmode
         self._payload = b""
         self._parsebf = parsebitfield  # parsing bitfields Y/N?
+        self._projected = False  # remaining attributes still to be decoded?
 
         if msgmode not in (GET, SET, POLL):
             raise UNIMessageError(f"Invalid msgmode {msgmode} - must be 0, 1 or 2")
 
-        self._do_attributes(**kwargs)
+        if not (
+            projection is not None
+            and "payload" in kwargs
+            and self._set_projected(projection, kwargs["payload"])
+        ):
+            self._do_attributes(**kwargs)
 
         self._immutable = True  # once initialised, object is immutable
 
@@ -142,11 +175,10 @@ class UNIMessage:
                 self._payload = None
             else:
                 self._payload = kwargs.get("payload", b"")
-                pdict = self._get_dict(**kwargs)  # get appropriate payload dict
-                for anam in pdict:  # process each attribute in dict
-                    offset, index = self._set_attribute(
-                        anam, pdict, offset, index, **kwargs
-                    )
+                table = self._get_table()  # get compiled payload definition
+                for entry in table:  # process each attribute in table
+                    anam = entry[1]
+                    offset, index = self._set_attribute(entry, offset, index, **kwargs)
             self._do_len_checksum()
 
         except (
@@ -169,14 +201,49 @@ class UNIMessage:
                 )
             ) from err
 
-    def _set_attribute(
-        self, anam: str, pdict: dict, offset: int, index: list, **kwargs
-    ) -> tuple:
+    def _set_projected(self, projection: tuple, payload: bytes) -> bool:
+        """
+        Decode projected attributes only, from fixed payload offsets.
+
+        :param tuple projection: attribute names, unindexed names in
+            repeating groups representing all repeats
+        :param bytes payload: raw payload
+        :return: True if projected, False if any attribute is not at a
+            fixed offset (in which case nothing is decoded)
+        :rtype: bool
+        :raises: UNITypeError if payload is truncated
+        """
+
+        try:
+            fields = REGISTRY.layout(self._mode, self.identity, self.version)
+        except KeyError:  # unknown message type, handled by full decode
+            return False
+        locs = [field_lookup(fields, anam) for anam in projection]
+        if any(loc is None for _, loc, _ in locs):
+            return False
+        self._payload = payload
+        try:
+            for anam, loc, index in locs:
+                positions = field_positions(payload, loc)
+                if loc[5] is None:
+                    setattr(self, anam, field_value(payload, loc, positions[0]))
+                    continue
+                for i, pos in enumerate(positions, 1):
+                    if index in (0, i):
+                        setattr(self, f"{anam}_{i:02d}", field_value(payload, loc, pos))
+        except (struct.error, IndexError) as err:
+            raise UNITypeError(
+                f"Payload too short for attribute '{anam}' in message class {self.identity}"
+            ) from err
+        self._projected = True
+        self._do_len_checksum()
+        return True
+
+    def _set_attribute(self, entry: tuple, offset: int, index: list, **kwargs) -> tuple:
         """
         Recursive routine to set individual or grouped payload attributes.
 
-        :param str anam: attribute name
-        :param dict pdict: dict representing payload definition
+        :param tuple entry: compiled attribute definition (see uniregistry)
         :param int offset: payload offset in bytes
         :param list index: repeating group index array
         :param kwargs: optional payload key/value pairs
@@ -185,34 +252,37 @@ class UNIMessage:
 
         """
 
-        adef = pdict[anam]  # get attribute definition
-        if isinstance(
-            adef, tuple
-        ):  # repeating group of attributes or subdefined bitfield
-            numr, _ = adef
-            if numr[0] == "X":  # bitfield
-                if self._parsebf:  # if we're parsing bitfields
-                    offset, index = self._set_attribute_bitfield(
-                        adef, offset, index, **kwargs
-                    )
-                else:  # treat bitfield as a single byte array
-                    offset = self._set_attribute_single(
-                        anam, numr, offset, index, **kwargs
-                    )
-            else:  # repeating group of attributes
-                offset, index = self._set_attribute_group(adef, offset, index, **kwargs)
-        else:  # single attribute
-            offset = self._set_attribute_single(anam, adef, offset, index, **kwargs)
+        kind = entry[0]
+        if kind == SINGLE:  # single attribute
+            _, anam, atyp, asiz, ares = entry
+            offset = self._set_attribute_single(
+                anam, atyp, asiz, ares, offset, index, **kwargs
+            )
+        elif kind == GROUP:  # repeating group of attributes
+            offset, index = self._set_attribute_group(entry, offset, index, **kwargs)
+        elif kind == BITFIELD:
+            if self._parsebf:  # if we're parsing bitfields
+                offset, index = self._set_attribute_bitfield(
+                    entry, offset, index, **kwargs
+                )
+            else:  # treat bitfield as a single byte array
+                _, anam, atyp, asiz, _ = entry
+                offset = self._set_attribute_single(
+                    anam, atyp, asiz, 1, offset, index, **kwargs
+                )
+        else:  # bit-packed block
+            offset, index = self._set_attribute_bitblock(entry, offset, index, **kwargs)
 
         return (offset, index)
 
     def _set_attribute_group(
-        self, adef: tuple, offset: int, index: list, **kwargs
+        self, entry: tuple, offset: int, index: list, **kwargs
     ) -> tuple:
         """
         Process (nested) group of attributes.
 
-        :param tuple adef: attribute definition - tuple of (num repeats, attribute dict)
+        :param tuple entry: compiled group definition - tuple of
+            (GROUP, name, num repeats, group table, group size)
         :param int offset: payload offset in bytes
         :param list index: repeating group index array
         :param kwargs: optional payload key/value pairs
@@ -222,38 +292,42 @@ class UNIMessage:
         """
 
         index.append(0)  # add a (nested) group index
-        anam, gdict = adef  # attribute signifying group size, group dictionary
+        _, _, numr, gtable, gsize = entry
         # derive or retrieve number of items in group
-        if isinstance(anam, int):  # fixed number of repeats
-            gsiz = anam
-        elif anam == "None":  # number of repeats 'variable by size'
-            gsiz = self._calc_num_repeats(gdict, self._payload, offset, 0)
+        if isinstance(numr, int):  # fixed number of repeats
+            gsiz = numr
+        elif numr == "None":  # number of repeats 'variable by size'
+            gsiz = (len(self._payload) - offset) // gsize
         else:  # number of repeats is defined in named attribute
-            gsiz = getattr(self, anam)
+            gsiz = getattr(self, numr)
         # recursively process each group attribute,
         # incrementing the payload offset and index as we go
         for i in range(gsiz):
             index[-1] = i + 1
-            for key1 in gdict:
-                offset, index = self._set_attribute(
-                    key1, gdict, offset, index, **kwargs
-                )
+            for gentry in gtable:
+                offset, index = self._set_attribute(gentry, offset, index, **kwargs)
 
         index.pop()  # remove this (nested) group index
 
         return (offset, index)
 
     def _set_attribute_single(
-        self, anam: str, adef: object, offset: int, index: list, **kwargs
+        self,
+        anam: str,
+        adef: str,
+        asiz: int,
+        ares: float,
+        offset: int,
+        index: list,
+        **kwargs,
     ) -> int:
         """
         Set individual attribute value, applying scaling where appropriate.
 
         :param str anam: attribute keyword
-        EITHER
         :param str adef: attribute definition string e.g. 'U002'
-        OR
-        :param list adef: if scaled, list of [attribute type string, scaling factor float]
+        :param int asiz: attribute size in bytes
+        :param float ares: attribute resolution (scaling factor), 1 if unscaled
         :param int offset: payload offset in bytes
         :param list index: repeating group index array
         :param kwargs: optional payload key/value pairs
@@ -263,24 +337,12 @@ class UNIMessage:
         """
         # pylint: disable=no-member
 
-        # if attribute is scaled
-        ares = 1
-        if isinstance(adef, list):
-            ares = adef[1]  # attribute resolution (i.e. scaling factor)
-            adef = adef[0]  # attribute definition
-
         # if attribute is part of a (nested) repeating group, suffix name with index
         anami = anam
         for i in index:  # one index for each nested level
             if i > 0:
                 anami += f"_{i:02d}"
 
-        # determine attribute size (bytes) - some attributes have
-        # variable length, depending on
-        # - multiple of value of preceding attribute
-        # - payload length - offset
-        asiz = attsiz(adef)
-
         # if payload keyword has been provided,
         # use the appropriate offset of the payload
         if "payload" in kwargs:
@@ -305,12 +367,13 @@ class UNIMessage:
         return offset + asiz
 
     def _set_attribute_bitfield(
-        self, atyp: str, offset: int, index: list, **kwargs
+        self, entry: tuple, offset: int, index: list, **kwargs
     ) -> tuple:
         """
         Parse bitfield attribute (type 'X').
 
-        :param str atyp: attribute type e.g. 'X002'
+        :param tuple entry: compiled bitfield definition - tuple of
+            (BITFIELD, name, type, size, ((flag name, flag bits), ...))
         :param int offset: payload offset in bytes
         :param list index: repeating group index array
         :param kwargs: optional payload key/value pairs
@@ -320,8 +383,7 @@ class UNIMessage:
         """
         # pylint: disable=no-member
 
-        btyp, bdict = atyp  # type of bitfield, bitfield dictionary
-        bsiz = attsiz(btyp)  # size of bitfield in bytes
+        _, _, _, bsiz, flags = entry  # size of bitfield in bytes, flags
         bfoffset = 0
 
         # if payload keyword has been provided,
@@ -332,9 +394,9 @@ class UNIMessage:
             bitfield = 0
 
         # process each flag in bitfield
-        for key, keyt in bdict.items():
+        for key, atts in flags:
             bitfield, bfoffset = self._set_attribute_bits(
-                bitfield, bfoffset, key, keyt, index, **kwargs
+                bitfield, bfoffset, key, atts, index, **kwargs
             )
 
         # update payload
@@ -348,7 +410,7 @@ class UNIMessage:
         bitfield: int,
         bfoffset: int,
         key: str,
-        keyt: str,
+        atts: int,
         index: list,
         **kwargs,
     ) -> tuple:
@@ -358,7 +420,7 @@ class UNIMessage:
         :param int bitfield: bitfield
         :param int bfoffset: bitfield offset in bits
         :param str key: attribute key name
-        :param str keyt: key type e.g. 'U001'
+        :param int atts: flag size in bits
         :param list index: repeating group index array
         :param kwargs: optional payload key/value pairs
         :return: (bitfield, bfoffset)
@@ -373,8 +435,6 @@ class UNIMessage:
             if i > 0:
                 keyr += f"_{i:02d}"
 
-        atts = attsiz(keyt)  # determine flag size in bits
-
         if "payload" in kwargs:
             val = (bitfield >> bfoffset) & ((1 << atts) - 1)
         else:
@@ -385,6 +445,162 @@ class UNIMessage:
             setattr(self, keyr, val)
         return (bitfield, bfoffset + atts)
 
+    def _set_attribute_bitblock(
+        self, entry: tuple, offset: int, index: list, **kwargs
+    ) -> tuple:
+        """
+        Process bit-packed block of attributes (BITS_MSB or BITS_LSB), whose
+        fields may be any number of bits wide and cross byte boundaries.
+        The block is padded to a whole number of bytes.
+
+        :param tuple entry: compiled block definition - tuple of
+            (BITBLOCK, name, bit order, block table, block size in bits or -1)
+        :param int offset: payload offset in bytes
+        :param list index: repeating group index array
+        :param kwargs: optional payload key/value pairs
+        :return: (offset, index[])
+        :rtype: tuple
+
+        """
+
+        _, _, order, table, bits = entry
+        msb = order == BITS_MSB
+        byteorder = "big" if msb else "little"
+
+        if "payload" in kwargs:
+            end = None if bits < 0 else offset + (bits + 7) // 8
+            data = self._payload[offset:end]
+            pos = self._get_bits(
+                table, int.from_bytes(data, byteorder), len(data) * 8, msb, 0, index
+            )
+            nbytes = (pos + 7) // 8
+        else:
+            acc, pos = self._put_bits(table, msb, 0, 0, index, **kwargs)
+            nbytes = (pos + 7) // 8
+            if msb:  # pad to byte boundary
+                acc <<= nbytes * 8 - pos
+            self._payload += acc.to_bytes(nbytes, byteorder)
+
+        return (offset + nbytes, index)
+
+    def _get_bits(
+        self, table: tuple, block: int, total: int, msb: bool, pos: int, index: list
+    ) -> int:
+        """
+        Recursively set attributes from compiled bit-packed block table.
+
+        :param tuple table: compiled block table
+        :param int block: block as integer
+        :param int total: block size in bits
+        :param bool msb: most significant bit first
+        :param int pos: current bit position
+        :param list index: repeating group index array
+        :return: bit position after last attribute
+        :rtype: int
+
+        """
+
+        for entry in table:
+            if entry[0] == "run":
+                _, fields, bits = entry
+                for anam, rel, width, mask, sign, scale in fields:
+                    if msb:
+                        val = (block >> (total - pos - rel - width)) & mask
+                    else:
+                        val = (block >> (pos + rel)) & mask
+                    if val & sign:
+                        val -= sign << 1
+                    if scale != 1:
+                        val = round(val * scale, SCALROUND)
+                    if anam[0:8] != "reserved":
+                        setattr(self, self._indexed(anam, index), val)
+                pos += bits
+            else:
+                _, numr, sub, _ = entry
+                gsiz = self._group_size(numr, index)
+                index.append(0)
+                for i in range(gsiz):
+                    index[-1] = i + 1
+                    pos = self._get_bits(sub, block, total, msb, pos, index)
+                index.pop()
+        return pos
+
+    def _put_bits(
+        self, table: tuple, msb: bool, acc: int, pos: int, index: list, **kwargs
+    ) -> tuple:
+        """
+        Recursively pack attributes from keywords using compiled
+        bit-packed block table. Absent attributes are set to 0.
+
+        :param tuple table: compiled block table
+        :param bool msb: most significant bit first
+        :param int acc: block accumulated so far
+        :param int pos: current bit position
+        :param list index: repeating group index array
+        :param kwargs: optional payload key/value pairs
+        :return: (acc, pos)
+        :rtype: tuple
+
+        """
+
+        for entry in table:
+            if entry[0] == "run":
+                _, fields, _ = entry
+                for anam, _, width, mask, _, scale in fields:
+                    anami = self._indexed(anam, index)
+                    val = kwargs.get(anami, 0)
+                    valb = (val if scale == 1 else round(val / scale)) & mask
+                    if msb:
+                        acc = (acc << width) | valb
+                    else:
+                        acc |= valb << pos
+                    pos += width
+                    if anam[0:8] != "reserved":
+                        setattr(self, anami, val)
+            else:
+                _, numr, sub, _ = entry
+                gsiz = self._group_size(numr, index)
+                index.append(0)
+                for i in range(gsiz):
+                    index[-1] = i + 1
+                    acc, pos = self._put_bits(sub, msb, acc, pos, index, **kwargs)
+                index.pop()
+        return acc, pos
+
+    def _group_size(self, numr: object, index: list) -> int:
+        """
+        Get number of repeats in bit-packed block group, either fixed or
+        from a preceding attribute in the same (or enclosing) group.
+
+        :param object numr: number of repeats as int or attribute name
+        :param list index: repeating group index array
+        :return: number of repeats
+        :rtype: int
+
+        """
+
+        if isinstance(numr, int):
+            return numr
+        anami = self._indexed(numr, index)
+        return getattr(self, anami if anami in self.__dict__ else numr)
+
+    @staticmethod
+    def _indexed(anam: str, index: list) -> str:
+        """
+        Suffix attribute name with (nested) group indices.
+
+        :param str anam: attribute name
+        :param list index: repeating group index array
+        :return: indexed attribute name e.g. svid_01
+        :rtype: str
+
+        """
+
+        for i in index:  # one index for each nested level
+            if i > 0:
+                anam += f"_{i:02d}"
+        return anam
+
     def _do_len_checksum(self):
         """
         Calculate and format payload length and checksum as bytes,
@@ -402,61 +618,28 @@ class UNIMessage:
                 UNI_HDR + cpuidleb + msgidb + lenb + self._timeinfob + payload
             )
 
-    def _get_dict(self, **kwargs) -> dict:  # pylint: disable=unused-argument
+    def _get_table(self) -> tuple:
         """
-        Get payload dictionary corresponding to message mode (GET/SET/POLL)
+        Get compiled payload definition corresponding to message mode (GET/SET/POLL)
+        and header version.
 
-        :param kwargs: optional payload key/value pairs
-        :return: dictionary representing payload definition
-        :rtype: dict
+        :return: compiled payload definition
+        :rtype: tuple
+        :raises: UNIMessageError if message type is not defined
 
         """
 
         try:
-            if self._mode == POLL:
-                pdict = UNI_PAYLOADS_POLL[self.identity]
-            elif self._mode == SET:
-                pdict = UNI_PAYLOADS_SET[self.identity]
-            else:
-                # Unknown GET message, parsed to nominal definition
-                if self.identity[-7:] == "NOMINAL":
-                    pdict = {}
-                else:
-                    pdict = UNI_PAYLOADS_GET[self.identity]
-            return pdict
+            # Unknown GET message, parsed to nominal definition
+            if self._mode == GET and self.identity[-7:] == "NOMINAL":
+                return ()
+            return REGISTRY.table(self._mode, self.identity, self.version)
         except KeyError as err:
             mode = ["GET", "SET", "POLL"][self._mode]
             raise UNIMessageError(
                 f"Unknown message type {self._msgid}, mode {mode}"
             ) from err
 
-    def _calc_num_repeats(
-        self, attd: dict, payload: bytes, offset: int, offsetend: int = 0
-    ) -> int:
-        """
-        Deduce number of items in 'variable by size' repeating group by
-        dividing length of remaining payload by length of group.
-
-        This is predicated on there being only one such repeating group
-        per message payload, which is true for all currently supported types.
-
-        :param dict attd: grouped attribute dictionary
-        :param bytes payload : raw payload
-        :param int offset: number of bytes in payload before repeating group
-        :param int offsetend: number of bytes in payload after repeating group
-        :return: number of repeats
-        :rtype: int
-
-        """
-
-        lenpayload = len(payload) - offset - offsetend
-        lengroup = 0
-        for _, val in attd.items():
-            if isinstance(val, tuple):
-                val, _ = val
-            lengroup += attsiz(val)
-        return int(lenpayload / lengroup)
-
     def __str__(self) -> str:
         """
         Human readable representation.
@@ -466,6 +649,8 @@ class UNIMessage:
 
         """
 
+        if self._projected == LAZY:
+            self._decode_all()
         umsg_name = self.identity
         if self.payload is None:
             return f"<UNI({umsg_name})>"
@@ -507,6 +692,66 @@ class UNIMessage:
             rep += f", payload={self._payload})"
         return rep
 
+    def __getattr__(self, name: str) -> object:
+        """
+        Decode remaining payload attributes of projected message
+        on first access to an attribute which was not projected.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: AttributeError if attribute does not exist
+        """
+
+        if not self.__dict__.get("_projected"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        self._decode_all()
+        return getattr(self, name)
+
+    def _decode_all(self):
+        """
+        Decode all payload attributes of projected message.
+        """
+
+        vals = self.__dict__
+        if not vals["_projected"]:
+            return
+        vals["_projected"] = False
+        vals["_immutable"] = False
+        try:
+            self._do_attributes(payload=self._payload)
+        finally:
+            vals["_immutable"] = True
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle message as its raw frame and parse options only, rather than
+        every decoded attribute. The unpickled message decodes its payload
+        attributes on first access.
+
+        :return: tuple of (constructor, arguments)
+        :rtype: tuple
+        """
+
+        return (
+            _unpickle,
+            (self.serialize(), self._mode, self._parsebf, self._payload is None),
+        )
+
+    def __copy__(self) -> "UNIMessage":
+        """
+        Shallow copy, sharing decoded attribute values.
+
+        :return: copy of message
+        :rtype: UNIMessage
+        """
+
+        msg = type(self).__new__(type(self))
+        msg.__dict__.update(self.__dict__)
+        return msg
+
     def __setattr__(self, name, value):
         """
         Override setattr to make object immutable after instantiation.
@@ -524,6 +769,191 @@ class UNIMessage:
 
         super().__setattr__(name, value)
 
+    def to_dict(self) -> dict:
+        """
+        Return message as dict of identity, header and payload attributes,
+        in payload definition order. Repeating groups are returned as lists
+        of dicts, e.g. {"numobs": 2, "group": [{"prn": 3, ...}, {"prn": 7, ...}]}
+        rather than as '_NN' suffixed attributes.
+
+        :return: message attributes
+        :rtype: dict
+        """
+
+        self._decode_all()
+        vals = self.__dict__
+        dic = {"identity": self.identity}
+        for key in HEADER_FIELDS:
+            dic[key] = vals[key]
+        if self._payload is not None:
+            schema = self._get_schema()
+            if schema is None:
+                dic["payload"] = self._payload
+            else:
+                dic.update(self._schema_dict(schema, "", vals))
+        return dic
+
+    def as_tuple(self) -> tuple:
+        """
+        Return message attribute values in the same order as to_dict(),
+        with repeating groups as tuples of tuples.
+
+        :return: message attribute values
+        :rtype: tuple
+        """
+
+        self._decode_all()
+        vals = self.__dict__
+        tup = (self.identity,) + tuple(vals[key] for key in HEADER_FIELDS)
+        if self._payload is not None:
+            schema = self._get_schema()
+            if schema is None:
+                tup += (self._payload,)
+            else:
+                tup += self._schema_tuple(schema, "", vals)
+        return tup
+
+    def to_json(self) -> str:
+        """
+        Return message as compact single line JSON string (see to_dict()).
+        Bytes values are encoded as hexadecimal strings.
+
+        :return: JSON string
+        :rtype: str
+        """
+
+        from pyunigps.uniexport import (  # pylint: disable=import-outside-toplevel
+            JSON_ENCODER,
+        )
+
+        return JSON_ENCODER.encode(self.to_dict())
+
+    def _get_schema(self) -> tuple | NoneType:
+        """
+        Get nested schema of payload attributes.
+
+        :return: schema, or None if message is unrecognised
+        :rtype: tuple | NoneType
+        """
+
+        if self.identity[-7:] == "NOMINAL":
+            return None
+        return REGISTRY.schema(self._mode, self.identity, self.version, self._parsebf)
+
+    def _schema_dict(self, schema: tuple, suffix: str, vals: dict) -> dict:
+        """
+        Recursively get attributes in schema as dict.
+
+        :param tuple schema: schema (see uniregistry.field_schema())
+        :param str suffix: group index suffix e.g. '_01'
+        :param dict vals: message attributes
+        :return: attributes
+        :rtype: dict
+        """
+
+        dic = {}
+        for anam, numr, sub in schema:
+            if sub is None:
+                dic[anam] = vals[anam + suffix]
+            else:
+                dic[anam] = [
+                    self._schema_dict(sub, f"{suffix}_{i:02d}", vals)
+                    for i in range(1, self._repeats(numr, sub, suffix, vals) + 1)
+                ]
+        return dic
+
+    def _schema_tuple(self, schema: tuple, suffix: str, vals: dict) -> tuple:
+        """
+        Recursively get attribute values in schema as tuple.
+
+        :param tuple schema: schema (see uniregistry.field_schema())
+        :param str suffix: group index suffix e.g. '_01'
+        :param dict vals: message attributes
+        :return: attribute values
+        :rtype: tuple
+        """
+
+        return tuple(
+            (
+                vals[anam + suffix]
+                if sub is None
+                else tuple(
+                    self._schema_tuple(sub, f"{suffix}_{i:02d}", vals)
+                    for i in range(1, self._repeats(numr, sub, suffix, vals) + 1)
+                )
+            )
+            for anam, numr, sub in schema
+        )
+
+    @staticmethod
+    def _repeats(numr: object, sub: tuple, suffix: str, vals: dict) -> int:
+        """
+        Get number of repeats of group in schema.
+
+        :param object numr: fixed number of repeats, counter attribute name
+            or "None" if 'variable by size'
+        :param tuple sub: group schema
+        :param str suffix: group index suffix of enclosing group
+        :param dict vals: message attributes
+        :return: number of repeats
+        :rtype: int
+        """
+
+        if isinstance(numr, int):
+            return numr
+        if numr != "None":
+            return vals.get(numr + suffix, vals.get(numr, 0))
+        probe = next((anam for anam, _, sch in sub if sch is None), None)
+        num = 0
+        while probe is not None and f"{probe}{suffix}_{num + 1:02d}" in vals:
+            num += 1
+        return num
+
+    def reheader(
+        self,
+        cpuidle: int,
+        timeref: int,
+        timestatus: int,
+        wno: int,
+        tow: int,
+        version: int,
+        leapsecond: int,
+        delay: int,
+        checksum: bytes,
+    ) -> "UNIMessage":
+        """
+        Return shallow copy of this message with the same payload attributes
+        but new header fields. Used to reuse cached payload decodes.
+
+        :param int cpuidle: header cpuidle
+        :param int timeref: header timeref
+        :param int timestatus: header timestatus
+        :param int wno: header week number
+        :param int tow: header time of week
+        :param int version: header version
+        :param int leapsecond: header leapsecond
+        :param int delay: header delay
+        :param bytes checksum: CRC
+        :return: new UNIMessage
+        :rtype: UNIMessage
+        """
+
+        msg = copy(self)  # copies instance __dict__ without invoking __setattr__
+        vals = msg.__dict__
+        vals["cpuidle"] = cpuidle
+        vals["timeref"] = timeref
+        vals["timestatus"] = timestatus
+        vals["wno"] = wno
+        vals["tow"] = tow
+        vals["version"] = version
+        vals["leapsecond"] = leapsecond
+        vals["delay"] = delay
+        vals["_checksum"] = checksum
+        vals["_timeinfob"] = timeinfo2bytes(
+            timeref, timestatus, wno, tow, version, leapsecond, delay
+        )
+        return msg
+
     def serialize(self) -> bytes:
         """
         Serialize message.
@@ -558,7 +988,7 @@ class UNIMessage:
             umsg_name = UNI_MSGIDS[self._msgid]
         except KeyError:
             # unrecognised Unicore message, parsed to UNI-NOMINAL definition
-            umsg_name = f"{int.from_bytes(self._msgid, 'little'):02x}-NOMINAL"
+            umsg_name = f"{self._msgid:02x}-NOMINAL"
         return umsg_name
 
     @property
@@ -596,3 +1026,42 @@ class UNIMessage:
         """
 
         return self._mode
+
+
+def _unpickle(
+    raw: bytes, msgmode: int, parsebitfield: bool, nopayload: bool = False
+) -> UNIMessage:
+    """
+    Reconstruct pickled message from its raw frame, with payload
+    attributes decoded on first access.
+
+    :param bytes raw: raw UNI frame
+    :param int msgmode: message mode
+    :param bool parsebitfield: parse bitfields
+    :param bool nopayload: message has no payload (False)
+    :return: message
+    :rtype: UNIMessage
+    """
+
+    timeref, timestatus, wno, tow, version, leapsecond, delay = timeinfo2vals(raw[8:24])
+    kwargs = {} if nopayload else {"payload": raw[24:-4]}
+    msg = UNIMessage(
+        msgid=raw[4] | (raw[5] << 8),
+        length=raw[6] | (raw[7] << 8),
+        cpuidle=raw[3],
+        timeref=timeref,
+        timestatus=timestatus,
+        wno=wno,
+        tow=tow,
+        version=version,
+        leapsecond=leapsecond,
+        delay=delay,
+        checksum=raw[-4:],
+        msgmode=msgmode,
+        parsebitfield=parsebitfield,
+        projection=(),
+        **kwargs,
+    )
+    if msg.__dict__["_projected"]:
+        msg.__dict__["_projected"] = LAZY
+    return msg
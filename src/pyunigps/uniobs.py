@@ -0,0 +1,249 @@
+"""
+Observation array decoders for OBSVM / OBSVH / OBSVBASE and the
+compressed OBSVMCMP / OBSVHCMP logs.
+
+Each 24-byte compressed observation record packs its fields at bit
+granularity across byte boundaries::
+
+    bits 0-31    channel tracking status
+    bits 32-59   doppler, signed, 1/256 Hz
+    bits 60-95   pseudorange, 1/128 m
+    bits 96-127  accumulated doppler range (ADR), signed, 1/256 cycles
+    bits 128-131 pseudorange std dev, index into PSR_STD
+    bits 132-135 ADR std dev, (n + 1) / 512 cycles
+    bits 136-143 PRN / slot
+    bits 144-164 lock time, 1/32 s
+    bits 165-169 C/No, 20 + n dB-Hz
+    bits 170-175 GLONASS frequency number + 7
+    bits 176-191 reserved
+
+Rather than extracting fields bit by bit, each record is read as three
+little-endian 64-bit words and every field is recovered with a single
+shift and mask. If numpy is installed, all records in a payload are
+unpacked at once as uint64 arrays; otherwise the same word-level
+extraction is applied to Python integers per record.
+
+NB: the compressed ADR is reported modulo 2^23 cycles as transmitted;
+reconstructing the full ADR requires the signal wavelength.
+
+OBSVMCMP / OBSVHCMP messages are also parsed by UNIMessage into individual
+attributes via the bit-packed block definition in unitypes_get.py (with
+'psrstdcode', 'adrstdcode', 'cn0code' and 'glofreqcode' as the encoded
+values above); the decoders here are the faster path for bulk processing.
+
+Both decoders return a dict of equal-length per-observation arrays
+(or lists) keyed by field name, so compressed and uncompressed logs can
+be processed interchangeably.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import struct
+
+from pyunigps.exceptions import UNIMessageError
+
+OBS_FIELDS = (
+    "status",
+    "prn",
+    "psr",
+    "adr",
+    "psrstd",
+    "adrstd",
+    "dopp",
+    "cn0",
+    "locktime",
+)
+"""Observation array keys"""
+OBS_SIZE = 40
+"""Uncompressed observation record size in bytes"""
+OBS_STRUCT = struct.Struct("<HHddHHfHHfI")
+"""Uncompressed observation record layout"""
+OBSCMP_SIZE = 24
+"""Compressed observation record size in bytes"""
+PSR_STD = (
+    0.050,
+    0.075,
+    0.113,
+    0.169,
+    0.253,
+    0.380,
+    0.570,
+    0.854,
+    1.281,
+    2.375,
+    4.750,
+    9.500,
+    19.000,
+    38.000,
+    76.000,
+    152.000,
+)
+"""Compressed pseudorange std dev lookup (m)"""
+
+
+def _records(payload: bytes, size: int) -> tuple:
+    """
+    Validate observation payload and get number of records.
+
+    :param bytes payload: raw payload (starting with U4 record count)
+    :param int size: record size in bytes
+    :return: tuple of (number of records, record data)
+    :rtype: tuple
+    :raises: UNIMessageError if payload length is inconsistent
+    """
+
+    if payload is None or len(payload) < 4:
+        raise UNIMessageError("Observation payload is empty or truncated")
+    num = int.from_bytes(payload[0:4], "little")
+    if len(payload) - 4 != num * size:
+        raise UNIMessageError(
+            f"Observation payload length {len(payload)} inconsistent "
+            f"with {num} records of {size} bytes"
+        )
+    return num, memoryview(payload)[4:]
+
+
+def _numpy():
+    """
+    Import numpy if available.
+
+    :return: numpy module or None
+    :rtype: module
+    """
+
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        return numpy
+    except ImportError:
+        return None
+
+
+def decode_obsvm(payload: bytes) -> dict:
+    """
+    Decode uncompressed OBSVM, OBSVH or OBSVBASE payload into
+    per-observation arrays.
+
+    :param bytes payload: raw payload
+    :return: dict of numpy arrays (or lists if numpy is not installed)
+    :rtype: dict
+    :raises: UNIMessageError if payload length is inconsistent
+    """
+
+    num, data = _records(payload, OBS_SIZE)
+    np = _numpy()
+    if np is not None:
+        rec = np.frombuffer(
+            data,
+            dtype=np.dtype(
+                [
+                    ("sysfreq", "<u2"),
+                    ("prn", "<u2"),
+                    ("psr", "<f8"),
+                    ("adr", "<f8"),
+                    ("psrstd", "<u2"),
+                    ("adrstd", "<u2"),
+                    ("dopp", "<f4"),
+                    ("cn0", "<u2"),
+                    ("reserved", "<u2"),
+                    ("locktime", "<f4"),
+                    ("status", "<u4"),
+                ]
+            ),
+            count=num,
+        )
+        return {
+            "status": rec["status"],
+            "prn": rec["prn"],
+            "psr": rec["psr"],
+            "adr": rec["adr"],
+            "psrstd": rec["psrstd"] * 0.01,
+            "adrstd": rec["adrstd"] * 0.0001,
+            "dopp": rec["dopp"].astype(np.float64),
+            "cn0": rec["cn0"] * 0.01,
+            "locktime": rec["locktime"].astype(np.float64),
+        }
+
+    obs = {key: [] for key in OBS_FIELDS}
+    for vals in OBS_STRUCT.iter_unpack(data):
+        _, prn, psr, adr, psrstd, adrstd, dopp, cn0, _, lock, status = vals
+        for key, val in zip(
+            OBS_FIELDS,
+            (status, prn, psr, adr, psrstd * 0.01, adrstd * 0.0001, dopp)
+            + (cn0 * 0.01, lock),
+        ):
+            obs[key].append(val)
+    return obs
+
+
+def decode_obsvcmp(payload: bytes) -> dict:
+    """
+    Decode compressed OBSVMCMP or OBSVHCMP payload into
+    per-observation arrays, with fields scaled to the same units
+    as decode_obsvm(). Also returns the GLONASS frequency
+    number as 'glofreq'.
+
+    :param bytes payload: raw payload
+    :return: dict of numpy arrays (or lists if numpy is not installed)
+    :rtype: dict
+    :raises: UNIMessageError if payload length is inconsistent
+    """
+
+    num, data = _records(payload, OBSCMP_SIZE)
+    np = _numpy()
+    if np is not None:
+        words = np.frombuffer(data, dtype="<u8", count=num * 3).reshape(num, 3)
+        return _unpack(np, words[:, 0], words[:, 1], words[:, 2])
+
+    obs = {key: [] for key in OBS_FIELDS + ("glofreq",)}
+    for w0, w1, w2 in struct.iter_unpack("<QQQ", data):
+        for key, val in _unpack(None, w0, w1, w2).items():
+            obs[key].append(val)
+    return obs
+
+
+def _unpack(np, w0: object, w1: object, w2: object) -> dict:
+    """
+    Extract compressed observation fields from 64-bit words.
+    Works on Python ints or numpy uint64 arrays alike.
+
+    :param module np: numpy module, or None for Python ints
+    :param object w0: bits 0-63
+    :param object w1: bits 64-127
+    :param object w2: bits 128-191
+    :return: dict of fields
+    :rtype: dict
+    """
+
+    def signed(val, bits):
+        if np is None:
+            return val - (1 << bits) if val >> (bits - 1) else val
+        val = val.astype(np.int64)
+        return np.where(val >> (bits - 1), val - (1 << bits), val)
+
+    def uint(val):
+        return val if np is None else np.uint64(val)
+
+    def sint(val):
+        return val if np is None else val.astype(np.int64)
+
+    if np is None:
+        psrstd = PSR_STD[w2 & 0xF]
+    else:
+        psrstd = np.asarray(PSR_STD)[(w2 & uint(0xF)).astype(np.intp)]
+    return {
+        "status": w0 & uint(0xFFFFFFFF),
+        "prn": sint((w2 >> uint(8)) & uint(0xFF)),
+        "psr": ((w0 >> uint(60)) | ((w1 & uint(0xFFFFFFFF)) << uint(4))) / 128,
+        "adr": signed(w1 >> uint(32), 32) / 256,
+        "psrstd": psrstd,
+        "adrstd": (((w2 >> uint(4)) & uint(0xF)) + uint(1)) / 512,
+        "dopp": signed((w0 >> uint(32)) & uint(0xFFFFFFF), 28) / 256,
+        "cn0": sint((w2 >> uint(37)) & uint(0x1F)) + 20,
+        "locktime": ((w2 >> uint(16)) & uint(0x1FFFFF)) / 32,
+        "glofreq": sint((w2 >> uint(42)) & uint(0x3F)) - 7,
+    }
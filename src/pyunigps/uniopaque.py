@@ -0,0 +1,308 @@
+"""
+UNIOpaqueMessage class.
+
+Lightweight record of a UNI message whose payload cannot (yet) be
+decoded, i.e. an unrecognised msgid or a msgid whose payload definition
+is still empty. Returned by UNIReader in place of a UNIMessage if
+'opaque' is True.
+
+The record holds only a reference to the raw frame. Header fields are
+decoded on access, the payload is exposed as a zero-copy memoryview and
+no per-byte work is done unless decode() is called - e.g. once a payload
+definition has been registered via the REGISTRY.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+from pyunigps.unihelpers import timeinfo2vals
+from pyunigps.unimessage import HEADER_FIELDS, UNIMessage
+from pyunigps.unitypes_core import GET, UNI_MSGIDS
+
+
+class UNIOpaqueMessage:
+    """
+    UNIOpaqueMessage class.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: bytes):
+        """
+        Constructor.
+
+        :param bytes raw: complete raw UNI frame
+        """
+
+        self._raw = raw
+
+    def _uint(self, start: int, end: int) -> int:
+        """
+        Get unsigned little-endian header field.
+
+        :param int start: start offset in frame
+        :param int end: end offset in frame
+        :return: value
+        :rtype: int
+        """
+
+        return int.from_bytes(self._raw[start:end], "little")
+
+    def decode(self, parsebitfield: bool = True) -> UNIMessage:
+        """
+        Decode message using the current payload definition.
+
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :return: UNIMessage
+        :rtype: UNIMessage
+        :raises: UNITypeError if payload is inconsistent with definition
+        """
+
+        timeref, timestatus, wno, tow, version, leapsecond, delay = timeinfo2vals(
+            self._raw[8:24]
+        )
+        return UNIMessage(
+            msgid=self.msgid,
+            length=self.length,
+            cpuidle=self.cpuidle,
+            timeref=timeref,
+            timestatus=timestatus,
+            wno=wno,
+            tow=tow,
+            version=version,
+            leapsecond=leapsecond,
+            delay=delay,
+            checksum=self.checksum,
+            msgmode=GET,
+            parsebitfield=parsebitfield,
+            payload=bytes(self.payload),
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Return message as dict of identity, header attributes and raw payload.
+
+        :return: message attributes
+        :rtype: dict
+        """
+
+        dic = {"identity": self.identity}
+        for key in HEADER_FIELDS:
+            dic[key] = getattr(self, key)
+        dic["payload"] = bytes(self.payload)
+        return dic
+
+    def to_json(self) -> str:
+        """
+        Return message as compact single line JSON string (see to_dict()),
+        with payload as hexadecimal string.
+
+        :return: JSON string
+        :rtype: str
+        """
+
+        from pyunigps.uniexport import (  # pylint: disable=import-outside-toplevel
+            JSON_ENCODER,
+        )
+
+        return JSON_ENCODER.encode(self.to_dict())
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle as raw frame only.
+
+        :return: tuple of (constructor, arguments)
+        :rtype: tuple
+        """
+
+        return (type(self), (bytes(self._raw),))
+
+    def serialize(self) -> bytes:
+        """
+        Serialize message.
+
+        :return: serialized output
+        :rtype: bytes
+        """
+
+        return bytes(self._raw)
+
+    @property
+    def identity(self) -> str:
+        """
+        Returns message identity in plain text form.
+
+        :return: message identity e.g. 'BASEINFO' or '3039-NOMINAL'
+        :rtype: str
+        """
+
+        msgid = self.msgid
+        return UNI_MSGIDS.get(msgid, f"{msgid:02x}-NOMINAL")
+
+    @property
+    def msgid(self) -> int:
+        """
+        Msgid getter.
+
+        :return: msgid
+        :rtype: int
+        """
+
+        return self._raw[4] | (self._raw[5] << 8)
+
+    @property
+    def length(self) -> int:
+        """
+        Payload length getter.
+
+        :return: payload length
+        :rtype: int
+        """
+
+        return self._uint(6, 8)
+
+    @property
+    def cpuidle(self) -> int:
+        """
+        Header cpuidle getter.
+
+        :return: cpuidle
+        :rtype: int
+        """
+
+        return self._raw[3]
+
+    @property
+    def timeref(self) -> int:
+        """
+        Header timeref getter.
+
+        :return: timeref
+        :rtype: int
+        """
+
+        return self._raw[8]
+
+    @property
+    def timestatus(self) -> int:
+        """
+        Header timestatus getter.
+
+        :return: timestatus
+        :rtype: int
+        """
+
+        return self._raw[9]
+
+    @property
+    def wno(self) -> int:
+        """
+        Header week number getter.
+
+        :return: week number
+        :rtype: int
+        """
+
+        return self._uint(10, 12)
+
+    @property
+    def tow(self) -> int:
+        """
+        Header time of week getter.
+
+        :return: time of week in ms
+        :rtype: int
+        """
+
+        return self._uint(12, 16)
+
+    @property
+    def version(self) -> int:
+        """
+        Header version getter.
+
+        :return: version
+        :rtype: int
+        """
+
+        return self._uint(16, 20)
+
+    @property
+    def leapsecond(self) -> int:
+        """
+        Header leapsecond getter.
+
+        :return: leapsecond
+        :rtype: int
+        """
+
+        return self._raw[21]
+
+    @property
+    def delay(self) -> int:
+        """
+        Header delay getter.
+
+        :return: delay
+        :rtype: int
+        """
+
+        return self._uint(22, 24)
+
+    @property
+    def checksum(self) -> bytes:
+        """
+        CRC checksum getter.
+
+        :return: CRC as bytes
+        :rtype: bytes
+        """
+
+        return bytes(self._raw[-4:])
+
+    @property
+    def payload(self) -> memoryview:
+        """
+        Payload getter - returns zero-copy view of the raw payload.
+
+        :return: raw payload
+        :rtype: memoryview
+        """
+
+        return memoryview(self._raw)[24:-4]
+
+    @property
+    def msgmode(self) -> int:
+        """
+        Message mode getter.
+
+        :return: msgmode (always GET)
+        :rtype: int
+        """
+
+        return GET
+
+    def __str__(self) -> str:
+        """
+        Human readable representation.
+
+        :return: human readable representation
+        :rtype: str
+        """
+
+        return f"<UNI({self.identity}, opaque, length={self.length})>"
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        eval(repr(obj)) = obj
+
+        :return: machine readable representation
+        :rtype: str
+        """
+
+        return f"UNIOpaqueMessage({bytes(self._raw)!r})"
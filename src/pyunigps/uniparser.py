@@ -0,0 +1,339 @@
+"""
+UNIParser class.
+
+Push-based (sans-IO) counterpart to UNIReader. Rather than pulling bytes
+from a stream, the caller feeds arbitrary chunks of data as they arrive
+(e.g. from an asyncio Protocol, a serial port callback or a shared memory
+ring) and receives every complete UNI, NMEA or RTCM3 message in the data
+so far::
+
+    parser = UNIParser(protfilter=UNI_PROTOCOL)
+    for raw_data, parsed_data in parser.feed(chunk):
+        ...
+
+Framing follows UNIReader byte for byte, and the same protocol filter,
+frame filter, validation, cache and error handling options apply, so
+feeding a stream in chunks of any size yields the same messages as
+reading it with UNIReader. An incomplete frame at the end of a chunk is
+retained in an internal buffer until the rest of it is fed; consumed
+data is discarded from the front of the buffer without re-copying the
+remainder. The parser does no I/O and starts no threads.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments
+
+import re
+
+from pyunigps.exceptions import UNIParseError, UNIStreamError
+from pyunigps.unireader import (
+    NMEA_HDR,
+    UNI_ERRORS,
+    UNIReader,
+    nmea_backend,
+    rtcm_backend,
+)
+from pyunigps.unitypes_core import (
+    ERR_LOG,
+    ERR_RAISE,
+    GET,
+    NMEA_PROTOCOL,
+    POLL,
+    RTCM3_PROTOCOL,
+    SET,
+    SETPOLL,
+    UNI_HDR,
+    UNI_PROTOCOL,
+    VALCKSUM,
+)
+
+SYNC = re.compile(b"[\xaa\x24\xd3]")
+"""First byte of UNI, NMEA or RTCM3 message"""
+UNI_HDRLEN = 24
+"""UNI header length including timeinfo"""
+
+
+class UNIParser:
+    """
+    UNIParser class.
+    """
+
+    def __init__(
+        self,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        protfilter: int = NMEA_PROTOCOL | UNI_PROTOCOL | RTCM3_PROTOCOL,
+        quitonerror: int = ERR_LOG,
+        parsebitfield: bool = True,
+        parsing: bool = True,
+        errorhandler: object = None,
+        cache: object = None,
+        framefilter: object = None,
+        opaque: bool = False,
+        projection: dict | None = None,
+    ):
+        """Constructor.
+
+        :param int msgmode: 0=GET, 1=SET, 2=POLL, 3=SETPOLL (0)
+        :param int validate: VALCKSUM (1) = Validate checksum,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param int protfilter: NMEA_PROTOCOL (1), UNI_PROTOCOL (2), RTCM3_PROTOCOL (4),
+            Can be OR'd (7)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
+        :param object errorhandler: error handling object or function (None)
+        :param object cache: optional UNIPayloadCache of decoded payloads (None)
+        :param object framefilter: optional callable(raw_data) -> bool; UNI
+            frames for which it returns False are discarded before parsing
+            e.g. UNIChangeFilter (None)
+        :param bool opaque: return UNI GET messages with no payload definition
+            as lightweight UNIOpaqueMessage records (False)
+        :param dict | None projection: dict of msgid (as int or name): tuple of
+            names of the only attributes to decode initially (None)
+        :raises: UNIStreamError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments
+
+        self._protfilter = protfilter
+        self._quitonerror = quitonerror
+        self._errorhandler = errorhandler
+        self._validate = validate
+        self._parsebf = parsebitfield
+        self._msgmode = msgmode
+        self._parsing = parsing
+        self._cache = cache
+        self._framefilter = framefilter
+        self._opaque = opaque
+        self._projection = projection
+        self._nmeareader = None
+        self._rtcmreader = None
+        self._errors = UNI_ERRORS
+        self._buf = bytearray()
+        self._ready = []
+
+        if self._msgmode not in (GET, SET, POLL, SETPOLL):
+            raise UNIStreamError(
+                f"Invalid stream mode {self._msgmode} - must be 0, 1, 2 or 3"
+            )
+
+    def feed(self, data: bytes) -> list:
+        """
+        Add data to the parser and return all messages now complete.
+
+        'quitonerror' determines whether to raise, log or ignore parsing
+        errors. If an error is raised, the offending message has already
+        been consumed, so parsing can be resumed with feed(b""), which
+        also returns any messages completed before the error.
+
+        :param bytes data: next chunk of data (bytes, bytearray or memoryview)
+        :return: list of tuples of (raw_data as bytes, parsed_data)
+        :rtype: list
+        :raises: Exception (if quitonerror = ERR_RAISE and data is invalid)
+        """
+
+        buf = self._buf
+        buf += data
+        msgs = self._ready
+        self._ready = []
+        pos = 0
+        try:
+            while True:
+                mat = SYNC.search(buf, pos)
+                if mat is None:  # discard everything scanned
+                    pos = len(buf)
+                    break
+                start = mat.start()
+                pos, parse = self._frame(buf, start)
+                if parse is None:  # incomplete or discarded
+                    if pos is None:  # wait for more data
+                        pos = start
+                        break
+                    continue
+                try:
+                    msg = parse(bytes(buf[start:pos]))
+                except self._errors as err:
+                    self._handle(err)
+                    continue
+                if msg is not None:
+                    msgs.append(msg)
+        except Exception:
+            self._ready = msgs  # returned by next feed()
+            raise
+        finally:
+            del buf[:pos]
+        return msgs
+
+    def _frame(self, buf: bytearray, pos: int) -> tuple:
+        """
+        Find end of message starting at buffer position.
+
+        :param bytearray buf: buffer
+        :param int pos: position of first byte of candidate message
+        :return: tuple of (end position or None if incomplete,
+            parse method or None if message is to be discarded)
+        :rtype: tuple
+        """
+
+        avail = len(buf) - pos
+        if avail < 2:
+            return None, None
+        bytehdr = bytes(buf[pos : pos + 2])
+        if bytehdr == UNI_HDR[0:2]:
+            if avail < 3:
+                return None, None
+            if buf[pos + 2] != UNI_HDR[2]:
+                return pos + 3, None
+            if avail < UNI_HDRLEN:
+                return None, None
+            end = pos + UNI_HDRLEN + (buf[pos + 6] | (buf[pos + 7] << 8)) + 4
+            parse = self._parse_uni
+            protocol = UNI_PROTOCOL
+        elif bytehdr in NMEA_HDR:
+            end = buf.find(b"\x0a", pos + 2) + 1
+            if end == 0:
+                return None, None
+            parse = self._parse_nmea
+            protocol = NMEA_PROTOCOL
+        elif bytehdr[0] == 0xD3 and (bytehdr[1] & ~0x03) == 0:
+            if avail < 3:
+                return None, None
+            end = pos + 3 + (buf[pos + 2] | (bytehdr[1] << 8)) + 3
+            parse = self._parse_rtcm3
+            protocol = RTCM3_PROTOCOL
+        else:
+            return pos + 2, self._parse_unknown
+        if end > len(buf):
+            return None, None
+        if not self._protfilter & protocol:
+            return end, None
+        return end, parse
+
+    @staticmethod
+    def _parse_unknown(raw_data: bytes):
+        """
+        Reject unrecognised protocol header.
+
+        :param bytes raw_data: header bytes
+        :raises: UNIParseError
+        """
+
+        raise UNIParseError(f"Unknown protocol header {raw_data}.")
+
+    def _parse_uni(self, raw_data: bytes) -> tuple:
+        """
+        Parse UNI message.
+
+        :param bytes raw_data: raw UNI message
+        :return: tuple of (raw_data, parsed_data), or None if discarded
+            by frame filter
+        :rtype: tuple
+        """
+
+        if self._framefilter is not None and not self._framefilter(raw_data):
+            return None
+        if not self._parsing:
+            return (raw_data, None)
+        return (
+            raw_data,
+            UNIReader.parse(
+                raw_data,
+                msgmode=self._msgmode,
+                validate=self._validate,
+                parsebitfield=self._parsebf,
+                cache=self._cache,
+                opaque=self._opaque,
+                projection=self._projection,
+            ),
+        )
+
+    def _parse_nmea(self, raw_data: bytes) -> tuple:
+        """
+        Parse NMEA message (using pynmeagps library).
+
+        :param bytes raw_data: raw NMEA message
+        :return: tuple of (raw_data, parsed_data)
+        :rtype: tuple
+        """
+
+        if not self._parsing:
+            return (raw_data, None)
+        if self._nmeareader is None:
+            self._nmeareader, errors = nmea_backend()
+            self._errors += errors
+        return (
+            raw_data,
+            self._nmeareader.parse(
+                raw_data,
+                validate=self._validate,
+                msgmode=self._msgmode,
+            ),
+        )
+
+    def _parse_rtcm3(self, raw_data: bytes) -> tuple:
+        """
+        Parse RTCM3 message (using pyrtcm library).
+
+        :param bytes raw_data: raw RTCM3 message
+        :return: tuple of (raw_data, parsed_data)
+        :rtype: tuple
+        """
+
+        if not self._parsing:
+            return (raw_data, None)
+        if self._rtcmreader is None:
+            self._rtcmreader, errors = rtcm_backend()
+            self._errors += errors
+        return (
+            raw_data,
+            self._rtcmreader.parse(
+                raw_data,
+                validate=self._validate,
+                labelmsm=1,
+            ),
+        )
+
+    def _handle(self, err: Exception):
+        """
+        Handle error.
+
+        :param Exception err: error
+        :raises: Exception if quitonerror = ERR_RAISE (2)
+        """
+
+        if self._quitonerror == ERR_RAISE:
+            raise err from err
+        if self._quitonerror == ERR_LOG:
+            if self._errorhandler is None:
+                from logging import (  # pylint: disable=import-outside-toplevel
+                    getLogger,
+                )
+
+                getLogger(__name__).error(err)
+            else:
+                self._errorhandler(err)
+
+    def reset(self):
+        """
+        Discard any buffered partial message.
+        """
+
+        self._buf.clear()
+        self._ready = []
+
+    @property
+    def buffered(self) -> int:
+        """
+        Getter for number of bytes retained pending a complete message.
+
+        :return: buffered byte count
+        :rtype: int
+        """
+
+        return len(self._buf)
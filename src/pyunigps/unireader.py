@@ -28,6 +28,9 @@ Returns both the raw binary data (as bytes) and the parsed data
 - 'protfilter' governs which protocols (NMEA, UNI or RTCM3) are processed
 - 'quitonerror' governs how errors are handled
 - 'parsing' governs whether messages are fully parsed
+- 'framefilter' can discard UNI frames before they are parsed
+- 'nonblocking' retains partial frames across short reads (e.g. timeouts)
+- 'flyweight' returns a reusable view per msgid rather than a new UNIMessage
 
 Created on 26 Jan 2026
 
@@ -38,13 +41,8 @@ Created on 26 Jan 2026
 
 # pylint: disable=too-many-positional-arguments
 
-from logging import getLogger
-from socket import socket
 
-import pynmeagps.exceptions as nme
-import pyrtcm.exceptions as rte
-from pynmeagps import NMEA_HDR, NMEAReader, SocketWrapper
-from pyrtcm import RTCMReader
+import sys
 
 from pyunigps.exceptions import (
     UNIMessageError,
@@ -56,9 +54,12 @@ from pyunigps.unihelpers import (
     bytes2val,
     calc_crc,
     escapeall,
+    isvalid_checksum,
     val2bytes,
 )
 from pyunigps.unimessage import UNIMessage
+from pyunigps.uniopaque import UNIOpaqueMessage
+from pyunigps.uniregistry import REGISTRY
 from pyunigps.unitypes_core import (
     ERR_LOG,
     ERR_RAISE,
@@ -72,9 +73,56 @@ from pyunigps.unitypes_core import (
     U2,
     U4,
     UNI_HDR,
+    UNI_MSGIDS,
     UNI_PROTOCOL,
     VALCKSUM,
 )
+from pyunigps.uniview import UNIMessageView
+
+NMEA_HDR = frozenset(b"$" + bytes((talker,)) for talker in b"ABCDEFGHILMNPRSTUVWYZ")
+"""NMEA headers (as pynmeagps.NMEA_HDR, which is not imported until needed)"""
+UNI_ERRORS = (UNIMessageError, UNITypeError, UNIParseError, UNIStreamError)
+"""UNI parsing errors"""
+
+
+def nmea_backend() -> tuple:
+    """
+    Import pynmeagps NMEA parser on first use.
+
+    :return: tuple of (NMEAReader class, tuple of NMEA parsing errors)
+    :rtype: tuple
+    """
+
+    # pylint: disable=import-outside-toplevel
+    import pynmeagps.exceptions as nme
+    from pynmeagps import NMEAReader
+
+    return NMEAReader, (
+        nme.NMEAMessageError,
+        nme.NMEATypeError,
+        nme.NMEAParseError,
+        nme.NMEAStreamError,
+    )
+
+
+def rtcm_backend() -> tuple:
+    """
+    Import pyrtcm RTCM3 parser on first use.
+
+    :return: tuple of (RTCMReader class, tuple of RTCM3 parsing errors)
+    :rtype: tuple
+    """
+
+    # pylint: disable=import-outside-toplevel
+    import pyrtcm.exceptions as rte
+    from pyrtcm import RTCMReader
+
+    return RTCMReader, (
+        rte.RTCMMessageError,
+        rte.RTCMParseError,
+        rte.RTCMStreamError,
+        rte.RTCMTypeError,
+    )
 
 
 class UNIReader:
@@ -93,6 +141,12 @@ class UNIReader:
         bufsize: int = 4096,
         parsing: bool = True,
         errorhandler: object = None,
+        cache: object = None,
+        framefilter: object = None,
+        opaque: bool = False,
+        projection: dict | None = None,
+        nonblocking: bool = False,
+        flyweight: bool = False,
     ):
         """Constructor.
 
@@ -108,11 +162,34 @@ class UNIReader:
         :param int bufsize: socket recv buffer size (4096)
         :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
         :param object errorhandler: error handling object or function (None)
+        :param object cache: optional UNIPayloadCache of decoded payloads (None)
+        :param object framefilter: optional callable(raw_data) -> bool; UNI
+            frames for which it returns False are discarded before parsing
+            e.g. UNIChangeFilter (None)
+        :param bool opaque: return UNI GET messages with no payload definition
+            as lightweight UNIOpaqueMessage records (False)
+        :param dict | None projection: dict of msgid (as int or name): tuple of
+            names of the only attributes to decode initially, all others being
+            decoded on first access e.g. {"OBSVM": ("numobs", "prn")} (None)
+        :param bool nonblocking: True = a short read (e.g. serial timeout or
+            non-blocking socket) returns (None, None) and the partial message
+            is completed on a subsequent read(), False = a short read raises
+            UNIStreamError (False)
+        :param bool flyweight: True = return UNI GET messages as a reusable
+            UNIMessageView per msgid, which is re-bound to each new frame and
+            is only valid until the next read(); 'cache', 'opaque' and
+            'projection' are ignored (False)
         :raises: UNIStreamError (if mode is invalid)
         """
         # pylint: disable=too-many-arguments
 
-        if isinstance(datastream, socket):
+        # a socket cannot exist unless the socket module is already imported
+        socket = sys.modules.get("socket")
+        if socket is not None and isinstance(datastream, socket.socket):
+            from pynmeagps import (  # pylint: disable=import-outside-toplevel
+                SocketWrapper,
+            )
+
             self._stream = SocketWrapper(datastream, bufsize=bufsize)
         else:
             self._stream = datastream
@@ -123,7 +200,19 @@ class UNIReader:
         self._parsebf = parsebitfield
         self._msgmode = msgmode
         self._parsing = parsing
-        self._logger = getLogger(__name__)
+        self._cache = cache
+        self._framefilter = framefilter
+        self._opaque = opaque
+        self._projection = projection
+        self._nonblocking = nonblocking
+        self._flyweight = flyweight
+        self._views = {}  # msgid: UNIMessageView
+        self._pending = bytearray()  # bytes retained from short read
+        self._frame = bytearray()  # bytes read for current message
+        # NMEA and RTCM3 parsers are imported on first use
+        self._nmeareader = None
+        self._rtcmreader = None
+        self._errors = UNI_ERRORS
 
         if self._msgmode not in (GET, SET, POLL, SETPOLL):
             raise UNIStreamError(
@@ -157,6 +246,10 @@ class UNIReader:
 
         'quitonerror' determines whether to raise, log or ignore parsing errors.
 
+        If 'nonblocking' is True and the stream returns fewer bytes than
+        required for a complete message, (None, None) is returned and the
+        bytes read so far are retained for the next read().
+
         :return: tuple of (raw_data as bytes, parsed_data as UNIMessage)
         :rtype: tuple
         :raises: Exception (if invalid or unrecognised protocol in data stream)
@@ -168,6 +261,7 @@ class UNIReader:
 
                 raw_data = None
                 parsed_data = None
+                self._frame.clear()
                 byte1 = self._read_bytes(1)  # read the first byte
                 # if not UNI, NMEA or RTCM3, discard and continue
                 if byte1 not in (b"\xaa", b"\x24", b"\xd3"):
@@ -181,6 +275,8 @@ class UNIReader:
                     if bytehdr != UNI_HDR:
                         continue
                     raw_data, parsed_data = self._parse_uni(bytehdr)
+                    if raw_data is None:  # discarded by frame filter
+                        continue
                     # if protocol filter passes UNI, return message,
                     # otherwise discard and continue
                     if self._protfilter & UNI_PROTOCOL:
@@ -212,20 +308,7 @@ class UNIReader:
 
             except EOFError:
                 return (None, None)
-            except (
-                UNIMessageError,
-                UNITypeError,
-                UNIParseError,
-                UNIStreamError,
-                nme.NMEAMessageError,
-                nme.NMEATypeError,
-                nme.NMEAParseError,
-                nme.NMEAStreamError,
-                rte.RTCMMessageError,
-                rte.RTCMParseError,
-                rte.RTCMStreamError,
-                rte.RTCMTypeError,
-            ) as err:
+            except self._errors as err:
                 if self._quitonerror:
                     self._do_error(err)
                 continue
@@ -237,33 +320,62 @@ class UNIReader:
         Parse remainder of UNI message.
 
         :param bytes hdr: UNI header (b'\\xaa\\x44\\xb5')
-        :return: tuple of (raw_data as bytes, parsed_data as UNIMessage or None)
+        :return: tuple of (raw_data as bytes, parsed_data as UNIMessage or None),
+            or (None, None) if discarded by frame filter
         :rtype: tuple
         """
 
         # read the rest of the UNI message from the buffer
+        # cpuidle, msgid, length, timeinfo
         byten = self._read_bytes(21)
-        cpuidle = byten[0:1]
-        msgid = byten[1:3]
-        lenb = byten[3:5]
-        timeinfo = byten[5:21]
-        leni = int.from_bytes(lenb, "little", signed=False)
-        byten = self._read_bytes(leni + 4)
-        plb = byten[0:leni]
-        crc = byten[leni : leni + 4]
-        raw_data = hdr + cpuidle + msgid + lenb + timeinfo + plb + crc
+        leni = byten[3] | (byten[4] << 8)
+        # payload, crc
+        raw_data = hdr + byten + self._read_bytes(leni + 4)
+        if (
+            self._framefilter is not None
+            and self._protfilter & UNI_PROTOCOL
+            and not self._framefilter(raw_data)
+        ):
+            return (None, None)
         # only parse if we need to (filter passes UNI)
         if (self._protfilter & UNI_PROTOCOL) and self._parsing:
+            if self._flyweight and self._msgmode == GET:
+                return (raw_data, self._view(raw_data))
             parsed_data = self.parse(
                 raw_data,
                 msgmode=self._msgmode,
                 validate=self._validate,
                 parsebitfield=self._parsebf,
+                cache=self._cache,
+                opaque=self._opaque,
+                projection=self._projection,
             )
         else:
             parsed_data = None
         return (raw_data, parsed_data)
 
+    def _view(self, raw_data: bytes) -> UNIMessageView:
+        """
+        Re-bind reusable view for msgid to raw UNI frame.
+
+        :param bytes raw_data: raw UNI frame
+        :return: view
+        :rtype: UNIMessageView
+        :raises: UNIParseError if checksum is invalid
+        """
+
+        if self._validate & VALCKSUM and not isvalid_checksum(raw_data):
+            raise UNIParseError(
+                f"Message checksum {escapeall(raw_data[-4:])} invalid"
+                f" - should be {escapeall(calc_crc(memoryview(raw_data)[:-4]))}"
+            )
+        msgid = raw_data[4] | (raw_data[5] << 8)
+        view = self._views.get(msgid)
+        if view is None:
+            view = self._views[msgid] = UNIMessageView(raw_data)
+            return view
+        return view.bind(raw_data)
+
     def _parse_nmea(self, hdr: bytes) -> tuple:
         """
         Parse remainder of NMEA message (using pynmeagps library).
@@ -278,8 +390,11 @@ class UNIReader:
         raw_data = hdr + byten
         # only parse if we need to (filter passes NMEA)
         if (self._protfilter & NMEA_PROTOCOL) and self._parsing:
+            if self._nmeareader is None:
+                self._nmeareader, errors = nmea_backend()
+                self._errors += errors
             # invoke pynmeagps parser
-            parsed_data = NMEAReader.parse(
+            parsed_data = self._nmeareader.parse(
                 raw_data,
                 validate=self._validate,
                 msgmode=self._msgmode,
@@ -304,8 +419,11 @@ class UNIReader:
         raw_data = hdr + hdr3 + payload + crc
         # only parse if we need to (filter passes RTCM)
         if (self._protfilter & RTCM3_PROTOCOL) and self._parsing:
+            if self._rtcmreader is None:
+                self._rtcmreader, errors = rtcm_backend()
+                self._errors += errors
             # invoke pyrtcm parser
-            parsed_data = RTCMReader.parse(
+            parsed_data = self._rtcmreader.parse(
                 raw_data,
                 validate=self._validate,
                 labelmsm=1,
@@ -324,6 +442,8 @@ class UNIReader:
         :raises: UNIStreamError if stream ends prematurely
         """
 
+        if self._nonblocking:
+            return self._read_partial(size)
         data = self._stream.read(size)
         if len(data) == 0:  # EOF
             raise EOFError()
@@ -343,6 +463,8 @@ class UNIReader:
         :raises: UNIStreamError if stream ends prematurely
         """
 
+        if self._nonblocking:
+            return self._read_partial()
         data = self._stream.readline()  # NMEA protocol is CRLF-terminated
         if len(data) == 0:
             raise EOFError()  # pragma: no cover
@@ -353,6 +475,41 @@ class UNIReader:
             )
         return data
 
+    def _read_partial(self, size: int = 0) -> bytes:
+        """
+        Read a specified number of bytes, or bytes until LF (0x0a)
+        terminator, from any retained bytes then from stream. If the read
+        is short, all bytes read for the current message are retained.
+
+        :param int size: number of bytes to read, or 0 to read line
+        :return: bytes
+        :rtype: bytes
+        :raises: EOFError if read is short
+        """
+
+        pending = self._pending
+        if size:
+            if pending:
+                data = bytes(pending[:size])
+                del pending[:size]
+                if len(data) < size:
+                    data += self._stream.read(size - len(data)) or b""
+            else:
+                data = self._stream.read(size) or b""
+            complete = len(data) == size
+        else:
+            eol = pending.find(b"\x0a") + 1
+            data = bytes(pending[: eol or len(pending)])
+            del pending[: len(data)]
+            if not eol:
+                data += self._stream.readline() or b""
+            complete = data[-1:] == b"\x0a"
+        self._frame += data
+        if not complete:
+            self._pending[:0] = self._frame
+            raise EOFError()
+        return data
+
     def _do_error(self, err: Exception):
         """
         Handle error.
@@ -367,7 +524,11 @@ class UNIReader:
             # pass to error handler if there is one
             # else just log
             if self._errorhandler is None:
-                self._logger.error(err)
+                from logging import (  # pylint: disable=import-outside-toplevel
+                    getLogger,
+                )
+
+                getLogger(__name__).error(err)
             else:
                 self._errorhandler(err)
 
@@ -388,16 +549,29 @@ class UNIReader:
         msgmode: int = GET,
         validate: int = VALCKSUM,
         parsebitfield: bool = True,
+        cache: object = None,
+        opaque: bool = False,
+        projection: dict | None = None,
     ) -> object:
         """
         Parse UNI byte stream to UNIMessage object.
 
-        :param bytes message: binary message to parse
+        A memoryview message (e.g. a frame from UNIRingReader) is copied to
+        bytes before parsing, so the parsed message does not reference, and
+        remains valid after, the underlying buffer. For zero-copy access to
+        a frame, bind it to a UNIMessageView instead.
+
+        :param bytes message: binary message to parse (bytes, bytearray or memoryview)
         :param int msgmode: GET (0), SET (1), POLL (2) (0)
         :param int validate: VALCKSUM (1) = Validate checksum,
             VALNONE (0) = ignore invalid checksum (1)
         :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
-        :return: UNIMessage object
+        :param object cache: optional UNIPayloadCache of decoded payloads (None)
+        :param bool opaque: return GET message with no payload definition
+            as UNIOpaqueMessage (False)
+        :param dict | None projection: dict of msgid (as int or name): tuple of
+            names of the only attributes to decode initially (None)
+        :return: UNIMessage object (or UNIOpaqueMessage)
         :rtype: UNIMessage
         :raises: Exception (if data stream contains invalid data or unknown message type)
         """
@@ -407,6 +581,8 @@ class UNIReader:
                 f"Invalid message mode {msgmode} - must be 0, 1, 2 or 3"
             )
 
+        if isinstance(message, memoryview):  # e.g. frame in UNIRingReader
+            message = message.tobytes()
         lenm = len(message)
         hdr = message[0:3]
         cpuidleb = message[3:4]
@@ -415,13 +591,6 @@ class UNIReader:
         msgid = bytes2val(msgidb, U2)
         lenb = message[6:8]
         length = bytes2val(lenb, U2)
-        timeref = bytes2val(message[8:9], U1)
-        timestatus = bytes2val(message[9:10], U1)
-        wno = bytes2val(message[10:12], U2)
-        tow = bytes2val(message[12:16], U4)
-        version = bytes2val(message[16:20], U4)
-        leapsecond = bytes2val(message[21:22], U1)
-        delay = bytes2val(message[22:24], U1)
         crcb = message[lenm - 4 : lenm]
 
         if lenb == b"\x00\x00\x00\x00":
@@ -431,10 +600,7 @@ class UNIReader:
             payload = message[24 : lenm - 4]
             lenp = len(payload)
 
-        if payload is None:
-            crc = calc_crc(message[0:24])
-        else:
-            crc = calc_crc(message[0:24] + payload)
+        crc = calc_crc(memoryview(message)[0 : lenm - 4])
 
         if validate & VALCKSUM:
             if hdr != UNI_HDR:
@@ -458,6 +624,38 @@ class UNIReader:
                         f" invalid - should be {escapeall(crc)}"
                     )
                 )
+        if opaque and msgmode == GET and not REGISTRY.defined(msgid):
+            return UNIOpaqueMessage(message)
+        timeref = bytes2val(message[8:9], U1)
+        timestatus = bytes2val(message[9:10], U1)
+        wno = bytes2val(message[10:12], U2)
+        tow = bytes2val(message[12:16], U4)
+        version = bytes2val(message[16:20], U4)
+        leapsecond = bytes2val(message[21:22], U1)
+        delay = bytes2val(message[22:24], U1)
+        header = {
+            "cpuidle": cpuidle,
+            "timeref": timeref,
+            "timestatus": timestatus,
+            "wno": wno,
+            "tow": tow,
+            "version": version,
+            "leapsecond": leapsecond,
+            "delay": delay,
+            "checksum": crcb,
+        }
+        if cache is not None and cache.cacheable(msgid):
+            key = (msgid, msgmode, parsebitfield, version, bytes(payload or b""))
+            template = cache.get(key)
+            if template is not None:
+                # reuse decoded payload, apply new header fields only
+                return template.reheader(**header)
+        else:
+            key = None
+        if projection is not None:
+            projection = projection.get(
+                msgid, projection.get(UNI_MSGIDS.get(msgid, msgid))
+            )
         parsed_data = UNIMessage(
             msgid=msgid,
             length=length,
@@ -472,6 +670,9 @@ class UNIReader:
             checksum=crcb,
             msgmode=msgmode,
             parsebitfield=parsebitfield,
+            projection=projection,
             payload=payload,
         )
+        if key is not None:
+            cache.put(key, parsed_data)
         return parsed_data
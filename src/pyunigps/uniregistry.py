@@ -0,0 +1,827 @@
+"""
+UNIPayloadRegistry class.
+
+Compiles the UNI_PAYLOADS_GET, UNI_PAYLOADS_SET and UNI_PAYLOADS_POLL
+payload definitions into flat tables of pre-sized attribute entries,
+which UNIMessage walks to decode and encode payloads without
+re-deriving attribute sizes and types from the definition strings on
+every message.
+
+Each definition is validated when it is compiled:
+
+- attribute types are recognised and correctly sized
+- attribute names are unique within the message
+- named group counters are defined before the group which uses them
+- there is at most one 'variable by size' group, which is the last
+  attribute in the payload
+
+Compiled tables can be saved to, and loaded from, a cache file keyed on
+the library and Python versions and a digest of the source definitions,
+so worker processes can start without recompiling. User-defined message types can be added at runtime with
+register(), which replaces any compiled table for that identity.
+
+Where a receiver firmware build changes the layout of a GET message,
+the alternative layout can be registered for a range of header 'version'
+values with register_version(). Layouts are resolved via a small cache
+keyed on (identity, version), so mixed receiver fleets are decoded
+correctly without trial parsing.
+
+Usage::
+
+    from pyunigps import REGISTRY
+
+    REGISTRY.load("/var/cache/pyunigps.reg")  # compiles and saves if stale
+    REGISTRY.register(64000, "MYMSG", {"count": U1, "val": R8})
+    REGISTRY.register_version("MYMSG", {"count": U2, "val": R8}, 2, 5)
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import marshal
+import os
+import struct
+import sys
+
+from pyunigps._version import __version__
+from pyunigps.exceptions import ParameterError, UNITypeError
+from pyunigps.unihelpers import attsiz, atttyp, compile_bitblock
+from pyunigps.unitypes_core import (
+    ATTTYPE,
+    BITS_LSB,
+    BITS_MSB,
+    GET,
+    POLL,
+    SCALROUND,
+    SET,
+    UNI_MSGIDS,
+)
+from pyunigps.unitypes_get import UNI_PAYLOADS_GET, UNI_PAYLOADS_GET_VERSIONED
+from pyunigps.unitypes_poll import UNI_PAYLOADS_POLL
+from pyunigps.unitypes_set import UNI_PAYLOADS_SET
+
+SINGLE = 0
+"""Compiled entry (SINGLE, name, type, size, scale)"""
+GROUP = 1
+"""Compiled entry (GROUP, name, repeats, table, group size or -1)"""
+BITFIELD = 2
+"""Compiled entry (BITFIELD, name, type, size, ((flag, bits), ...))"""
+BITBLOCK = 3
+"""Compiled entry (BITBLOCK, name, bit order, bit table, bits or -1)"""
+
+REGISTRY_FORMAT = 2
+"""Compiled table format, part of cache file key"""
+LAYOUT_CACHE_SIZE = 64
+"""Maximum number of cached (identity, version) layout lookups"""
+FIELD_STRUCTS = {
+    "U001": "<B",
+    "U002": "<H",
+    "U004": "<I",
+    "U008": "<Q",
+    "S001": "<b",
+    "S002": "<h",
+    "S004": "<i",
+    "S008": "<q",
+    "R004": "<f",
+    "R008": "<d",
+}
+"""struct formats for fixed size attribute types"""
+PAYLOADS = {GET: UNI_PAYLOADS_GET, SET: UNI_PAYLOADS_SET, POLL: UNI_PAYLOADS_POLL}
+"""Payload definitions by message mode"""
+
+
+def _cache_key() -> tuple:
+    """
+    Get cache file key.
+
+    :return: tuple of (library version, table format, python version)
+    :rtype: tuple
+    """
+
+    return (__version__, REGISTRY_FORMAT, tuple(sys.version_info[0:2]))
+
+
+def compile_payload(identity: str, pdict: dict) -> tuple:
+    """
+    Validate and compile payload definition.
+
+    :param str identity: message identity (for error reporting)
+    :param dict pdict: payload definition
+    :return: tuple of (compiled table, fixed payload size in bytes or -1)
+    :rtype: tuple
+    :raises: UNITypeError if definition is invalid
+    """
+
+    try:
+        return _compile(pdict, set(), set(), True)
+    except UNITypeError as err:
+        raise UNITypeError(f"Invalid payload definition {identity} - {err}") from err
+
+
+def _compile(pdict: dict, names: set, counters: set, last: bool) -> tuple:
+    """
+    Recursively compile (nested) payload definition.
+
+    :param dict pdict: payload or group definition
+    :param set names: attribute names defined so far in message
+    :param set counters: attribute names usable as group counters
+    :param bool last: definition is at end of payload
+    :return: tuple of (compiled table, fixed size in bytes or -1)
+    :rtype: tuple
+    :raises: UNITypeError if definition is invalid
+    """
+
+    table = []
+    total = 0
+    keys = list(pdict)
+    for i, anam in enumerate(keys):
+        adef = pdict[anam]
+        if isinstance(adef, tuple):
+            numr, gdef = adef
+            if numr in (BITS_MSB, BITS_LSB):
+                _block_names(gdef, names, counters)
+                try:
+                    btable, bits = compile_bitblock(gdef)
+                except (TypeError, ValueError) as err:
+                    raise UNITypeError(f"invalid bit-packed block '{anam}'") from err
+                table.append((BITBLOCK, anam, numr, btable, bits))
+                size = -1 if bits < 0 else (bits + 7) // 8
+            elif isinstance(numr, str) and numr[0] == "X":
+                _unique(anam, names)
+                size = _size(anam, numr)
+                flags = []
+                nbits = 0
+                for key, ftyp in gdef.items():
+                    if key[0:8] != "reserved":
+                        _unique(key, names)
+                    flags.append((key, _size(key, ftyp)))
+                    nbits += flags[-1][1]
+                if nbits > size * 8:
+                    raise UNITypeError(
+                        f"bitfield '{anam}' flags ({nbits} bits) exceed {numr}"
+                    )
+                table.append((BITFIELD, anam, numr, size, tuple(flags)))
+            else:
+                if numr == "None":
+                    if not (last and i == len(keys) - 1):
+                        raise UNITypeError(
+                            f"'variable by size' group '{anam}' must be last attribute"
+                        )
+                elif not isinstance(numr, int) and numr not in counters:
+                    raise UNITypeError(
+                        f"group '{anam}' counter '{numr}' not defined before use"
+                    )
+                sub, gsize = _compile(gdef, names, set(counters), False)
+                if numr == "None" and gsize <= 0:
+                    raise UNITypeError(
+                        f"'variable by size' group '{anam}' must have fixed size"
+                    )
+                table.append((GROUP, anam, numr, sub, gsize))
+                size = numr * gsize if isinstance(numr, int) and gsize >= 0 else -1
+        else:
+            scale = 1
+            atyp = adef
+            if isinstance(adef, list):
+                if len(adef) != 2 or not isinstance(adef[1], (int, float)):
+                    raise UNITypeError(f"invalid scaling for '{anam}'")
+                atyp, scale = adef
+            _unique(anam, names)
+            size = _size(anam, atyp)
+            if atttyp(atyp) in ("U", "S"):
+                counters.add(anam)
+            table.append((SINGLE, anam, atyp, size, scale))
+        total = -1 if total < 0 or size < 0 else total + size
+    return tuple(table), total
+
+
+def _block_names(bdict: dict, names: set, counters: set):
+    """
+    Check attribute names in bit-packed block and record as counters.
+
+    :param dict bdict: bit-packed block definition
+    :param set names: attribute names defined so far in message
+    :param set counters: attribute names usable as group counters
+    :raises: UNITypeError if name is duplicated or counter undefined
+    """
+
+    for anam, adef in bdict.items():
+        if isinstance(adef, tuple):
+            numr, gdict = adef
+            if not isinstance(numr, int) and numr not in counters:
+                raise UNITypeError(
+                    f"group '{anam}' counter '{numr}' not defined before use"
+                )
+            _block_names(gdict, names, set(counters))
+        elif anam[0:8] != "reserved":
+            _unique(anam, names)
+            counters.add(anam)
+
+
+def _unique(anam: str, names: set):
+    """
+    Check attribute name is unique within message.
+
+    :param str anam: attribute name
+    :param set names: attribute names defined so far in message
+    :raises: UNITypeError if name is duplicated
+    """
+
+    if anam in names:
+        raise UNITypeError(f"duplicate attribute name '{anam}'")
+    names.add(anam)
+
+
+def _size(anam: str, atyp: str) -> int:
+    """
+    Check attribute type and get size.
+
+    :param str anam: attribute name
+    :param str atyp: attribute type e.g. 'U004'
+    :return: size in bytes (bits for bitfield flags)
+    :rtype: int
+    :raises: UNITypeError if type is invalid
+    """
+
+    if not isinstance(atyp, str) or atyp[0:1] not in ATTTYPE:
+        raise UNITypeError(f"unknown type {atyp!r} for '{anam}'")
+    size = attsiz(atyp)
+    if size < 1 or (atyp[0] == "R" and size not in (4, 8)):
+        raise UNITypeError(f"invalid size {atyp!r} for '{anam}'")
+    return size
+
+
+def _reader(atyp: str, size: int) -> object:
+    """
+    Get function to read attribute value from buffer, returning the same
+    value as unihelpers.bytes2val().
+
+    :param str atyp: attribute type e.g. 'U004'
+    :param int size: attribute size in bytes
+    :return: function(buffer, offset) -> value
+    :rtype: object
+    """
+
+    fmt = FIELD_STRUCTS.get(atyp)
+    if fmt is not None:
+        unpack = struct.Struct(fmt).unpack_from
+        return lambda buf, pos: unpack(buf, pos)[0]
+    if atyp[0] == "C":
+        return lambda buf, pos: bytes(buf[pos : pos + size]).decode(
+            "utf-8", errors="backslashreplace"
+        )
+    if atyp[0] == "X":
+        return lambda buf, pos: bytes(buf[pos : pos + size])
+    signed = atyp[0] == "S"
+    return lambda buf, pos: int.from_bytes(
+        buf[pos : pos + size], "little", signed=signed
+    )
+
+
+def field_value(buf: bytes, loc: tuple, pos: int) -> object:
+    """
+    Read attribute value from payload buffer, scaled or masked as appropriate.
+
+    :param bytes buf: payload (or frame) buffer
+    :param tuple loc: attribute location, as returned by field_layout()
+    :param int pos: offset of attribute in buffer
+    :return: value
+    :rtype: object
+    """
+
+    _, read, scale, shift, mask = loc[0:5]
+    val = read(buf, pos)
+    if mask:
+        val = (val >> shift) & mask
+    if scale != 1:
+        val = round(val * scale, SCALROUND)
+    return val
+
+
+def field_positions(buf: bytes, loc: tuple, base: int = 0, end: int = -1) -> range:
+    """
+    Get buffer offsets of all repeats of attribute.
+
+    :param bytes buf: payload (or frame) buffer
+    :param tuple loc: attribute location, as returned by field_layout()
+    :param int base: offset of payload in buffer (0)
+    :param int end: offset of end of payload in buffer, -1 = end of buffer (-1)
+    :return: offsets, one per repeat (a single offset if not in a group)
+    :rtype: range
+    """
+
+    offset = base + loc[0]
+    group = loc[5]
+    if group is None:
+        return range(offset, offset + 1)
+    counter, gsize = group
+    if isinstance(counter, int):
+        num = counter
+    elif counter is None:  # 'variable by size'
+        num = ((len(buf) if end < 0 else end) - offset) // gsize
+    else:
+        num = field_value(buf, counter, base + counter[0])
+    return range(offset, offset + num * gsize, gsize)
+
+
+def field_lookup(fields: dict, anam: str) -> tuple:
+    """
+    Look up attribute location by name, which for attributes in a
+    repeating group may be unindexed (e.g. 'prn' = all repeats) or
+    indexed (e.g. 'prn_03' = third repeat only).
+
+    :param dict fields: attribute locations, as returned by field_layout()
+    :param str anam: attribute name
+    :return: tuple of (unindexed name, location or None if not found,
+        1-based repeat index or 0 for all)
+    :rtype: tuple
+    """
+
+    if anam not in fields and anam[-3:-2] == "_" and anam[-2:].isdigit():
+        loc = fields.get(anam[:-3])
+        if loc is not None and loc[5] is not None:
+            return anam[:-3], loc, int(anam[-2:])
+    return anam, fields.get(anam), 0
+
+
+def field_layout(table: tuple) -> dict:
+    """
+    Map payload attribute names to fixed payload offsets.
+
+    Locations are tuples of (offset, reader, scale, shift, mask, group),
+    where group is None for top level attributes or (counter, record size)
+    for attributes in a (non-nested) fixed size repeating group, counter
+    being a fixed number of repeats, the location of the counter attribute,
+    or None if 'variable by size'.
+
+    Attributes inside bit-packed blocks or nested groups, or following a
+    variable size attribute, are omitted.
+
+    :param tuple table: compiled payload definition
+    :return: dict of attribute locations
+    :rtype: dict
+    """
+
+    fields = {}
+
+    def add(entries: tuple, offset: int, group: tuple | None):
+        for entry in entries:
+            kind, anam = entry[0], entry[1]
+            if kind == SINGLE:
+                _, _, atyp, size, scale = entry
+                fields[anam] = (offset, _reader(atyp, size), scale, 0, 0, group)
+            elif kind == BITFIELD:
+                _, _, atyp, size, flags = entry
+                fields[anam] = (offset, _reader(atyp, size), 1, 0, 0, group)
+                read = _reader(f"U{size:03d}", size)
+                shift = 0
+                for key, bits in flags:
+                    if key[0:8] != "reserved":
+                        fields[key] = (offset, read, 1, shift, (1 << bits) - 1, group)
+                    shift += bits
+            else:  # nested groups and bit-packed blocks
+                return
+            offset += size
+
+    offset = 0
+    for entry in table:
+        kind = entry[0]
+        if kind == GROUP:
+            _, _, numr, gtable, gsize = entry
+            if isinstance(numr, int):
+                counter = numr
+            elif numr == "None":
+                counter = None
+            else:  # counter must be a top level attribute
+                counter = fields.get(numr, False)
+                if counter is not False and counter[5] is not None:
+                    counter = False
+            if counter is not False and gsize > 0:
+                add(gtable, offset, (counter, gsize))
+        elif kind in (SINGLE, BITFIELD):
+            add((entry,), offset, None)
+        size = _entry_size(entry)
+        if size < 0:  # subsequent attributes have no fixed offset
+            break
+        offset += size
+    return fields
+
+
+def field_schema(table: tuple, parsebitfield: bool = True) -> tuple:
+    """
+    Map compiled payload definition to nested schema of attribute names
+    in payload order, as used by UNIMessage.to_dict().
+
+    Schema entries are tuples of (name, repeats, schema) for repeating
+    groups, repeats being a fixed number, a counter attribute name or
+    "None" if 'variable by size', or (name, None, None) for individual
+    attributes. Parsed bitfield flags
+    and bit-packed block fields appear as individual attributes of the
+    enclosing group; reserved flags and fields are omitted.
+
+    :param tuple table: compiled payload definition
+    :param bool parsebitfield: bitfields are parsed into individual flags
+    :return: schema
+    :rtype: tuple
+    """
+
+    schema = []
+    for entry in table:
+        kind, anam = entry[0], entry[1]
+        if kind == SINGLE or (kind == BITFIELD and not parsebitfield):
+            schema.append((anam, None, None))
+        elif kind == BITFIELD:
+            schema.extend(
+                (key, None, None) for key, _ in entry[4] if key[0:8] != "reserved"
+            )
+        elif kind == GROUP:
+            schema.append((anam, entry[2], field_schema(entry[3], parsebitfield)))
+        else:
+            schema.extend(_block_schema(entry[3]))
+    return tuple(schema)
+
+
+def _block_schema(btable: tuple) -> list:
+    """
+    Map compiled bit-packed block table to schema (see field_schema()).
+
+    :param tuple btable: compiled bit-packed block table
+    :return: schema entries
+    :rtype: list
+    """
+
+    schema = []
+    for entry in btable:
+        if entry[0] == "run":
+            schema.extend(
+                (fld[0], None, None) for fld in entry[1] if fld[0][0:8] != "reserved"
+            )
+        else:
+            _, numr, sub, anam = entry
+            schema.append((anam, numr, tuple(_block_schema(sub))))
+    return schema
+
+
+def _entry_size(entry: tuple) -> int:
+    """
+    Get fixed size of compiled payload entry.
+
+    :param tuple entry: compiled entry
+    :return: size in bytes or -1 if variable
+    :rtype: int
+    """
+
+    kind = entry[0]
+    if kind in (SINGLE, BITFIELD):
+        return entry[3]
+    if kind == GROUP:
+        numr, gsize = entry[2], entry[4]
+        return numr * gsize if isinstance(numr, int) and gsize >= 0 else -1
+    bits = entry[4]
+    return -1 if bits < 0 else (bits + 7) // 8
+
+
+class UNIPayloadRegistry:
+    """
+    UNIPayloadRegistry class.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        # (mode, identity) or (GET, identity, minver): (definition, table, size)
+        self._tables = {}
+        # (identity, version): (layouts, matching layout or None for default)
+        self._layouts = {}
+        # (mode, identity, version): (table, field locations)
+        self._fields = {}
+        # (mode, identity, version, parsebitfield): (table, schema)
+        self._schemas = {}
+        self.compiled = 0
+
+    def table(self, mode: int, identity: str, version: int = 0) -> tuple:
+        """
+        Get compiled table for message, compiling it on first use or
+        if its definition has been replaced since it was compiled.
+
+        :param int mode: message mode (GET, SET, POLL)
+        :param str identity: message identity e.g. 'VERSION'
+        :param int version: message header version (0)
+        :return: compiled table
+        :rtype: tuple
+        :raises: KeyError if message is not defined,
+            UNITypeError if definition is invalid
+        """
+
+        if mode == GET and identity in UNI_PAYLOADS_GET_VERSIONED:
+            layout = self._layout(identity, version)
+            if layout is not None:
+                return self._compiled((GET, identity, layout[0]), identity, layout[2])
+        return self._compiled((mode, identity), identity, PAYLOADS[mode][identity])
+
+    def layout(self, mode: int, identity: str, version: int = 0) -> dict:
+        """
+        Get fixed payload offsets of message attributes (see field_layout()).
+
+        :param int mode: message mode (GET, SET, POLL)
+        :param str identity: message identity e.g. 'VERSION'
+        :param int version: message header version (0)
+        :return: dict of attribute locations
+        :rtype: dict
+        :raises: KeyError if message is not defined,
+            UNITypeError if definition is invalid
+        """
+
+        table = self.table(mode, identity, version)
+        key = (mode, identity, version)
+        cached = self._fields.get(key)
+        if cached is None or cached[0] is not table:
+            if len(self._fields) >= LAYOUT_CACHE_SIZE:
+                self._fields = {}
+            cached = (table, field_layout(table))
+            self._fields[key] = cached
+        return cached[1]
+
+    def schema(
+        self, mode: int, identity: str, version: int = 0, parsebitfield: bool = True
+    ) -> tuple:
+        """
+        Get nested schema of message attributes (see field_schema()).
+
+        :param int mode: message mode (GET, SET, POLL)
+        :param str identity: message identity e.g. 'VERSION'
+        :param int version: message header version (0)
+        :param bool parsebitfield: bitfields are parsed into individual flags (True)
+        :return: schema
+        :rtype: tuple
+        :raises: KeyError if message is not defined,
+            UNITypeError if definition is invalid
+        """
+
+        table = self.table(mode, identity, version)
+        key = (mode, identity, version, bool(parsebitfield))
+        cached = self._schemas.get(key)
+        if cached is None or cached[0] is not table:
+            if len(self._schemas) >= LAYOUT_CACHE_SIZE:
+                self._schemas = {}
+            cached = (table, field_schema(table, parsebitfield))
+            self._schemas[key] = cached
+        return cached[1]
+
+    def _compiled(self, key: tuple, identity: str, pdict: dict) -> tuple:
+        """
+        Get compiled table for definition, compiling if necessary.
+
+        :param tuple key: table key
+        :param str identity: message identity
+        :param dict pdict: payload definition
+        :return: compiled table
+        :rtype: tuple
+        :raises: UNITypeError if definition is invalid
+        """
+
+        cmp = self._tables.get(key)
+        if cmp is None or cmp[0] is not pdict:
+            cmp = (pdict,) + compile_payload(identity, pdict)
+            self._tables[key] = cmp
+            self.compiled += 1
+        return cmp[1]
+
+    def _layout(self, identity: str, version: int) -> tuple | None:
+        """
+        Get firmware-specific layout for message header version.
+
+        :param str identity: message identity
+        :param int version: message header version
+        :return: (min version, max version, definition) or None for default
+        :rtype: tuple | None
+        """
+
+        layouts = UNI_PAYLOADS_GET_VERSIONED[identity]
+        cached = self._layouts.get((identity, version))
+        if cached is None or cached[0] is not layouts:
+            match = None
+            for layout in layouts:
+                if layout[0] <= version and (layout[1] is None or version <= layout[1]):
+                    match = layout
+                    break
+            if len(self._layouts) >= LAYOUT_CACHE_SIZE:
+                self._layouts = {}
+            cached = (layouts, match)
+            self._layouts[(identity, version)] = cached
+        return cached[1]
+
+    def defined(self, msgid: int) -> bool:
+        """
+        Check if GET message has a (non-empty) payload definition.
+
+        :param int msgid: msgid
+        :return: True if defined
+        :rtype: bool
+        """
+
+        identity = UNI_MSGIDS.get(msgid)
+        return bool(UNI_PAYLOADS_GET.get(identity)) or (
+            identity in UNI_PAYLOADS_GET_VERSIONED
+        )
+
+    def size(self, mode: int, identity: str) -> int:
+        """
+        Get fixed payload size for message.
+
+        :param int mode: message mode (GET, SET, POLL)
+        :param str identity: message identity e.g. 'VERSION'
+        :return: payload size in bytes, or -1 if variable
+        :rtype: int
+        """
+
+        self.table(mode, identity)
+        return self._tables[(mode, identity)][2]
+
+    def digest(self, mode: int = GET) -> str:
+        """
+        Get digest of the library version and all msgids and payload
+        definitions for message mode, including versioned and runtime
+        registered layouts - e.g. to key caches of decoded data.
+
+        :param int mode: message mode (GET, SET, POLL) (GET)
+        :return: hexadecimal digest
+        :rtype: str
+        """
+
+        defs = (
+            _cache_key(),
+            UNI_MSGIDS,
+            PAYLOADS[mode],
+            UNI_PAYLOADS_GET_VERSIONED if mode == GET else None,
+        )
+        import hashlib  # pylint: disable=import-outside-toplevel
+
+        return hashlib.blake2b(repr(defs).encode(), digest_size=16).hexdigest()
+
+    def _digests(self) -> tuple:
+        """
+        Get cache file key, the digests of the definitions for all modes.
+
+        :return: tuple of digests
+        :rtype: tuple
+        """
+
+        return tuple(self.digest(mode) for mode in PAYLOADS)
+
+    def compile_all(self) -> int:
+        """
+        Validate and compile all payload definitions.
+
+        :return: number of definitions
+        :rtype: int
+        :raises: UNITypeError if any definition is invalid
+        """
+
+        count = 0
+        for mode, pdicts in PAYLOADS.items():
+            for identity in pdicts:
+                self.table(mode, identity)
+                count += 1
+        return count
+
+    def register(self, msgid: int, identity: str, pdict: dict, mode: int = GET):
+        """
+        Register new message type, or replace existing definition.
+
+        :param int msgid: msgid
+        :param str identity: message identity
+        :param dict pdict: payload definition
+        :param int mode: message mode (GET, SET, POLL) (GET)
+        :raises: ParameterError if msgid is already assigned to a different
+            identity, UNITypeError if definition is invalid
+        """
+
+        if mode not in PAYLOADS:
+            raise ParameterError(f"Invalid msgmode {mode} - must be 0, 1 or 2")
+        if UNI_MSGIDS.get(msgid, identity) != identity:
+            raise ParameterError(
+                f"msgid {msgid} is already assigned to {UNI_MSGIDS[msgid]}"
+            )
+        cmp = (pdict,) + compile_payload(identity, pdict)
+        UNI_MSGIDS[msgid] = identity
+        PAYLOADS[mode][identity] = pdict
+        self._tables[(mode, identity)] = cmp
+        self.compiled += 1
+
+    def register_version(
+        self, identity: str, pdict: dict, minver: int, maxver: int | None = None
+    ):
+        """
+        Register firmware-specific layout for GET message, used in place
+        of the default definition when the message header version is
+        within range.
+
+        :param str identity: message identity
+        :param dict pdict: payload definition
+        :param int minver: minimum header version
+        :param int | None maxver: maximum header version, None = no limit (None)
+        :raises: ParameterError if version range is invalid or overlaps an
+            existing layout, UNITypeError if definition is invalid
+        """
+
+        if minver < 0 or (maxver is not None and maxver < minver):
+            raise ParameterError(f"Invalid version range {minver} - {maxver}")
+        layouts = UNI_PAYLOADS_GET_VERSIONED.get(identity, ())
+        for lmin, lmax, _ in layouts:
+            if (maxver is None or lmin <= maxver) and (lmax is None or minver <= lmax):
+                raise ParameterError(
+                    f"Version range {minver} - {maxver} overlaps existing "
+                    f"{identity} layout {lmin} - {lmax}"
+                )
+        cmp = (pdict,) + compile_payload(identity, pdict)
+        UNI_PAYLOADS_GET_VERSIONED[identity] = tuple(
+            sorted(layouts + ((minver, maxver, pdict),), key=lambda lay: lay[0])
+        )
+        self._tables[(GET, identity, minver)] = cmp
+        self.compiled += 1
+
+    def invalidate(self, identity: str | None = None, cachefile: str | None = None):
+        """
+        Discard compiled tables, so they are recompiled on next use,
+        and optionally remove stale cache file.
+
+        :param str | None identity: message identity, None = all (None)
+        :param str | None cachefile: cache file to remove (None)
+        """
+
+        self._fields = {}
+        self._schemas = {}
+        if identity is None:
+            self._tables = {}
+            self._layouts = {}
+        else:
+            for key in [key for key in self._tables if key[1] == identity]:
+                del self._tables[key]
+            for key in [key for key in self._layouts if key[0] == identity]:
+                del self._layouts[key]
+        if cachefile is not None and os.path.exists(cachefile):
+            os.remove(cachefile)
+
+    def save(self, cachefile: str):
+        """
+        Save compiled tables to cache file.
+
+        :param str cachefile: path to cache file
+        """
+
+        # default definitions only, versioned layouts are registered at runtime
+        tables = {key: cmp[1:] for key, cmp in self._tables.items() if len(key) == 2}
+        tmp = f"{cachefile}.{os.getpid()}"
+        with open(tmp, "wb") as outfile:
+            marshal.dump((self._digests(), tables), outfile)
+        os.replace(tmp, cachefile)  # atomic for concurrent workers
+
+    def load(self, cachefile: str) -> bool:
+        """
+        Load compiled tables from cache file. If the file is missing,
+        unreadable or was saved by a different library or Python version,
+        or from different payload definitions (e.g. edited or registered
+        at runtime), all definitions are compiled and the file is rewritten.
+
+        Cached tables are only used for definitions which are currently
+        registered under the same identity and mode.
+
+        :param str cachefile: path to cache file
+        :return: True if loaded from cache, False if recompiled
+        :rtype: bool
+        :raises: UNITypeError if any definition is invalid
+        """
+
+        try:
+            with open(cachefile, "rb") as infile:
+                key, tables = marshal.load(infile)  # nosec B302 - own cache file
+            if key != self._digests():
+                raise ValueError("stale cache")
+        except (OSError, EOFError, ValueError, TypeError):
+            self.compile_all()
+            self.save(cachefile)
+            return False
+        for (mode, identity), cmp in tables.items():
+            pdict = PAYLOADS.get(mode, {}).get(identity)
+            if pdict is not None and (mode, identity) not in self._tables:
+                self._tables[(mode, identity)] = (pdict,) + tuple(cmp)
+        return True
+
+    def __len__(self) -> int:
+        """
+        Number of compiled tables.
+
+        :return: number of compiled tables
+        :rtype: int
+        """
+
+        return len(self._tables)
+
+
+REGISTRY = UNIPayloadRegistry()
+"""Default registry used by UNIMessage"""
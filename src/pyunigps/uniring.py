@@ -0,0 +1,449 @@
+"""
+UNIRingWriter and UNIRingReader classes.
+
+Single-writer, multi-consumer ring buffer of raw frames in shared memory
+(multiprocessing.shared_memory), so that one reader process per receiver
+can distribute frames to several analysis processes without pickling or
+copying them through pipes::
+
+    # producer process
+    with UNIRingWriter("gnss0", consumers=2) as ring:
+        ring.record(UNIReader(stream, parsing=False))
+
+    # consumer process
+    with UNIRingReader("gnss0", consumer=1) as ring:
+        for frame in ring:
+            if frame[0:3] == UNI_HDR:
+                parsed = UNIReader.parse(frame)
+
+Each consumer has its own read cursor, held in shared memory so that the
+writer can report its lag and a restarted consumer resumes where it left
+off. The writer never waits for consumers - a consumer which falls more
+than one ring size behind is overrun, and skips to the newest frame,
+counting the overrun and the number of bytes lost.
+
+Frames are returned as zero-copy memoryviews of the ring, which remain
+valid only until the writer laps them. A frame can be bound to a
+UNIMessageView for zero-copy attribute access, and intact() confirms it
+was not overwritten while in use. UNIReader.parse() copies a memoryview
+frame before decoding, so the parsed UNIMessage is independent of the
+ring.
+
+Shared memory layout (little-endian):
+
++----------+---------+----------+-----------+---------+---------+---------+
+|  magic   | version | capacity | consumers | closed  | reserve |  head   |
++==========+=========+==========+===========+=========+=========+=========+
+| b'UNIRNG'| 2 bytes | 8 bytes  |  4 bytes  | 4 bytes | 8 bytes | 8 bytes |
++----------+---------+----------+-----------+---------+---------+---------+
+
+followed by one 8 byte read cursor per consumer, then the ring of
+'capacity' bytes. Records are a 4 byte frame length followed by the
+frame, padded to a multiple of 8 bytes. A record which would straddle the
+end of the ring is preceded by a wrap marker and written at the start.
+
+'reserve' and 'head' are monotonic byte positions. The writer advances
+'reserve' before overwriting any part of the ring and 'head' after the
+new frame is complete, so a consumer at position p has been overrun if
+reserve - capacity > p.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import os
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from time import sleep
+
+from pyunigps.exceptions import ParameterError, UNIStreamError
+
+RING_MAGIC = b"UNIRNG"
+"""Ring buffer magic bytes"""
+RING_VERSION = 1
+"""Ring buffer layout version"""
+RING_HDR = struct.Struct("<6sHQII")
+"""Ring header (magic, version, capacity, consumers, closed)"""
+RINGSIZE = 1 << 24
+"""Default ring capacity in bytes (16 MB)"""
+CLOSED = 20
+"""Offset of writer closed flag"""
+RESERVE = 24
+"""Offset of reserve position"""
+HEAD = 32
+"""Offset of head position"""
+CURSORS = 40
+"""Offset of first consumer read cursor"""
+WRAP = 0xFFFFFFFF
+"""Record length marker for wrap to start of ring"""
+POS = struct.Struct("<Q")
+"""Ring position"""
+LEN = struct.Struct("<I")
+"""Record frame length"""
+
+
+def _record_size(length: int) -> int:
+    """
+    Get size of record for frame, padded to multiple of 8 bytes.
+
+    :param int length: frame length
+    :return: record size
+    :rtype: int
+    """
+
+    return (length + LEN.size + 7) & ~7
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Attach to existing shared memory without taking ownership of it.
+
+    Prior to Python 3.13, attaching registers the shared memory with the
+    process's resource tracker, which would unlink it when the process
+    exits, so it is unregistered again.
+
+    :param str name: shared memory name
+    :return: shared memory
+    :rtype: SharedMemory
+    """
+
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)  # pylint: disable=unexpected-keyword-arg
+    shm = SharedMemory(name)
+    if os.name == "posix":
+        resource_tracker.unregister(
+            shm._name, "shared_memory"  # pylint: disable=protected-access
+        )
+    return shm
+
+
+class UNIRingWriter:
+    """
+    UNIRingWriter class.
+    """
+
+    def __init__(
+        self, name: str | None = None, size: int = RINGSIZE, consumers: int = 1
+    ):
+        """
+        Constructor.
+
+        :param str | None name: shared memory name (None = generate unique name)
+        :param int size: ring capacity in bytes, rounded up to multiple of 8 (16 MB)
+        :param int consumers: number of consumer read cursors (1)
+        :raises: ParameterError if size or consumers is invalid,
+            FileExistsError if named shared memory already exists
+        """
+
+        if consumers < 1:
+            raise ParameterError(f"Invalid consumers {consumers} - must be >= 1")
+        size = (size + 7) & ~7
+        if size < 64:
+            raise ParameterError(f"Invalid ring size {size} - must be >= 64")
+        self._data = CURSORS + POS.size * consumers
+        self._shm = SharedMemory(name, create=True, size=self._data + size)
+        self._buf = self._shm.buf
+        self._buf[0 : self._data] = bytes(self._data)
+        RING_HDR.pack_into(self._buf, 0, RING_MAGIC, RING_VERSION, size, consumers, 0)
+        self._capacity = size
+        self._consumers = consumers
+        self._head = 0
+        self._count = 0
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def write(self, raw: bytes):
+        """
+        Write single frame to ring, overwriting the oldest frames if
+        necessary.
+
+        :param bytes raw: raw frame
+        :raises: ParameterError if frame is larger than ring
+        """
+
+        buf = self._buf
+        capacity = self._capacity
+        length = len(raw)
+        need = _record_size(length)
+        if need > capacity:
+            raise ParameterError(
+                f"Frame length {length} exceeds ring capacity {capacity}"
+            )
+        head = self._head
+        offset = head % capacity
+        skip = capacity - offset if offset + need > capacity else 0
+        POS.pack_into(buf, RESERVE, head + skip + need)
+        if skip:
+            LEN.pack_into(buf, self._data + offset, WRAP)
+            head += skip
+            offset = 0
+        start = self._data + offset
+        LEN.pack_into(buf, start, length)
+        buf[start + LEN.size : start + LEN.size + length] = raw
+        self._head = head + need
+        POS.pack_into(buf, HEAD, self._head)
+        self._count += 1
+
+    def record(self, reader, limit: int = 0) -> int:
+        """
+        Write frames from UNIReader until end of stream or limit reached.
+
+        :param UNIReader reader: reader (typically with parsing=False)
+        :param int limit: maximum number of frames to write, 0 = unlimited (0)
+        :return: number of frames written
+        :rtype: int
+        """
+
+        count = 0
+        while limit == 0 or count < limit:
+            raw, _ = reader.read()
+            if raw is None:
+                break
+            self.write(raw)
+            count += 1
+        return count
+
+    def lag(self, consumer: int) -> int:
+        """
+        Get number of bytes written but not yet read by consumer. A lag
+        greater than the ring capacity means the consumer will be overrun.
+
+        :param int consumer: consumer index
+        :return: lag in bytes
+        :rtype: int
+        :raises: ParameterError if consumer is invalid
+        """
+
+        if not 0 <= consumer < self._consumers:
+            raise ParameterError(
+                f"Invalid consumer {consumer} - must be 0 to {self._consumers - 1}"
+            )
+        return self._head - POS.unpack_from(self._buf, CURSORS + POS.size * consumer)[0]
+
+    def close(self, unlink: bool = True):
+        """
+        Mark ring as closed, so consumers stop iterating once they have
+        read all remaining frames, and release shared memory.
+
+        :param bool unlink: remove shared memory name, so no further
+            consumers can attach (True)
+        """
+
+        if self._buf is None:
+            return
+        LEN.pack_into(self._buf, CLOSED, 1)
+        self._buf.release()
+        self._buf = None
+        self._shm.close()
+        if unlink:
+            if os.name == "posix":  # may have been unregistered by a consumer
+                resource_tracker.register(
+                    self._shm._name, "shared_memory"  # pylint: disable=protected-access
+                )
+            self._shm.unlink()
+
+    @property
+    def name(self) -> str:
+        """
+        Getter for shared memory name, to pass to consumers.
+
+        :return: name
+        :rtype: str
+        """
+
+        return self._shm.name
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of frames written.
+
+        :return: frame count
+        :rtype: int
+        """
+
+        return self._count
+
+
+class UNIRingReader:
+    """
+    UNIRingReader class.
+    """
+
+    def __init__(self, name: str, consumer: int = 0, interval: float = 0.001):
+        """
+        Constructor.
+
+        :param str name: shared memory name of ring
+        :param int consumer: consumer index, unique for each concurrent consumer (0)
+        :param float interval: polling interval in seconds when iterating (0.001)
+        :raises: ParameterError if consumer is invalid, UNIStreamError if
+            shared memory is not a ring, FileNotFoundError if it does not exist
+        """
+
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        self._frame = None
+        magic, version, capacity, consumers, _ = RING_HDR.unpack_from(self._buf, 0)
+        if magic != RING_MAGIC or version != RING_VERSION:
+            self.close()
+            raise UNIStreamError(f"Invalid ring header {magic} version {version}")
+        if not 0 <= consumer < consumers:
+            self.close()
+            raise ParameterError(
+                f"Invalid consumer {consumer} - must be 0 to {consumers - 1}"
+            )
+        self._capacity = capacity
+        self._data = CURSORS + POS.size * consumers
+        self._slot = CURSORS + POS.size * consumer
+        self._cursor = POS.unpack_from(self._buf, self._slot)[0]
+        self._start = None
+        self._interval = interval
+        self.overruns = 0
+        self.lost = 0
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def __iter__(self):
+        """
+        Iterator over frames, polling for new frames until the writer
+        is closed and all remaining frames have been read.
+        """
+
+        while True:
+            frame = self.read()
+            if frame is not None:
+                yield frame
+            elif LEN.unpack_from(self._buf, CLOSED)[0]:
+                if self.read() is None:  # frames written before close
+                    return
+                continue
+            else:
+                sleep(self._interval)
+
+    def read(self) -> memoryview | None:
+        """
+        Read next frame, if available.
+
+        If the consumer has been overrun by the writer, the intervening
+        frames are skipped, 'overruns' is incremented and the number of
+        bytes skipped is added to 'lost'.
+
+        :return: frame as memoryview of ring, or None if no new frame
+        :rtype: memoryview | None
+        """
+
+        buf = self._buf
+        capacity = self._capacity
+        cursor = self._cursor
+        while True:
+            head = POS.unpack_from(buf, HEAD)[0]
+            if cursor >= head:
+                return None
+            offset = cursor % capacity
+            length = LEN.unpack_from(buf, self._data + offset)[0]
+            if POS.unpack_from(buf, RESERVE)[0] - capacity > cursor:  # overrun
+                self.overruns += 1
+                self.lost += head - cursor
+                self._advance(head)
+                return None
+            if length == WRAP:
+                cursor += capacity - offset
+                continue
+            start = self._data + offset + LEN.size
+            self._frame = buf[start : start + length]
+            self._start = cursor
+            self._advance(cursor + _record_size(length))
+            return self._frame
+
+    def _advance(self, cursor: int):
+        """
+        Set read cursor.
+
+        :param int cursor: new read position
+        """
+
+        self._cursor = cursor
+        POS.pack_into(self._buf, self._slot, cursor)
+
+    def intact(self) -> bool:
+        """
+        Check that the frame last returned by read() has not since been
+        overwritten by the writer, i.e. that any values obtained from it
+        are valid.
+
+        :return: True if intact
+        :rtype: bool
+        """
+
+        return (
+            self._start is not None
+            and POS.unpack_from(self._buf, RESERVE)[0] - self._capacity <= self._start
+        )
+
+    def close(self):
+        """
+        Detach from shared memory. The frame last returned by read() is
+        released - any other frames still referenced (e.g. by a
+        UNIMessageView) must be deleted or released first.
+
+        :raises: UNIStreamError if other frames are still referenced, in
+            which case close() can be called again once they are released
+        """
+
+        if self._shm is None:
+            return
+        if self._frame is not None:
+            self._frame.release()
+            self._frame = None
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+        try:
+            self._shm.close()
+        except BufferError as err:
+            raise UNIStreamError(
+                "Cannot close ring while frames returned by read() are still "
+                "referenced - delete or release() them first"
+            ) from err
+        self._shm = None
+
+    @property
+    def lag(self) -> int:
+        """
+        Getter for number of bytes written but not yet read.
+
+        :return: lag in bytes
+        :rtype: int
+        """
+
+        return POS.unpack_from(self._buf, HEAD)[0] - self._cursor
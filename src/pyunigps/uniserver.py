@@ -0,0 +1,471 @@
+"""
+UNISocketServer class.
+
+Local TCP fan-out server which shares one receiver's raw UNI, NMEA
+and RTCM3 output with any number of TCP clients (e.g. logger, monitor
+and NTRIP bridge).
+
+Frames are delimited using the UNIReader framing (parsing=False) and
+each complete frame is forwarded to every connected client. Each client
+has its own bounded send queue; a client which cannot keep up with the
+producer is dropped rather than allowed to stall it.
+
+Clients may optionally restrict the frames they receive by sending a
+single-line subscription request at any time, e.g.::
+
+    protfilter=2 msgids=BESTNAV,17,GNGGA,1005\\n
+
+- 'protfilter' is an OR'd combination of NMEA_PROTOCOL (1),
+  UNI_PROTOCOL (2) and RTCM3_PROTOCOL (4).
+- 'msgids' is a comma-separated list of UNI msgids (numeric or name),
+  NMEA identities (with or without talker e.g. 'GNGGA' or 'GGA')
+  or RTCM3 message numbers.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments, too-many-instance-attributes
+
+from logging import getLogger
+from queue import Empty, Full, Queue
+from socket import SHUT_RDWR
+from socketserver import BaseRequestHandler, ThreadingTCPServer
+from threading import Event, Lock, Thread
+
+from pyunigps.exceptions import ParameterError
+from pyunigps.unihelpers import frame_id, match_msgfilter, parse_msgfilter
+from pyunigps.unireader import UNIReader
+from pyunigps.unitypes_core import (
+    ERR_LOG,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    UNI_PROTOCOL,
+)
+
+ALL_PROTOCOLS = NMEA_PROTOCOL | UNI_PROTOCOL | RTCM3_PROTOCOL
+"""All supported protocols"""
+MAXREQUEST = 4096
+"""Maximum length in bytes of client subscription request"""
+
+
+def parse_subscription(line: str) -> tuple:
+    """
+    Parse client subscription request.
+
+    e.g. "protfilter=3 msgids=BESTNAV,17,GGA" -> (3, {2118, 17, 'GGA'})
+
+    :param str line: subscription request
+    :return: tuple of (protfilter, msgids as set or None for all)
+    :rtype: tuple
+    :raises: ParameterError if request is invalid
+    """
+
+    protfilter = ALL_PROTOCOLS
+    msgids = None
+    try:
+        for token in line.replace(";", " ").split():
+            key, val = token.split("=", 1)
+            if key == "protfilter":
+                protfilter = int(val)
+            elif key == "msgids":
+                msgids = parse_msgfilter(val.split(","))
+            else:
+                raise ValueError(f"Unknown keyword {key}")
+    except ValueError as err:
+        raise ParameterError(f"Invalid subscription request {line}") from err
+    return protfilter, msgids
+
+
+class UNIClient:
+    """
+    Fan-out client connection, with its own bounded send queue and filter.
+    """
+
+    def __init__(self, sock, address: tuple, queuesize: int):
+        """
+        Constructor.
+
+        :param socket sock: client socket
+        :param tuple address: client address
+        :param int queuesize: maximum number of frames queued for this client
+        """
+
+        self.sock = sock
+        self.address = address
+        self.queue = Queue(maxsize=queuesize)
+        # (protfilter, msgids) - replaced as a single tuple so that the
+        # producer thread never sees a partially updated filter
+        self.filter = (ALL_PROTOCOLS, None)
+        self.sent = 0
+        self.dropped = False
+
+    def wants(self, prot: int, msgid) -> bool:
+        """
+        Check if frame passes this client's protocol and msgid filter.
+
+        :param int prot: frame protocol
+        :param object msgid: frame msgid
+        :return: True if frame should be sent to client
+        :rtype: bool
+        """
+
+        protfilter, msgids = self.filter
+        return bool(prot & protfilter) and match_msgfilter(prot, msgid, msgids)
+
+    def close(self):
+        """
+        Close client connection, unblocking any pending send or receive.
+        """
+
+        if self.sock is None:
+            return
+        try:
+            self.sock.shutdown(SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class ClientHandler(BaseRequestHandler):
+    """
+    Threaded TCP client connection handler.
+    """
+
+    def setup(self):
+        """
+        Register client with fan-out server.
+        """
+
+        self.client = self.server.fanout.add_client(self.request, self.client_address)
+
+    def handle(self):
+        """
+        Start client sender and process any subscription requests until
+        client disconnects. A client which sends more than MAXREQUEST bytes
+        without a newline is dropped.
+        """
+
+        if self.client is None:  # maximum clients exceeded
+            return
+        sender = Thread(target=self._send, daemon=True)
+        sender.start()
+        buf = b""
+        while not self.client.dropped:
+            try:
+                data = self.request.recv(1024)
+            except OSError:
+                break
+            if not data:
+                break
+            buf += data
+            while b"\n" in buf:
+                line, buf = buf.split(b"\n", 1)
+                self.server.fanout.subscribe(
+                    self.client, line.decode("utf-8", errors="ignore")
+                )
+            if len(buf) > MAXREQUEST:
+                getLogger(__name__).warning(
+                    "Client %s dropped - subscription request exceeds %d bytes",
+                    self.client.address,
+                    MAXREQUEST,
+                )
+                break
+        self.server.fanout.drop_client(self.client)
+        sender.join()
+
+    def _send(self):
+        """
+        Send queued frames to client.
+        """
+
+        client = self.client
+        while not client.dropped:
+            raw = client.queue.get()
+            if raw is None:
+                break
+            try:
+                self.request.sendall(raw)
+                client.sent += 1
+            except OSError:
+                client.dropped = True
+        client.close()
+
+    def finish(self):
+        """
+        Deregister client from fan-out server.
+        """
+
+        if self.client is not None:
+            self.server.fanout.remove_client(self.client)
+
+
+class FanoutTCPServer(ThreadingTCPServer):
+    """
+    Threaded TCP server with back-reference to owning UNISocketServer.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, fanout, address: tuple):
+        """
+        Constructor.
+
+        :param UNISocketServer fanout: owning fan-out server
+        :param tuple address: (host, port)
+        """
+
+        self.fanout = fanout
+        super().__init__(address, ClientHandler)
+
+
+class UNISocketServer:
+    """
+    UNISocketServer class.
+    """
+
+    def __init__(
+        self,
+        datastream,
+        host: str = "127.0.0.1",
+        port: int = 50012,
+        maxclients: int = 10,
+        queuesize: int = 256,
+        protfilter: int = ALL_PROTOCOLS,
+        quitonerror: int = ERR_LOG,
+        errorhandler: object = None,
+        bufsize: int = 4096,
+    ):
+        """
+        Constructor.
+
+        :param datastream stream: input data stream (e.g. Serial, socket or file)
+        :param str host: host address to bind to ("127.0.0.1")
+        :param int port: port to bind to, 0 = any free port (50012)
+        :param int maxclients: maximum concurrent clients (10)
+        :param int queuesize: per-client send queue size in frames;
+            clients whose queue overflows are dropped (256)
+        :param int protfilter: protocols read from datastream (7)
+        :param int quitonerror: ERR_IGNORE (0), ERR_LOG (1), ERR_RAISE (2) (1)
+        :param object errorhandler: error handling object or function (None)
+        :param int bufsize: socket recv buffer size if datastream is a socket (4096)
+        :raises: ParameterError if maxclients or queuesize are invalid
+        """
+
+        if maxclients < 1 or queuesize < 1:
+            raise ParameterError("maxclients and queuesize must be >= 1")
+        self._reader = UNIReader(
+            datastream,
+            protfilter=protfilter,
+            quitonerror=quitonerror,
+            errorhandler=errorhandler,
+            bufsize=bufsize,
+            parsing=False,
+        )
+        self._address = (host, port)
+        self._maxclients = maxclients
+        self._queuesize = queuesize
+        self._clients = []
+        self._lock = Lock()
+        self._stopevent = Event()
+        self._server = None
+        self._threads = []
+        self._logger = getLogger(__name__)
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.stop()
+
+    def start(self):
+        """
+        Start TCP listener and stream producer threads.
+        """
+
+        self._stopevent.clear()
+        self._server = FanoutTCPServer(self, self._address)
+        self._threads = [
+            Thread(target=self._server.serve_forever, daemon=True),
+            Thread(target=self._produce, daemon=True),
+        ]
+        for thd in self._threads:
+            thd.start()
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Stop producer, disconnect all clients and close TCP listener.
+
+        NB: a producer blocked in a read on a live serial port or socket
+        can only be stopped once that read returns, so the caller should
+        close the datastream (or set a read timeout on it) before calling
+        stop(). No frames are broadcast once stop() has been called.
+
+        :param float timeout: time to wait for producer thread to end (2.0)
+        """
+
+        self._stopevent.set()
+        for thd in self._threads[1:]:  # producer thread
+            thd.join(timeout)
+            if thd.is_alive():
+                self._logger.warning(
+                    "Producer still blocked in read after %s seconds", timeout
+                )
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            self.drop_client(client)
+        self._threads = []
+
+    def _produce(self):
+        """
+        THREADED Read raw frames from datastream and fan out to clients
+        until stopped or end of stream.
+        """
+
+        try:
+            while not self._stopevent.is_set():
+                raw, _ = self._reader.read()
+                if raw is None:  # EOF
+                    break
+                self.broadcast(raw)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._logger.error("Producer terminated: %s", err)
+        finally:
+            # no more data will arrive, so disconnect all clients
+            with self._lock:
+                clients = list(self._clients)
+            for client in clients:
+                self.drop_client(client)
+
+    def broadcast(self, raw: bytes):
+        """
+        Queue raw frame for every client whose filter it passes. Any client
+        whose send queue is full is dropped.
+
+        :param bytes raw: complete raw frame
+        """
+
+        if self._stopevent.is_set():
+            return
+        prot, msgid = frame_id(raw)
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            if client.dropped or not client.wants(prot, msgid):
+                continue
+            try:
+                client.queue.put_nowait(raw)
+            except Full:
+                self._logger.warning(
+                    "Dropping slow client %s, %s frames queued",
+                    client.address,
+                    self._queuesize,
+                )
+                self.drop_client(client)
+
+    def add_client(self, sock, address: tuple) -> UNIClient:
+        """
+        Register new client connection.
+
+        :param socket sock: client socket
+        :param tuple address: client address
+        :return: client, or None if maximum clients exceeded
+        :rtype: UNIClient
+        """
+
+        with self._lock:
+            if len(self._clients) >= self._maxclients:
+                self._logger.warning(
+                    "Client %s rejected, maximum %s clients", address, self._maxclients
+                )
+                return None
+            client = UNIClient(sock, address, self._queuesize)
+            self._clients.append(client)
+        self._logger.info("Client %s connected", address)
+        return client
+
+    def remove_client(self, client: UNIClient):
+        """
+        Deregister client connection.
+
+        :param UNIClient client: client
+        """
+
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+        self._logger.info("Client %s disconnected", client.address)
+
+    def subscribe(self, client: UNIClient, line: str):
+        """
+        Apply client subscription request.
+
+        :param UNIClient client: client
+        :param str line: subscription request e.g. "protfilter=2 msgids=17"
+        """
+
+        try:
+            client.filter = parse_subscription(line)
+        except ParameterError as err:
+            self._logger.error(err)
+
+    def drop_client(self, client: UNIClient):
+        """
+        Drop client connection and discard its send queue.
+
+        :param UNIClient client: client
+        """
+
+        client.dropped = True
+        try:
+            while True:
+                client.queue.get_nowait()
+        except Empty:
+            pass
+        try:
+            client.queue.put_nowait(None)  # wake sender
+        except Full:  # pragma: no cover
+            pass
+        client.close()
+
+    @property
+    def address(self) -> tuple:
+        """
+        Getter for bound (host, port) address.
+
+        :return: address
+        :rtype: tuple
+        """
+
+        if self._server is None:
+            return self._address
+        return self._server.server_address
+
+    @property
+    def clients(self) -> int:
+        """
+        Getter for number of connected clients.
+
+        :return: number of clients
+        :rtype: int
+        """
+
+        with self._lock:
+            return len(self._clients)
@@ -49,6 +49,12 @@ S1 = "S001"  # signed char 1 [-128,127]
 S2 = "S002"  # signed short int 2 [-32768,32767]
 S4 = "S004"  # signed int 4 [-2147483648,2147483647]
 S8 = "S008"  # signed long long int 8 [-2^63,2^63-1]
+S11 = "S011"  # signed 11 bits (bit-packed blocks only)
+S12 = "S012"  # signed 12 bits (bit-packed blocks only)
+S13 = "S013"  # signed 13 bits (bit-packed blocks only)
+S15 = "S015"  # signed 15 bits (bit-packed blocks only)
+S28 = "S028"  # signed 28 bits (bit-packed blocks only)
+S32 = "S032"  # signed 32 bits (bit-packed blocks only)
 U1 = "U001"  # unsigned char 1 [0,255]
 U2 = "U002"  # unsigned short int 2 [0,65535]
 U3 = "U003"  # unsigned short int 3
@@ -56,10 +62,18 @@ U4 = "U004"  # unsigned int 4 [0,4294967295]
 U5 = "U005"  # unsigned int 5
 U6 = "U006"  # unsigned int 6
 U8 = "U008"  # unsigned long long int 8 [0,2^64-1]
+U9 = "U009"  # unsigned 9 bits (bit-packed blocks only)
 U10 = "U010"  # unsigned long long int 10
+U12 = "U012"  # unsigned 12 bits (bit-packed blocks only)
 U15 = "U015"  # unsigned long long int 15
 U16 = "U016"  # unsigned long long int 16
 U17 = "U017"  # unsigned long long int 17
+U21 = "U021"  # unsigned 21 bits (bit-packed blocks only)
+U32 = "U032"  # unsigned 32 bits (bit-packed blocks only)
+U36 = "U036"  # unsigned 36 bits (bit-packed blocks only)
+U37 = "U037"  # unsigned 37 bits (bit-packed blocks only)
+U40 = "U040"  # unsigned 40 bits (bit-packed blocks only)
+U63 = "U063"  # unsigned 63 bits (bit-packed blocks only)
 X1 = "X001"  # 8 bits field 1 Bit 7-0
 X2 = "X002"  # 16 bits field 2 Bit 15-0
 X4 = "X004"  # 32 bits field 4 Bit 31-0
@@ -67,6 +81,9 @@ X8 = "X008"  # 64 bits field 8 Bit 63-0
 X61 = "X061"  # 61 bytes
 X250 = "X250"  # 250 bytes
 
+BITS_MSB = "BMSB"  # bit-packed block, most significant bit first
+BITS_LSB = "BLSB"  # bit-packed block, least significant bit first
+
 ATTTYPE = {
     "S": type(-1),
     "R": type(1.1),
@@ -10,11 +10,142 @@ https://www.ardusimple.com/wp-content/uploads/2023/04/Unicore-Reference-Commands
 """
 
 from pyunigps.unitypes_core import (
+    BITS_LSB,
+    R4,
+    R8,
+    S28,
+    S32,
+    U1,
     U2,
     U3,
+    U4,
+    U5,
+    U6,
+    U8,
+    U16,
+    U21,
+    U32,
+    U36,
     X1,
+    X4,
 )
 
+OBS_RECORD = {
+    "numobs": U4,
+    "group": (
+        "numobs",
+        {
+            "sysfreq": U2,
+            "prn": U2,
+            "psr": R8,
+            "adr": R8,
+            "psrstd": [U2, 0.01],
+            "adrstd": [U2, 0.0001],
+            "dopp": R4,
+            "cn0": [U2, 0.01],
+            "reserved": U2,
+            "locktime": R4,
+            "chtrstatus": X4,
+        },
+    ),
+}
+"""Uncompressed observation payload"""
+
+OBS_RECORD_CMP = {
+    "numobs": U4,
+    "group": (
+        "numobs",
+        {
+            "record": (
+                BITS_LSB,
+                {
+                    "chtrstatus": U32,
+                    "dopp": [S28, 0.00390625],
+                    "psr": [U36, 0.0078125],
+                    "adr": [S32, 0.00390625],
+                    "psrstdcode": U4,
+                    "adrstdcode": U4,
+                    "prn": U8,
+                    "locktime": [U21, 0.03125],
+                    "cn0code": U5,
+                    "glofreqcode": U6,
+                    "reserved": U16,
+                },
+            ),
+        },
+    ),
+}
+"""Compressed observation payload (bit widths) - see uniobs module for encoding"""
+
+EPH_KEPLER = {
+    "prn": U4,
+    "tow": R8,
+    "health": U4,
+    "iode1": U4,
+    "iode2": U4,
+    "week": U4,
+    "zweek": U4,
+    "toe": R8,
+    "a": R8,
+    "deltan": R8,
+    "m0": R8,
+    "ecc": R8,
+    "omega": R8,
+    "cuc": R8,
+    "cus": R8,
+    "crc": R8,
+    "crs": R8,
+    "cic": R8,
+    "cis": R8,
+    "i0": R8,
+    "idot": R8,
+    "omega0": R8,
+    "omegadot": R8,
+    "iodc": U4,
+    "toc": R8,
+    "tgd": R8,
+    "af0": R8,
+    "af1": R8,
+    "af2": R8,
+    "antispoof": U4,
+    "n": R8,
+    "ura": R8,
+}
+"""Keplerian ephemeris payload common to GPS, QZSS, BDS, Galileo and IRNSS"""
+
+EPH_GLONASS = {
+    "slot": U2,
+    "freqo": U2,
+    "sattype": U1,
+    "reserved1": U1,
+    "eweek": U2,
+    "etime": U4,
+    "toffset": U4,
+    "nt": U2,
+    "reserved2": U1,
+    "reserved3": U1,
+    "issue": U4,
+    "health": U4,
+    "posx": R8,
+    "posy": R8,
+    "posz": R8,
+    "velx": R8,
+    "vely": R8,
+    "velz": R8,
+    "accx": R8,
+    "accy": R8,
+    "accz": R8,
+    "taun": R8,
+    "deltataun": R8,
+    "gamma": R8,
+    "tk": U4,
+    "p": U4,
+    "ft": U4,
+    "age": U4,
+    "flags": U4,
+}
+"""GLONASS state vector ephemeris payload"""
+
 UNI_PAYLOADS_GET = {
     # TODO add payload definitions...
     # TODO order alphabetically
@@ -26,11 +157,11 @@ UNI_PAYLOADS_GET = {
         "efuseid": "C033",
         "comptime": "C043",
     },
-    "OBSVM": {},
-    "OBSVH": {},
-    "OBSVMCMP": {},
-    "OBSVHCMP": {},
-    "OBSVBASE": {},
+    "OBSVM": OBS_RECORD,
+    "OBSVH": OBS_RECORD,
+    "OBSVMCMP": OBS_RECORD_CMP,
+    "OBSVHCMP": OBS_RECORD_CMP,
+    "OBSVBASE": OBS_RECORD,
     "BASEINFO": {},
     "GPSION": {},
     "BD3ION": {},
@@ -40,13 +171,13 @@ UNI_PAYLOADS_GET = {
     "BD3UTC": {},
     "BDSUTC": {},
     "GALUTC": {},
-    "GPSEPH": {},
-    "QZSSEPH": {},
-    "BD3EPH": {},
-    "BDSEPH": {},
-    "GLOEPH": {},
-    "GALEPH": {},
-    "IRNSSEPH": {},
+    "GPSEPH": EPH_KEPLER,
+    "QZSSEPH": EPH_KEPLER,
+    "BD3EPH": EPH_KEPLER,
+    "BDSEPH": EPH_KEPLER,
+    "GLOEPH": EPH_GLONASS,
+    "GALEPH": EPH_KEPLER,
+    "IRNSSEPH": EPH_KEPLER,
     "AGRIC": {},
     "PVTSLN": {},
     "UNILOGLIST": {},
@@ -119,3 +250,12 @@ UNI_PAYLOADS_GET = {
         )
     },
 }
+
+UNI_PAYLOADS_GET_VERSIONED = {}
+"""
+Firmware-specific GET payload layouts, used in place of UNI_PAYLOADS_GET
+where the message header version is within range, as
+identity: ((min version, max version or None, payload definition), ...)
+in ascending order of min version. Populated via
+UNIPayloadRegistry.register_version().
+"""
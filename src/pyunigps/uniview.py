@@ -0,0 +1,152 @@
+"""
+UNIMessageView class.
+
+Mutable, reusable (flyweight) view of a raw UNI frame, returned by
+UNIReader in place of a UNIMessage if 'flyweight' is True. The reader
+keeps one view per msgid and re-binds it to each new frame, so streaming
+consumers which process and discard each message immediately create no
+message objects, attribute dicts or decoded payloads per frame::
+
+    for raw_data, parsed_data in UNIReader(stream, flyweight=True):
+        if parsed_data.identity == "OBSVM":
+            process(parsed_data.numobs, parsed_data.prn)
+
+NB: a view is only valid until the next read() from the same reader,
+which may re-bind it to a different frame. Use decode() to obtain an
+independent UNIMessage for any message which needs to be retained.
+
+Attribute values are read directly from the frame at offsets compiled
+from the payload definition (see UNIPayloadRegistry.layout()) each time
+they are accessed. Attributes in a repeating group can be accessed
+indexed (e.g. 'prn_03') as for UNIMessage, or unindexed (e.g. 'prn')
+to return a list of values for all repeats. Attributes with no fixed
+offset (i.e. in nested groups or bit-packed blocks, or following a
+variable size attribute) are not available from the view, and must be
+obtained explicitly from the decoded message, e.g. view.decode().x.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+from pyunigps.uniopaque import UNIOpaqueMessage
+from pyunigps.uniregistry import (
+    REGISTRY,
+    field_lookup,
+    field_positions,
+    field_value,
+)
+from pyunigps.unitypes_core import GET, UNI_MSGIDS
+
+
+class UNIMessageView(UNIOpaqueMessage):
+    """
+    UNIMessageView class.
+    """
+
+    __slots__ = ("_msgid", "_version", "_fields")
+
+    def __init__(self, raw: bytes):
+        """
+        Constructor.
+
+        :param bytes raw: complete raw UNI GET frame
+        """
+
+        super().__init__(raw)
+        self._msgid = None
+        self._version = None
+        self._fields = {}
+        self.bind(raw)
+
+    def bind(self, raw: bytes) -> "UNIMessageView":
+        """
+        Re-bind view to new raw frame. The payload layout is only looked
+        up again if the msgid or header version differs from the
+        previous frame.
+
+        :param bytes raw: complete raw UNI GET frame
+        :return: this view
+        :rtype: UNIMessageView
+        """
+
+        self._raw = raw
+        msgid = raw[4] | (raw[5] << 8)
+        version = int.from_bytes(raw[16:20], "little")
+        if msgid != self._msgid or version != self._version:
+            self._msgid = msgid
+            self._version = version
+            identity = UNI_MSGIDS.get(msgid)
+            self._fields = (
+                REGISTRY.layout(GET, identity, version)
+                if REGISTRY.defined(msgid)
+                else {}
+            )
+        return self
+
+    def __getattr__(self, name: str) -> object:
+        """
+        Read payload attribute from frame.
+
+        :param str name: attribute name
+        :return: attribute value, or list of values for unindexed group attribute
+        :rtype: object
+        :raises: AttributeError if attribute is not defined or is not at a
+            fixed offset
+        """
+
+        if name[0] == "_":  # e.g. slots during copy or pickle
+            raise AttributeError(name)
+        raw = self._raw
+        loc = self._fields.get(name)
+        if loc is not None and loc[5] is None:  # top level attribute
+            return field_value(raw, loc, 24 + loc[0])
+        anam, loc, idx = field_lookup(self._fields, name)
+        if loc is None:  # no fixed offset or not defined
+            raise AttributeError(
+                f"'{self.identity}' message view has no fixed offset attribute "
+                f"'{name}' - use decode().{name}"
+            )
+        positions = field_positions(raw, loc, 24, len(raw) - 4)
+        if idx == 0:
+            return [field_value(raw, loc, pos) for pos in positions]
+        if idx > len(positions):
+            raise AttributeError(
+                f"'{self.identity}' message has no attribute '{name}' "
+                f"({anam} has {len(positions)} repeats)"
+            )
+        return field_value(raw, loc, positions[idx - 1])
+
+    def to_dict(self) -> dict:
+        """
+        Return decoded message as dict (see UNIMessage.to_dict()).
+
+        :return: message attributes
+        :rtype: dict
+        """
+
+        return self.decode().to_dict()
+
+    def __str__(self) -> str:
+        """
+        Human readable representation of decoded message.
+
+        :return: human readable representation
+        :rtype: str
+        """
+
+        return str(self.decode())
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        eval(repr(obj)) = obj
+
+        :return: machine readable representation
+        :rtype: str
+        """
+
+        return f"UNIMessageView({bytes(self._raw)!r})"
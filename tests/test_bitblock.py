@@ -0,0 +1,135 @@
+"""
+Bit-packed block payload definition tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from unittest.mock import patch
+
+from pyunigps import (
+    BITS_LSB,
+    BITS_MSB,
+    U1,
+    U2,
+    U3,
+    U4,
+    U6,
+    UNI_PAYLOADS_GET,
+    UNIMessage,
+    UNIReader,
+)
+from pyunigps.unihelpers import compile_bitblock
+
+# MSB first block with nested repeating groups, as in HAS/B2b style messages
+NESTED = {
+    "iod": U1,
+    "block": (
+        BITS_MSB,
+        {
+            "numsat": U4,
+            "sats": (
+                "numsat",
+                {
+                    "prn": U6,
+                    "numsig": U3,
+                    "sigs": (
+                        "numsig",
+                        {
+                            "sig": U4,
+                            "bias": ["S011", 0.02],
+                        },
+                    ),
+                },
+            ),
+        },
+    ),
+    "trailer": U2,
+}
+
+FIXED = {
+    "block": (BITS_LSB, {"a": U3, "b": "S005", "c": ["U012", 0.5], "reserved": U4}),
+    "group": ("None", {"rec": (BITS_MSB, {"x": "U007", "y": "S009"})}),
+}
+
+
+def bitstring(fields: list) -> bytes:
+    """MSB first reference packing from (value, bits) list."""
+    stg = "".join(format(val & ((1 << bits) - 1), f"0{bits}b") for val, bits in fields)
+    stg += "0" * (-len(stg) % 8)
+    return int(stg, 2).to_bytes(len(stg) // 8, "big")
+
+
+class BitBlockTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    @patch.dict(UNI_PAYLOADS_GET, {"TEST12": NESTED})
+    def testnested(self):
+        block = bitstring(
+            [
+                (2, 4),
+                (33, 6),
+                (2, 3),
+                (1, 4),
+                (-50, 11),
+                (15, 4),
+                (-1, 11),
+                (7, 6),
+                (1, 3),
+                (9, 4),
+                (0, 11),
+            ]
+        )
+        payload = b"\x05" + block + b"\x34\x12"
+        msg = UNIReader.parse(
+            UNIMessage(msgid=65512, wno=2406, tow=0, payload=payload).serialize()
+        )
+        self.assertEqual((msg.iod, msg.numsat, msg.trailer), (5, 2, 0x1234))
+        self.assertEqual(
+            (msg.prn_01, msg.numsig_01, msg.prn_02, msg.numsig_02), (33, 2, 7, 1)
+        )
+        self.assertEqual((msg.sig_01_01, msg.bias_01_01), (1, -1.0))
+        self.assertEqual((msg.sig_01_02, msg.bias_01_02), (15, -0.02))
+        self.assertEqual((msg.sig_02_01, msg.bias_02_01), (9, 0))
+        kwargs = {key: val for key, val in msg.__dict__.items() if key[0] != "_"}
+        self.assertEqual(UNIMessage(msgid=65512, **kwargs).payload, payload)
+
+    @patch.dict(UNI_PAYLOADS_GET, {"TEST12": FIXED})
+    def testfixed(self):  # LSB first, and 'variable by size' group of blocks
+        val = 5 | (-3 & 0x1F) << 3 | 301 << 8
+        payload = (
+            val.to_bytes(3, "little")
+            + bitstring([(100, 7), (-200, 9)])
+            + bitstring([(1, 7), (255, 9)])
+        )
+        msg = UNIReader.parse(
+            UNIMessage(msgid=65512, wno=2406, tow=0, payload=payload).serialize()
+        )
+        self.assertEqual((msg.a, msg.b, msg.c), (5, -3, 150.5))
+        self.assertEqual((msg.x_01, msg.y_01, msg.x_02, msg.y_02), (100, -200, 1, 255))
+        self.assertFalse(hasattr(msg, "reserved"))
+        msg2 = UNIMessage(msgid=65512, wno=2406, tow=0, a=5, b=-3, c=150.5)
+        self.assertEqual(msg2.payload, payload[0:3])
+
+    def testcompile(self):
+        table, bits = compile_bitblock(FIXED["block"][1])
+        self.assertEqual(bits, 24)
+        self.assertIs(compile_bitblock(FIXED["block"][1])[0], table)  # cached
+        self.assertEqual(table[0][1][2], ("c", 8, 12, 4095, 0, 0.5))
+        self.assertEqual(compile_bitblock(NESTED["block"][1])[1], -1)  # variable
+        self.assertEqual(compile_bitblock({"g": (3, {"x": U2})})[1], 6)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
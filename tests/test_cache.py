@@ -0,0 +1,110 @@
+"""
+UNIPayloadCache tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import sys
+import unittest
+from io import BytesIO
+
+from pyunigps import (
+    ParameterError,
+    UNIMessage,
+    UNIMessageError,
+    UNIPayloadCache,
+    UNIReader,
+)
+
+
+def version(tow: int, swversion: str = "R4.10Build5251") -> bytes:
+    return UNIMessage(
+        msgid=17,
+        wno=2406,
+        tow=tow,
+        device="M982",
+        swversion=swversion,
+        authtype="HRPT00-S10C-P",
+        psn="-",
+        efuseid="ffff48ffff0fffff",
+        comptime="2021/11/26",
+    ).serialize()
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testcachehit(self):
+        cache = UNIPayloadCache()
+        msg1 = UNIReader.parse(version(1000), cache=cache)
+        msg2 = UNIReader.parse(version(2000), cache=cache)
+        self.assertEqual((cache.hits, cache.misses, cache.currsize), (1, 1, 1))
+        self.assertEqual(str(msg2), str(UNIReader.parse(version(2000))))
+        self.assertEqual(msg2.serialize(), version(2000))
+        self.assertEqual(msg1.tow, 1000)  # template unaffected
+        self.assertEqual(msg2.tow, 2000)
+        self.assertEqual(msg2.swversion.strip(), "R4.10Build5251")
+        with self.assertRaisesRegex(UNIMessageError, "Object is immutable"):
+            msg2.tow = 3
+
+    def testcachereader(self):
+        stream = BytesIO(version(1) + version(2) + version(3, "X") + version(4))
+        cache = UNIPayloadCache()
+        res = [parsed for _, parsed in UNIReader(stream, cache=cache)]
+        self.assertEqual([msg.tow for msg in res], [1, 2, 3, 4])
+        self.assertEqual(res[2].swversion.strip(), "X")
+        self.assertEqual((cache.hits, cache.misses, cache.currsize), (2, 2, 2))
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, cache.currsize), (0, 0, 0))
+
+    def testcachelimits(self):
+        cache = UNIPayloadCache(maxsize=2)
+        for sw in ("A", "B", "C", "B"):
+            UNIReader.parse(version(1, sw), cache=cache)
+        self.assertEqual(cache.currsize, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        UNIReader.parse(version(1, "A"), cache=cache)  # A was evicted
+        self.assertEqual(cache.misses, 4)
+        cache = UNIPayloadCache(maxbytes=100)  # entry too big to cache
+        UNIReader.parse(version(1), cache=cache)
+        self.assertEqual((cache.currsize, cache.currbytes), (0, 0))
+        with self.assertRaisesRegex(ParameterError, "maxsize and maxbytes"):
+            UNIPayloadCache(maxsize=0)
+
+    def testcachebytes(self):  # estimate includes decoded attribute values
+        kwargs = {"numobs": 30}
+        for i in range(30):
+            kwargs[f"prn_{i + 1:02d}"] = i + 1
+            kwargs[f"psr_{i + 1:02d}"] = 2.1e7 + i
+        raw = UNIMessage(msgid=12, wno=2406, tow=1, **kwargs).serialize()
+        cache = UNIPayloadCache(msgids=None)
+        msg = UNIReader.parse(raw, cache=cache)
+        values = sum(sys.getsizeof(val) for val in vars(msg).values())
+        self.assertGreater(values, 30 * 10 * 24)
+        self.assertGreater(cache.currbytes, values + len(raw))
+        cache = UNIPayloadCache(maxbytes=values, msgids=None)
+        UNIReader.parse(raw, cache=cache)
+        self.assertEqual(cache.currsize, 0)
+
+    def testcachemsgids(self):
+        cache = UNIPayloadCache(msgids=("GPSEPH",))
+        UNIReader.parse(version(1), cache=cache)
+        self.assertEqual((cache.hits, cache.misses, cache.currsize), (0, 0, 0))
+        cache = UNIPayloadCache(msgids=None)
+        self.assertTrue(cache.cacheable(65512))
+        self.assertTrue(UNIPayloadCache(msgids=(17,)).cacheable(17))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
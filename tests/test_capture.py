@@ -0,0 +1,140 @@
+"""
+Capture recorder, replayer and compressed input tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import gzip
+import lzma
+import os
+import tempfile
+import unittest
+from io import BytesIO
+from time import monotonic
+
+from pyunigps import (
+    ParameterError,
+    UNIReader,
+    UNIRecorder,
+    UNIReplayer,
+    UNIStreamError,
+)
+from pyunigps.unicapture import CAPTURE_HDR, RECORD, open_capture
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class CaptureTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        with open(os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log"), "rb") as stream:
+            self.frames = [raw for raw, _ in UNIReader(stream, parsing=False)]
+
+    def tearDown(self):
+        pass
+
+    def _capture(self, interval: int = 0) -> BytesIO:
+        cap = BytesIO()
+        rec = UNIRecorder(cap)
+        for i, raw in enumerate(self.frames):
+            rec.write(raw, 1000 + i * interval)
+        self.assertEqual(rec.count, len(self.frames))
+        cap.seek(0)
+        return cap
+
+    def testrecordreplay(self):
+        cap = self._capture(1000)
+        self.assertEqual(cap.getvalue()[0:8], CAPTURE_HDR)
+        res = list(UNIReplayer(cap, speed=0))
+        self.assertEqual([raw for _, raw in res], self.frames)
+        self.assertEqual([ts for ts, _ in res], [1000 + i * 1000 for i in range(9)])
+
+    def testrecordfile(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "test.cap")
+            with open(
+                os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log"), "rb"
+            ) as stream:
+                with UNIRecorder(path) as rec:
+                    self.assertEqual(rec.record(UNIReader(stream, parsing=False), 5), 5)
+                    self.assertEqual(rec.record(UNIReader(stream, parsing=False)), 4)
+            with UNIReplayer(path, speed=0) as rpl:
+                res = list(rpl)
+            self.assertEqual([raw for _, raw in res], self.frames)
+            stamps = [ts for ts, _ in res]
+            self.assertEqual(stamps, sorted(stamps))
+
+    def testpacing(self):  # 9 frames 20ms apart replayed at 2x = 80ms
+        cap = self._capture(20_000_000)
+        start = monotonic()
+        count = UNIReplayer(cap, speed=2).replay(BytesIO())
+        elapsed = monotonic() - start
+        self.assertEqual(count, 9)
+        self.assertGreaterEqual(elapsed, 0.075)
+        self.assertLess(elapsed, 1)
+
+    def testreplaycallable(self):
+        out = []
+        UNIReplayer(self._capture(), speed=0).replay(out.append)
+        self.assertEqual(out, self.frames)
+
+    def testreplayreader(self):  # replayer as UNIReader datastream
+        unr = UNIReader(UNIReplayer(self._capture(), speed=0))
+        res = [str(parsed) for _, parsed in unr]
+        self.assertEqual(len(res), 9)
+        self.assertTrue(res[0].startswith("<NMEA(GNGLL"))
+        self.assertTrue(res[1].startswith("<RTCM(1005"))
+
+    def testinvalid(self):
+        with self.assertRaisesRegex(UNIStreamError, "Invalid capture file header"):
+            UNIReplayer(BytesIO(b"XXXXXXXX"))
+        with self.assertRaisesRegex(UNIStreamError, "Unsupported capture file version"):
+            UNIReplayer(BytesIO(b"UNICAP\x09\x00"))
+        with self.assertRaisesRegex(ParameterError, "Invalid replay speed"):
+            UNIReplayer(self._capture(), speed=-1)
+        cap = BytesIO(CAPTURE_HDR + RECORD.pack(1, 10) + b"\x01\x02")
+        with self.assertRaisesRegex(UNIStreamError, "Capture file truncated"):
+            list(UNIReplayer(cap, speed=0))
+        cap = BytesIO(CAPTURE_HDR + b"\x01\x02")
+        with self.assertRaisesRegex(UNIStreamError, "truncated in record header"):
+            list(UNIReplayer(cap, speed=0))
+
+    def testopencapture(self):  # plain and compressed captures read identically
+        with open(os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log"), "rb") as stream:
+            data = stream.read()
+        codecs = {"log": bytes, "gz": gzip.compress, "xz": lzma.compress}
+        if zstandard is not None:
+            codecs["zst"] = zstandard.ZstdCompressor().compress
+        with tempfile.TemporaryDirectory() as tmp:
+            for ext, compress in codecs.items():
+                path = os.path.join(tmp, f"test.{ext}")
+                with open(path, "wb") as out:
+                    out.write(compress(data))
+                with open_capture(path, bufsize=8192) as stream:
+                    res = [raw for raw, _ in UNIReader(stream, parsing=False)]
+                self.assertEqual(res, self.frames, ext)
+
+    def testopencapturereplay(self):  # compressed UNIRecorder capture
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "test.cap.gz")
+            with gzip.open(path, "wb") as out:
+                out.write(self._capture().getvalue())
+            with open_capture(path) as stream:
+                res = [raw for _, raw in UNIReplayer(stream, speed=0)]
+            self.assertEqual(res, self.frames)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
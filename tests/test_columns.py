@@ -0,0 +1,245 @@
+"""
+UNIColumnCache tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import gzip
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from pyunigps import (
+    R8,
+    REGISTRY,
+    U1,
+    U2,
+    UNI_MSGIDS,
+    UNI_PAYLOADS_GET,
+    UNI_PAYLOADS_GET_VERSIONED,
+    ParameterError,
+    UNIColumnCache,
+    UNIMessage,
+    UNIReader,
+    to_columns,
+)
+
+DIRNAME = os.path.dirname(__file__)
+MIXED = os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log")
+PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def obsvm(tow: int, prns: tuple) -> bytes:
+    vals = {"msgid": 12, "wno": 2406, "tow": tow, "numobs": len(prns)}
+    for i, prn in enumerate(prns):
+        vals[f"prn_{i + 1:02d}"] = prn
+        vals[f"psr_{i + 1:02d}"] = 2e7 + prn
+        vals[f"chtrstatus_{i + 1:02d}"] = bytes((prn, 0, 0, 0))
+    return UNIMessage(**vals).serialize()
+
+
+def version(tow: int) -> bytes:
+    return UNIMessage(
+        msgid=17, wno=2406, tow=tow, device="M982", swversion="R4.10"
+    ).serialize()
+
+
+class ColumnsTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cachedir = os.path.join(self.tmpdir.name, "cache")
+        self.capture = os.path.join(self.tmpdir.name, "capture.log")
+        with open(MIXED, "rb") as stream:
+            mixed = stream.read()
+        self.data = (
+            obsvm(1000, (3, 7))
+            + version(1000)
+            + mixed
+            + UNIMessage(msgid=12345, wno=0, tow=0).serialize()
+            + obsvm(2000, ())
+            + obsvm(3000, (9,))
+        )
+        with open(self.capture, "wb") as stream:
+            stream.write(self.data)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def testtocolumns(self):
+        msgs = [
+            UNIReader.parse(raw)
+            for raw in (obsvm(1000, (3, 7)), version(1000), obsvm(2000, (9,)))
+        ]
+        tables = to_columns(msgs)
+        self.assertEqual(list(tables), ["OBSVM", "OBSVM.group", "VERSION"])
+        self.assertEqual(
+            list(tables["OBSVM"]),
+            [
+                "cpuidle",
+                "timeref",
+                "timestatus",
+                "wno",
+                "tow",
+                "version",
+                "leapsecond",
+                "delay",
+                "numobs",
+            ],
+        )
+        self.assertEqual(tables["OBSVM"]["tow"], [1000, 2000])
+        group = tables["OBSVM.group"]
+        self.assertEqual(list(group)[0:4], ["_row", "sysfreq", "prn", "psr"])
+        self.assertEqual(
+            (group["_row"], group["prn"], group["psr"]),
+            ([0, 0, 1], [3, 7, 9], [2e7 + 3, 2e7 + 7, 2e7 + 9]),
+        )
+        self.assertEqual(group["chtrstatus"][2], b"\x09\x00\x00\x00")
+        self.assertEqual(tables["VERSION"]["swversion"][0].strip(), "R4.10")
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    @patch.dict(UNI_PAYLOADS_GET_VERSIONED)
+    def testversioned(self):
+        REGISTRY.register(64000, "MYMSG", {"count": U2, "val": R8})
+        REGISTRY.register_version("MYMSG", {"flag": U1, "count": U2}, 2)
+        msgs = [
+            UNIReader.parse(
+                UNIMessage(
+                    msgid=64000, wno=0, tow=tow, version=ver, count=tow
+                ).serialize()
+            )
+            for tow, ver in ((1, 0), (2, 2), (3, 1), (4, 3))
+        ]
+        tables = to_columns(msgs)
+        self.assertEqual(list(tables), ["MYMSG", "MYMSG.v2", "MYMSG.v3"])
+        self.assertEqual(
+            (tables["MYMSG"]["count"], tables["MYMSG.v2"]["flag"]), ([1, 3], [0])
+        )
+        REGISTRY.invalidate("MYMSG")
+
+    def testopen(self):
+        cache = UNIColumnCache(self.cachedir)
+        tables = cache.open(self.capture)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(
+            sorted(tables), ["OBSVM", "OBSVM.group", "VERSION"]
+        )  # undefined, NMEA and RTCM3 omitted
+        group = tables["OBSVM.group"]
+        np.testing.assert_array_equal(tables["OBSVM"]["numobs"], [2, 0, 1])
+        np.testing.assert_array_equal(group["_row"], [0, 0, 2])
+        np.testing.assert_array_equal(group["psr"], [2e7 + 3, 2e7 + 7, 2e7 + 9])
+        self.assertEqual(group["chtrstatus"].dtype, np.dtype("V4"))
+        self.assertEqual(bytes(group["chtrstatus"][1]), b"\x07\x00\x00\x00")
+        self.assertEqual(str(tables["VERSION"]["device"][0]), "M982")
+        entry = os.path.join(self.cachedir, cache.key(self.capture))
+        with open(os.path.join(entry, "manifest.json"), encoding="utf-8") as infile:
+            self.assertEqual(
+                json.load(infile),
+                {
+                    "format": "npz",
+                    "source": "capture.log",
+                    "tables": {"OBSVM": 3, "OBSVM.group": 3, "VERSION": 1},
+                },
+            )
+        with patch(
+            "pyunigps.unicolumns.UNIReader", side_effect=AssertionError("reparsed")
+        ):
+            cached = UNIColumnCache(self.cachedir).open(self.capture)
+        self.assertEqual(cached.keys(), tables.keys())
+        for name, cols in tables.items():
+            for col, arr in cols.items():
+                np.testing.assert_array_equal(cached[name][col], arr)
+        cache.clear()
+        self.assertEqual(os.listdir(self.cachedir), [])
+
+    def testkey(self):
+        cache = UNIColumnCache(self.cachedir)
+        key = cache.key(self.capture)
+        self.assertEqual(len(key), 40)
+        self.assertNotEqual(
+            UNIColumnCache(self.cachedir, parsebitfield=False).key(self.capture), key
+        )
+        with patch.dict(UNI_MSGIDS), patch.dict(UNI_PAYLOADS_GET):
+            REGISTRY.register(64000, "MYMSG", {"count": U2})
+            self.assertNotEqual(cache.key(self.capture), key)  # definitions changed
+        REGISTRY.invalidate("MYMSG")
+        self.assertEqual(cache.key(self.capture), key)
+        self.assertEqual(len(REGISTRY.digest()), 32)
+        with open(self.capture, "ab") as stream:
+            stream.write(version(2000))
+        self.assertNotEqual(cache.key(self.capture), key)
+        self.assertEqual(len(cache.open(self.capture)["VERSION"]["tow"]), 2)
+
+    def testcompressed(self):
+        gzcapture = self.capture + ".gz"
+        with gzip.open(gzcapture, "wb") as stream:
+            stream.write(self.data)
+        cache = UNIColumnCache(self.cachedir)
+        tables = cache.open(gzcapture)
+        np.testing.assert_array_equal(tables["OBSVM"]["tow"], [1000, 2000, 3000])
+        self.assertNotEqual(
+            cache.key(gzcapture), cache.key(self.capture)
+        )  # keyed on file content
+
+    def testconcurrent(self):  # entry built by another process in the meantime
+        cache = UNIColumnCache(self.cachedir)
+        entry = os.path.join(self.cachedir, cache.key(self.capture))
+        os.makedirs(os.path.join(entry, "other"))
+        with open(
+            os.path.join(entry, "manifest.json"), "w", encoding="utf-8"
+        ) as outfile:
+            json.dump({"format": "npz", "source": "capture.log", "tables": {}}, outfile)
+        cache._save(entry, {"VERSION": {"tow": [1]}}, "capture.log")
+        self.assertEqual(cache.open(self.capture), {})
+        self.assertEqual(
+            sorted(os.listdir(self.cachedir)), [os.path.basename(entry)]
+        )  # temporary entry removed
+
+    def testformats(self):
+        with self.assertRaisesRegex(
+            ParameterError,
+            r"Invalid format csv - must be one of \('npz', 'feather', 'parquet'\)",
+        ):
+            UNIColumnCache(self.cachedir, fmt="csv")
+        with patch.dict("sys.modules", {"numpy": None}):
+            with self.assertRaisesRegex(
+                ParameterError, "'npz' format requires the 'numpy' package"
+            ):
+                UNIColumnCache(self.cachedir)
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with self.assertRaisesRegex(
+                ParameterError,
+                "'feather' and 'parquet' formats require the 'pyarrow' package",
+            ):
+                UNIColumnCache(self.cachedir, fmt="parquet")
+
+    @unittest.skipUnless(PYARROW, "requires pyarrow")
+    def testpyarrow(self):
+        for fmt in ("feather", "parquet"):
+            cache = UNIColumnCache(self.cachedir, fmt=fmt)
+            for _ in range(2):
+                tables = cache.open(self.capture)
+                self.assertEqual(
+                    tables["OBSVM.group"].column("prn").to_pylist(), [3, 7, 9]
+                )
+                self.assertEqual(
+                    tables["OBSVM.group"].column("chtrstatus").to_pylist()[2],
+                    b"\x09\x00\x00\x00",
+                )
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
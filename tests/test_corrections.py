@@ -0,0 +1,223 @@
+"""
+HAS and PPP-B2b correction store tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from io import BytesIO
+
+from pyunigps import UNICorrectionStore, UNIMessage, UNIMessageError, UNIReader
+from pyunigps.unicorrections import b2b_slot
+
+
+def bitstring(fields: list) -> bytes:
+    """MSB first reference packing from (value, bits) list."""
+    stg = "".join(format(val & ((1 << bits) - 1), f"0{bits}b") for val, bits in fields)
+    stg += "0" * (-len(stg) % 8)
+    return int(stg, 2).to_bytes(len(stg) // 8, "big")
+
+
+def has(block: list, maskid: int = 4, iodset: int = 9) -> bytes:
+    return bitstring([(1800, 12), (0, 10), (maskid, 5), (iodset, 5)] + block)
+
+
+HAS_MASK = [
+    (2, 4),  # nsys
+    (0, 4),
+    ((1 << 37) | (1 << 33), 40),
+    ((1 << 15) | (1 << 10), 16),
+    (1, 1),
+    (1, 1),
+    (1, 1),
+    (1, 1),
+    (0, 1),
+    (0, 3),  # GPS 3, 7
+    (2, 4),
+    (1 << 29, 40),
+    (1 << 14, 16),
+    (0, 1),
+    (0, 3),  # GAL 11
+    (0, 6),
+]
+HAS_ORBIT = [
+    (5, 4),
+    (45, 8),
+    (400, 13),
+    (-125, 12),
+    (250, 12),
+    (46, 8),
+    (-4096, 13),
+    (0, 12),
+    (0, 12),
+    (100, 10),
+    (-400, 13),
+    (0, 12),
+    (125, 12),
+]
+HAS_CLOCKFULL = [(5, 4), (1, 2), (0, 2), (100, 13), (4095, 13), (-40, 13)]
+HAS_CLOCKSUB = [(5, 4), (1, 4), (2, 4), (0, 2), (1, 1), (200, 13)]
+HAS_CBIAS = [(5, 4), (50, 11), (-1024, 11), (25, 11), (-10, 11)]
+HAS_PBIAS = [
+    (5, 4),
+    (100, 11),
+    (1, 2),
+    (5, 11),
+    (2, 2),
+    (-3, 11),
+    (0, 2),
+    (7, 11),
+    (3, 2),
+]
+
+B2B_HDR = [(3600, 17), (0, 4), (1, 2)]
+B2B_MASK = (
+    [(1, 6)]
+    + B2B_HDR
+    + [(3, 4), ((1 << 44) | (1 << 43), 63), (1 << 32, 37), (0, 37), (0, 37)]
+)
+B2B_ORBIT = (
+    [(2, 6)]
+    + B2B_HDR
+    + [(19, 9), (500, 10), (2, 3), (625, 15), (-156, 13), (0, 13), (1, 3), (2, 3)]
+    + [(68, 9), (77, 10), (0, 3), (0, 15), (0, 13), (0, 13), (0, 3), (0, 3)]
+    + [(0, 69)] * 4
+)
+B2B_CBIAS = (
+    [(3, 6)] + B2B_HDR + [(1, 5), (19, 9), (2, 4), (0, 4), (100, 12), (5, 4), (-10, 12)]
+)
+B2B_CLOCK = (
+    [(4, 6)]
+    + B2B_HDR
+    + [(3, 4), (0, 5), (2, 3), (500, 15), (0, 3), (-16384, 15), (1, 3), (-100, 15)]
+    + [(0, 18)] * 20
+)
+
+
+class CorrectionsTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def _hasstore(self) -> UNICorrectionStore:
+        ssr = UNICorrectionStore()
+        for block, fields in (
+            ("mask", HAS_MASK),
+            ("orbit", HAS_ORBIT),
+            ("clockfull", HAS_CLOCKFULL),
+            ("cbias", HAS_CBIAS),
+            ("pbias", HAS_PBIAS),
+        ):
+            self.assertTrue(ssr.apply_has(block, has(fields)))
+        return ssr
+
+    def testhas(self):
+        ssr = self._hasstore()
+        orb = ssr.orbit("GPS", 3)
+        self.assertEqual(
+            (orb["gnssiod"], orb["radial"], orb["along"], orb["cross"]),
+            (45, 1.0, -1.0, 2.0),
+        )
+        self.assertEqual(
+            (orb["source"], orb["iod"], orb["toh"], orb["validity"]),
+            ("HAS", 9, 1800, 60),
+        )
+        self.assertIsNone(ssr.orbit("GPS", 7))  # not available
+        self.assertEqual(ssr.orbit("GAL", 11)["gnssiod"], 100)
+        self.assertEqual(ssr.clock("GPS", 3)["c0"], 0.5)  # with multiplier
+        self.assertIsNone(ssr.clock("GPS", 7))  # do not use
+        self.assertEqual(ssr.clock("GAL", 11)["c0"], -0.1)
+        self.assertEqual(ssr.code_biases("GPS", 3)["biases"], {0: 1.0})
+        self.assertEqual(ssr.code_biases("GPS", 7)["biases"], {0: 0.5})  # cell mask
+        self.assertEqual(ssr.code_biases("GAL", 11)["biases"], {1: -0.2})
+        self.assertEqual(
+            ssr.phase_biases("GPS", 3)["biases"], {0: (1.0, 1), 5: (0.05, 2)}
+        )
+        self.assertEqual(ssr.phase_biases("GAL", 11)["biases"], {1: (0.07, 3)})
+        self.assertEqual(sorted(ssr.satellites()), [("GAL", 11), ("GPS", 3)])
+        self.assertEqual(ssr.updates, 5)
+
+    def testhasincremental(self):
+        ssr = self._hasstore()
+        ssr.apply_has("clocksub", has(HAS_CLOCKSUB))
+        self.assertEqual(ssr.clock("GAL", 11)["c0"], 0.5)  # only subset updated
+        self.assertEqual(ssr.clock("GPS", 3)["c0"], 0.5)
+        self.assertEqual(ssr.satellite("GAL", 11)["clock"]["c0"], 0.5)
+        ssr.apply_has("clocksub", has(HAS_CLOCKSUB, iodset=10))  # new IOD set
+        self.assertIsNone(ssr.satellite("GAL", 11)["clock"])  # inconsistent with orbit
+        self.assertFalse(
+            ssr.apply_has("orbit", has(HAS_ORBIT, maskid=5))
+        )  # unknown mask
+        self.assertEqual(ssr.unresolved, 1)
+
+    def testb2b(self):
+        ssr = UNICorrectionStore()
+        self.assertFalse(ssr.apply_b2b(bitstring(B2B_CLOCK)))  # mask not yet received
+        for fields in (B2B_MASK, B2B_ORBIT, B2B_CBIAS, B2B_CLOCK):
+            self.assertTrue(ssr.apply_b2b(bitstring(fields)))
+        orb = ssr.orbit("BDS", 19)
+        self.assertEqual(
+            (orb["iod"], orb["gnssiod"], orb["radial"], orb["along"], orb["ura"]),
+            (2, 500, 1.0, -0.9984, (1, 2)),
+        )
+        self.assertEqual((orb["source"], orb["epoch"], orb["iodssr"]), ("B2B", 3600, 1))
+        self.assertEqual(ssr.orbit("GPS", 5)["gnssiod"], 77)
+        self.assertEqual(ssr.code_biases("BDS", 19)["biases"], {0: 1.7, 5: -0.17})
+        self.assertEqual(ssr.clock("BDS", 19)["c0"], 0.8)
+        self.assertIsNone(ssr.clock("BDS", 20))  # not available
+        self.assertEqual(ssr.clock("GPS", 5)["c0"], -0.16)
+        self.assertEqual(ssr.satellite("BDS", 19)["clock"]["c0"], 0.8)
+        self.assertIsNone(ssr.satellite("GPS", 5)["clock"])  # IODcorr mismatch
+        self.assertFalse(ssr.apply_b2b(bitstring([(5, 6), (0, 30)])))  # not applied
+        self.assertEqual((ssr.updates, ssr.unresolved, ssr.unsupported), (4, 1, 1))
+        self.assertEqual(
+            (b2b_slot(64), b2b_slot(137), b2b_slot(138), b2b_slot(0)),
+            (("GPS", 1), ("GAL", 37), ("GLONASS", 1), None),
+        )
+
+    def testreader(self):
+        frames = [
+            UNIMessage(msgid=2319, wno=2406, tow=1, payload=has(HAS_MASK)),
+            UNIMessage(msgid=2320, wno=2406, tow=1, payload=has(HAS_ORBIT)),
+            UNIMessage(msgid=17, wno=2406, tow=1),
+            UNIMessage(msgid=2302, wno=2406, tow=1, payload=bitstring(B2B_MASK)),
+            UNIMessage(msgid=2304, wno=2406, tow=1, payload=bitstring(B2B_ORBIT)),
+        ]
+        stream = BytesIO(b"".join(msg.serialize() for msg in frames))
+        ssr = UNICorrectionStore()
+        self.assertEqual(ssr.load(UNIReader(stream)), 4)
+        self.assertEqual(len(ssr.satellites()), 4)
+        self.assertFalse(ssr.update(None))
+        ssr.clear()
+        self.assertEqual((ssr.satellites(), ssr.updates), ([], 0))
+        self.assertIsNone(ssr.satellite("GPS", 3)["orbit"])
+
+    def testtruncated(self):
+        with self.assertRaisesRegex(UNIMessageError, "Correction message truncated"):
+            UNICorrectionStore().apply_has("mask", has(HAS_MASK)[0:10])
+
+    def testtruncatedatomic(self):  # truncated message leaves store unchanged
+        ssr = self._hasstore()
+        before = ssr.satellite("GAL", 11), ssr.satellite("GPS", 3)
+        data = has([(5, 4), (1, 2), (0, 2), (200, 13), (200, 13)])  # GAL clock missing
+        with self.assertRaisesRegex(UNIMessageError, "Correction message truncated"):
+            ssr.apply_has("clockfull", data)
+        self.assertEqual((ssr.satellite("GAL", 11), ssr.satellite("GPS", 3)), before)
+        ssr = UNICorrectionStore()
+        data = bitstring(B2B_ORBIT)
+        with self.assertRaisesRegex(UNIMessageError, "Correction message truncated"):
+            ssr.apply_b2b(data[0 : len(data) - 20])  # first 2 satellites complete
+        self.assertEqual((ssr.satellites(), ssr.updates), ([], 0))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+UNIDemux tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import gzip
+import os
+import tempfile
+import unittest
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from pyunigps import (
+    ERR_RAISE,
+    UNI_PROTOCOL,
+    VALCKSUM,
+    ParameterError,
+    UNIDemux,
+    UNIMessage,
+    UNIParseError,
+    UNIParser,
+)
+from pyunigps.unidemux import main
+
+DIRNAME = os.path.dirname(__file__)
+MIXED = os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log")
+NMEA = b"$GNRMC,084159.00,A,3203.94995,N,03446.42914,E,0.000,,080222,,,D,V*1F\r\n"
+
+
+def version(tow: int) -> bytes:
+    return UNIMessage(
+        msgid=17, wno=2406, tow=tow, device="M982", swversion="R4.10"
+    ).serialize()
+
+
+def eph(prn: int) -> bytes:
+    return UNIMessage(msgid=106, wno=2406, tow=prn, prn=prn, health=0).serialize()
+
+
+def corrupt(raw: bytes) -> bytes:
+    return raw[:-1] + bytes(((raw[-1] + 1) & 0xFF,))
+
+
+class DemuxTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.outdir = os.path.join(self.tmpdir.name, "out")
+        with open(MIXED, "rb") as stream:
+            self.mixed = stream.read()
+        self.frames = [
+            raw for raw, _ in UNIParser(parsing=False, quitonerror=0).feed(self.mixed)
+        ]
+        self.data = version(1) + eph(3) + self.mixed + eph(5) + version(2)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def output(self, name: str) -> bytes:
+        with open(os.path.join(self.outdir, name), "rb") as stream:
+            return stream.read()
+
+    def testprotocol(self):
+        with UNIDemux(self.outdir, prefix="cap_", quitonerror=0) as demux:
+            stats = demux.run(BytesIO(self.data), readsize=100)
+        self.assertEqual(
+            sorted(os.listdir(self.outdir)),
+            ["cap_nmea.log", "cap_rtcm3.log", "cap_uni.log"],
+        )
+        uni = version(1) + eph(3) + eph(5) + version(2)
+        self.assertEqual(self.output("cap_uni.log"), uni)
+        self.assertEqual(self.output("cap_nmea.log"), self.frames[0] + self.frames[-1])
+        self.assertEqual(self.output("cap_rtcm3.log"), b"".join(self.frames[1:-1]))
+        self.assertEqual(stats[os.path.join(self.outdir, "cap_uni.log")], (4, len(uni)))
+        self.assertEqual(stats[os.path.join(self.outdir, "cap_rtcm3.log")][0], 7)
+        self.assertEqual(stats, demux.stats)
+
+    def testmsgid(self):
+        with UNIDemux(self.outdir, split="msgid", protfilter=UNI_PROTOCOL | 1) as demux:
+            self.assertEqual(demux.feed(self.data), 6)
+            self.assertEqual(
+                demux.feed(UNIMessage(msgid=12345, wno=0, tow=0).serialize()), 1
+            )
+        self.assertEqual(
+            sorted(os.listdir(self.outdir)),
+            [
+                "nmea_GNGLL.log",
+                "nmea_GNRMC.log",
+                "uni_12345.log",
+                "uni_GPSEPH.log",
+                "uni_VERSION.log",
+            ],
+        )
+        self.assertEqual(self.output("uni_GPSEPH.log"), eph(3) + eph(5))
+        self.assertEqual(self.output("uni_VERSION.log"), version(1) + version(2))
+
+    def testunsafeid(
+        self,
+    ):  # NMEA address fields unsafe as filenames go to 'unknown' file
+        bad = [
+            b"$GN/x,1*00\r\n",
+            b"$G/../../x,1*00\r\n",
+            b"$GN\\x,1*00\r\n",
+            b"$G\xffA,1*00\r\n",
+        ]
+        with UNIDemux(self.outdir, split="msgid") as demux:
+            self.assertEqual(demux.feed(NMEA + b"".join(bad) + NMEA), 6)
+        self.assertEqual(
+            sorted(os.listdir(self.outdir)), ["nmea_GNRMC.log", "nmea_unknown.log"]
+        )
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["out"])
+        self.assertEqual(self.output("nmea_unknown.log"), b"".join(bad))
+        self.assertEqual(
+            demux.stats[os.path.join(self.outdir, "nmea_unknown.log")],
+            (4, len(b"".join(bad))),
+        )
+
+    def testvalidate(self):
+        data = (
+            version(1)
+            + corrupt(version(2))
+            + NMEA.replace(b"*1F", b"*1E")
+            + NMEA
+            + b"$GNRMC,1,2\r\n"
+            + corrupt(self.frames[1])
+            + self.frames[1]
+        )
+        errs = []
+        with UNIDemux(
+            self.outdir, validate=VALCKSUM, errorhandler=errs.append
+        ) as demux:
+            demux.feed(data)
+        self.assertEqual(demux.rejected, 4)
+        self.assertEqual(
+            [str(err) for err in errs],
+            [
+                "uni 17 message checksum invalid",
+                "nmea GNRMC message checksum invalid",
+                "nmea GNRMC message checksum invalid",
+                "rtcm3 1005 message checksum invalid",
+            ],
+        )
+        self.assertEqual(self.output("uni.log"), version(1))
+        self.assertEqual(self.output("nmea.log"), NMEA)
+        self.assertEqual(self.output("rtcm3.log"), self.frames[1])
+        with UNIDemux(self.tmpdir.name + "/novalidate") as demux:  # default is copy all
+            self.assertEqual(demux.feed(data), 7)
+
+    def testraise(self):
+        with UNIDemux(self.outdir, validate=VALCKSUM, quitonerror=ERR_RAISE) as demux:
+            with self.assertRaisesRegex(
+                UNIParseError, "uni 17 message checksum invalid"
+            ):
+                demux.feed(version(1) + corrupt(version(2)) + version(3))
+            self.assertEqual(demux.feed(b""), 1)  # resume after error
+        self.assertEqual(self.output("uni.log"), version(1) + version(3))
+        with self.assertRaisesRegex(
+            ParameterError, "Invalid split sat - must be one of"
+        ):
+            UNIDemux(self.outdir, split="sat")
+
+    def testmain(self):
+        infile = os.path.join(self.tmpdir.name, "capture.log.gz")
+        with gzip.open(infile, "wb") as stream:
+            stream.write(self.data)
+        with patch("sys.stdout", StringIO()) as out:
+            self.assertEqual(
+                main(
+                    [
+                        infile,
+                        infile,
+                        "-d",
+                        self.outdir,
+                        "-s",
+                        "msgid",
+                        "-p",
+                        "2",
+                        "--validate",
+                        "1",
+                    ]
+                ),
+                0,
+            )
+        self.assertEqual(self.output("uni_GPSEPH.log"), (eph(3) + eph(5)) * 2)
+        self.assertIn("uni_VERSION.log: 4 frames, ", out.getvalue())
+        with (
+            patch("sys.stdout", StringIO()) as out,
+            patch("sys.stdin", StringIO()) as stdin,
+        ):
+            stdin.buffer = BytesIO(corrupt(version(1)) + NMEA)
+            self.assertEqual(
+                main(["-d", self.outdir, "--quitonerror", "0", "--validate", "1"]), 0
+            )
+        self.assertEqual(out.getvalue().splitlines()[-1], "1 frames rejected")
+        self.assertEqual(self.output("nmea.log"), NMEA)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,262 @@
+"""
+unidump command line utility tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from pyunigps import (
+    ERR_RAISE,
+    UNI_PROTOCOL,
+    ParameterError,
+    UNIMessage,
+    UNIParseError,
+    UNIParser,
+)
+from pyunigps.unidump import UNIDumper, main
+
+DIRNAME = os.path.dirname(__file__)
+MIXED = os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log")
+
+
+def version(tow: int) -> bytes:
+    return UNIMessage(
+        msgid=17, wno=2406, tow=tow, device="M982", swversion="R4.10"
+    ).serialize()
+
+
+def eph(prn: int) -> bytes:
+    return UNIMessage(msgid=106, wno=2406, tow=prn, prn=prn, health=0).serialize()
+
+
+class DumpTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.uni = os.path.join(self.tmpdir.name, "uni.log")
+        with open(MIXED, "rb") as stream:
+            self.mixed = stream.read()
+        self.data = version(1) + eph(3) + self.mixed + eph(5)
+        with open(self.uni, "wb") as stream:
+            stream.write(self.data)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def dump(self, inputs: list, **kwargs) -> bytes:
+        out = BytesIO()
+        dumper = UNIDumper(inputs, out, **kwargs)
+        dumper.run()
+        self.count = dumper.count
+        return out.getvalue()
+
+    def testmsgfilter(self):  # same matching as UNISocketServer subscriptions
+        out = [
+            json.loads(line)["identity"]
+            for line in self.dump(
+                [self.uni], fmt="json", msgfilter=["GLL", "GNRMC", 106, " 1005"]
+            )
+            .decode()
+            .splitlines()
+        ]
+        self.assertEqual(out, ["GPSEPH", "GNGLL", "1005", "GNRMC", "GPSEPH"])
+
+    def testraw(self):
+        frames = b"".join(
+            raw for raw, _ in UNIParser(parsing=False, quitonerror=0).feed(self.mixed)
+        )
+        self.assertEqual(
+            self.dump([self.uni], fmt="raw"), version(1) + eph(3) + frames + eph(5)
+        )  # UBX discarded
+        self.assertEqual(self.count, 12)
+        self.assertEqual(
+            self.dump([self.uni], fmt="raw", msgfilter=["GPSEPH"]), eph(3) + eph(5)
+        )
+        self.assertEqual(
+            self.dump([self.uni], fmt="raw", msgfilter=["17", "1005"])[
+                : len(version(1))
+            ],
+            version(1),
+        )
+        self.assertEqual(self.count, 2)
+        self.assertEqual(
+            self.dump([self.uni], fmt="raw", protfilter=UNI_PROTOCOL, limit=2),
+            version(1) + eph(3),
+        )
+        self.assertEqual(
+            self.dump([self.uni, self.uni], fmt="raw", protfilter=UNI_PROTOCOL),
+            (version(1) + eph(3) + eph(5)) * 2,
+        )
+
+    def testtext(self):
+        out = self.dump([self.uni], msgfilter=["GPSEPH", "GNRMC"]).decode().splitlines()
+        self.assertEqual(len(out), 3)
+        self.assertTrue(
+            out[0].startswith(
+                "<UNI(GPSEPH, cpuidle=0, timeref=0, timestatus=0, wno=2406, "
+            )
+        )
+        self.assertIn(", prn=3, health=0, ", out[0])
+        self.assertTrue(
+            out[1].startswith("<NMEA(GNRMC, time=08:41:59, status=A, lat=32.0658325")
+        )
+
+    def testjson(self):
+        out = [
+            json.loads(line)
+            for line in self.dump([self.uni], fmt="json").decode().splitlines()
+        ]
+        self.assertEqual(
+            [msg["identity"] for msg in out],
+            [
+                "VERSION",
+                "GPSEPH",
+                "GNGLL",
+                "1005",
+                "4072",
+                "1077",
+                "1087",
+                "1097",
+                "1127",
+                "1230",
+                "GNRMC",
+                "GPSEPH",
+            ],
+        )
+        self.assertEqual(out[1]["prn"], 3)
+
+    def testcsv(self):
+        out = (
+            self.dump([self.uni], fmt="csv", msgfilter=["VERSION", "GNRMC"])
+            .decode()
+            .splitlines()
+        )
+        self.assertTrue(
+            out[0].startswith(
+                "identity,cpuidle,timeref,timestatus,wno,tow,version,leapsecond,delay,device"
+            )
+        )
+        self.assertTrue(out[1].startswith("VERSION,0,0,0,2406,1,0,0,0,M982"))
+        self.assertEqual(
+            out[2],
+            "identity,time,status,lat,NS,lon,EW,spd,cog,date,mv,mvEW,posMode,navStatus",
+        )
+        self.assertEqual(
+            out[3], "GNRMC,08:41:59,A,32.0658325,N,34.773819,E,0.0,,2022-02-08,,,D,V"
+        )
+
+    def testcsvheaders(
+        self,
+    ):  # one header per distinct set of columns, including group repeats
+        obs = [
+            UNIMessage(
+                msgid=12, wno=2406, tow=tow, numobs=tow % 2 + 1, prn_01=tow
+            ).serialize()
+            for tow in range(6)
+        ]
+        with open(self.uni, "wb") as stream:
+            stream.write(b"".join(obs) + eph(3) + eph(5))
+        single = self.dump([self.uni], fmt="csv")
+        out = single.decode().splitlines()
+        headers = [line for line in out if line.startswith("identity,")]
+        self.assertEqual(len(out), 8 + len(headers))
+        self.assertEqual(len(headers), 3)
+        self.assertTrue(
+            headers[0].endswith(
+                ",numobs,sysfreq_01,prn_01,psr_01,adr_01,psrstd_01,adrstd_01,dopp_01,cn0_01,reserved_01,locktime_01,chtrstatus_01"
+            )
+        )
+        self.assertTrue(headers[1].endswith(",locktime_02,chtrstatus_02"))
+        self.assertEqual(out[0:3], [headers[0], out[1], headers[1]])
+        with patch("pyunigps.unidump.BATCHSIZE", 2):
+            self.assertEqual(self.dump([self.uni], fmt="csv", workers=2), single)
+
+    def testworkers(self):
+        single = self.dump([self.uni], fmt="json")
+        with patch("pyunigps.unidump.BATCHSIZE", 5):
+            self.assertEqual(self.dump([self.uni], fmt="json", workers=2), single)
+        with self.assertRaisesRegex(
+            ParameterError, "Multiple workers are only supported for file input"
+        ):
+            UNIDumper(["-"], BytesIO(), workers=2)
+        with self.assertRaisesRegex(ParameterError, "Invalid format xml"):
+            UNIDumper(["-"], BytesIO(), fmt="xml")
+
+    def testerrors(self):
+        bad = version(2)[:-1] + b"\x00"
+        with open(self.uni, "wb") as stream:
+            stream.write(version(1) + bad + version(3))
+        with self.assertLogs("pyunigps.unidump", level="ERROR"):
+            out = self.dump([self.uni], fmt="json")
+        self.assertEqual(
+            [json.loads(line)["tow"] for line in out.decode().splitlines()], [1, 3]
+        )
+        with self.assertRaises(UNIParseError):
+            self.dump([self.uni], fmt="json", quitonerror=ERR_RAISE)
+        self.assertEqual(
+            self.dump([self.uni], fmt="text", quitonerror=0).count(b"\n"), 2
+        )
+
+    def teststdin(self):
+        with patch("sys.stdin", StringIO()) as stdin:
+            stdin.buffer = BytesIO(self.data)
+            self.assertEqual(
+                self.dump(["-"], fmt="raw", msgfilter=["GPSEPH"]), eph(3) + eph(5)
+            )
+
+    def testsocket(self):
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
+
+            def serve():
+                conn, _ = server.accept()
+                with conn:
+                    conn.sendall(self.data)
+
+            thread = threading.Thread(target=serve, daemon=True)
+            thread.start()
+            self.assertEqual(
+                self.dump(
+                    [f"tcp://127.0.0.1:{port}"], fmt="raw", protfilter=UNI_PROTOCOL
+                ),
+                version(1) + eph(3) + eph(5),
+            )
+            thread.join()
+
+    def testmain(self):
+        outfile = os.path.join(self.tmpdir.name, "out.ndjson")
+        self.assertEqual(
+            main([self.uni, "-f", "json", "-m", "GPSEPH,1005", "-o", outfile]), 0
+        )
+        with open(outfile, encoding="utf-8") as stream:
+            self.assertEqual(
+                [json.loads(line)["identity"] for line in stream],
+                ["GPSEPH", "1005", "GPSEPH"],
+            )
+        with patch("sys.stderr", StringIO()) as err:
+            with self.assertRaises(SystemExit):
+                main(["-", "-w", "2", "-o", outfile])
+            with self.assertRaises(SystemExit):
+                main([self.uni, "-f", "xml"])
+            self.assertIn(
+                "Multiple workers are only supported for file input", err.getvalue()
+            )
+            self.assertIn("invalid choice: 'xml'", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
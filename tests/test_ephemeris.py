@@ -0,0 +1,134 @@
+"""
+Ephemeris payload definition and UNIEphemerisStore tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from io import BytesIO
+
+from pyunigps import ParameterError, UNIEphemerisStore, UNIMessage, UNIReader
+
+
+def eph(
+    msgid: int = 106, prn: int = 5, week: int = 2406, toe: float = 7200, iode: int = 1
+) -> UNIMessage:
+    return UNIMessage(
+        msgid=msgid,
+        wno=week,
+        tow=int(toe * 1000),
+        prn=prn,
+        week=week,
+        toe=float(toe),
+        iode1=iode,
+        iode2=iode,
+        a=26560000.0,
+        ecc=0.01,
+        toc=float(toe),
+    )
+
+
+def gloeph(
+    slot: int = 38, week: int = 2406, etime: int = 900000, issue: int = 10
+) -> UNIMessage:
+    return UNIMessage(
+        msgid=107,
+        wno=week,
+        tow=etime,
+        slot=slot,
+        freqo=7,
+        eweek=week,
+        etime=etime,
+        issue=issue,
+        posx=1.0e7,
+    )
+
+
+class EphemerisTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testpayloaddefs(self):  # roundtrip via serialize/parse
+        for msgid in (106, 108, 109, 110, 112, 2999):
+            msg = eph(msgid, toe=14400.5)
+            self.assertEqual(len(msg.payload), 224)
+            parsed = UNIReader.parse(msg.serialize())
+            self.assertEqual(
+                (parsed.prn, parsed.toe, parsed.a), (5, 14400.5, 26560000.0)
+            )
+        msg = gloeph()
+        self.assertEqual(len(msg.payload), 144)
+        parsed = UNIReader.parse(msg.serialize())
+        self.assertEqual((parsed.slot, parsed.etime, parsed.posx), (38, 900000, 1.0e7))
+
+    def testlookup(self):
+        store = UNIEphemerisStore()
+        self.assertTrue(store.update(eph(toe=7200)))
+        self.assertTrue(store.update(eph(toe=14400, iode=2)))
+        self.assertFalse(store.update(eph(toe=14400, iode=2)))  # repeat
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.get("GPS", 5, 2406, 8000).toe, 7200)
+        self.assertEqual(store.get("GPS", 5, 2406, 12000).toe, 14400)
+        self.assertEqual(store.get("GPS", 5).toe, 14400)  # latest
+        self.assertIsNone(store.get("GPS", 5, 2406, 30000))  # expired
+        self.assertIsNone(store.get("GPS", 6, 2406, 8000))
+        self.assertEqual(store.satellites(), [("GPS", 5)])
+
+    def testsupersede(self):
+        store = UNIEphemerisStore(maxsets=2)
+        store.update(eph(toe=7200, iode=1))
+        store.update(eph(toe=7200, iode=3))  # new upload, same toe
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.get("GPS", 5).iode1, 3)
+        store.update(eph(toe=14400))
+        store.update(eph(toe=21600))  # exceeds maxsets
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.get("GPS", 5, 2406, 7000))
+        store = UNIEphemerisStore()
+        store.update(eph(toe=7200))
+        store.update(eph(toe=36000))  # window of first set fully superseded
+        self.assertEqual(len(store), 1)
+
+    def testconstellations(self):
+        store = UNIEphemerisStore(validity={"GLONASS": 900})
+        store.update(eph(108, prn=7, week=1050, toe=3600))  # BDT
+        store.update(eph(109, prn=7, toe=3600))
+        store.update(gloeph())
+        self.assertEqual(store.get("BDS", 7, 2406, 3614).prn, 7)
+        self.assertIsNone(store.get("BDS", 7, 1050, 3600))
+        self.assertEqual(store.get("GAL", 7, 2406, 3600).identity, "GALEPH")
+        self.assertEqual(store.get("GLONASS", 38, 2406, 1700).issue, 10)
+        self.assertIsNone(store.get("GLONASS", 38, 2406, 1900))
+        self.assertEqual(len(store.satellites("GAL")), 1)
+        self.assertEqual(store.prune(2406, 10000), 2)  # GAL still valid
+        self.assertEqual(store.satellites(), [("GAL", 7)])
+
+    def testload(self):
+        stream = BytesIO(
+            eph(toe=7200).serialize()
+            + UNIMessage(
+                msgid=65512, wno=2406, tow=1, payload=b"\x01\x02\x03\x04\x05"
+            ).serialize()
+            + eph(prn=9).serialize()
+        )
+        store = UNIEphemerisStore()
+        self.assertEqual(store.load(UNIReader(stream)), 2)
+        self.assertEqual(store.updates, 2)
+        store.clear()
+        self.assertEqual((len(store), store.updates), (0, 0))
+        with self.assertRaisesRegex(ParameterError, "Invalid maxsets"):
+            UNIEphemerisStore(maxsets=0)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
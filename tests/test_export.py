@@ -0,0 +1,330 @@
+"""
+Structured export (to_dict, as_tuple, JSON) tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import json
+import unittest
+from datetime import date
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from pyunigps import (
+    BITS_MSB,
+    JSON_ENCODER,
+    R4,
+    REGISTRY,
+    U1,
+    U2,
+    U4,
+    UNI_MSGIDS,
+    UNI_PAYLOADS_GET,
+    X1,
+    UNIJSONWriter,
+    UNIMessage,
+    UNIOpaqueMessage,
+    UNIReader,
+    json_default,
+)
+
+HEADER = {
+    "cpuidle": 0,
+    "timeref": 0,
+    "timestatus": 0,
+    "wno": 2406,
+    "tow": 0,
+    "version": 0,
+    "leapsecond": 0,
+    "delay": 0,
+}
+
+MYMSG = {
+    "count": U1,
+    "flags": (X1, {"fix": "U002", "reserved1": "U002", "valid": "U001"}),
+    "outer": (
+        "count",
+        {
+            "numinner": U1,
+            "inner": (2, {"val": U2}),
+        },
+    ),
+    "block": (BITS_MSB, {"a": "U004", "reserved2": "U004"}),
+    "tail": ("None", {"x": U2, "y": R4}),
+}
+
+
+def obs(prns: list) -> bytes:
+    kwargs = {"numobs": len(prns)}
+    for i, prn in enumerate(prns):
+        kwargs[f"prn_{i + 1:02d}"] = prn
+        kwargs[f"cn0_{i + 1:02d}"] = 40.25 + i
+    return UNIMessage(msgid=12, wno=2406, tow=0, **kwargs).serialize()
+
+
+class ExportTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.obs = UNIReader.parse(obs([3, 12]))
+
+    def tearDown(self):
+        pass
+
+    def testtodict(self):
+        rec = {
+            "sysfreq": 0,
+            "psr": 0.0,
+            "adr": 0.0,
+            "psrstd": 0.0,
+            "adrstd": 0.0,
+            "dopp": 0.0,
+            "reserved": 0,
+            "locktime": 0.0,
+            "chtrstatus": b"\x00\x00\x00\x00",
+        }
+        dic = self.obs.to_dict()
+        self.assertEqual(
+            dic,
+            {
+                "identity": "OBSVM",
+                **HEADER,
+                "numobs": 2,
+                "group": [
+                    {**rec, "prn": 3, "cn0": 40.25},
+                    {**rec, "prn": 12, "cn0": 41.25},
+                ],
+            },
+        )
+        self.assertEqual(
+            list(dic)[0:10],
+            [
+                "identity",
+                "cpuidle",
+                "timeref",
+                "timestatus",
+                "wno",
+                "tow",
+                "version",
+                "leapsecond",
+                "delay",
+                "numobs",
+            ],
+        )
+        self.assertEqual(
+            list(dic["group"][0]),
+            [
+                "sysfreq",
+                "prn",
+                "psr",
+                "adr",
+                "psrstd",
+                "adrstd",
+                "dopp",
+                "cn0",
+                "reserved",
+                "locktime",
+                "chtrstatus",
+            ],
+        )
+
+    def testastuple(self):
+        self.assertEqual(
+            self.obs.as_tuple(),
+            (
+                "OBSVM",
+                0,
+                0,
+                0,
+                2406,
+                0,
+                0,
+                0,
+                0,
+                2,
+                (
+                    (0, 3, 0.0, 0.0, 0.0, 0.0, 0.0, 40.25, 0, 0.0, b"\x00\x00\x00\x00"),
+                    (
+                        0,
+                        12,
+                        0.0,
+                        0.0,
+                        0.0,
+                        0.0,
+                        0.0,
+                        41.25,
+                        0,
+                        0.0,
+                        b"\x00\x00\x00\x00",
+                    ),
+                ),
+            ),
+        )
+
+    def testsingle(self):
+        msg = UNIMessage(msgid=17, wno=2406, tow=0, device="M982", swversion="R4.10")
+        dic = msg.to_dict()
+        self.assertEqual(
+            list(dic)[9:],
+            ["device", "swversion", "authtype", "psn", "efuseid", "comptime"],
+        )
+        self.assertEqual(dic["device"], msg.device)
+        self.assertEqual(msg.as_tuple(), tuple(dic.values()))
+
+    def testbitblock(self):
+        msg = UNIReader.parse(
+            UNIMessage(
+                msgid=138, wno=2406, tow=0, numobs=1, prn_01=7, cn0code_01=25
+            ).serialize()
+        )
+        self.assertEqual(
+            msg.to_dict()["group"],
+            [
+                {
+                    "chtrstatus": 0,
+                    "dopp": 0,
+                    "psr": 0,
+                    "adr": 0,
+                    "psrstdcode": 0,
+                    "adrstdcode": 0,
+                    "prn": 7,
+                    "locktime": 0,
+                    "cn0code": 25,
+                    "glofreqcode": 0,
+                }
+            ],
+        )
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    def testnested(
+        self,
+    ):  # nested groups, bitfields, bit-packed blocks and 'variable by size' groups
+        REGISTRY.register(64000, "MYMSG", MYMSG)
+        kwargs = {
+            "count": 2,
+            "fix": 3,
+            "valid": 1,
+            "numinner_01": 1,
+            "val_01_01": 11,
+            "val_01_02": 12,
+            "numinner_02": 2,
+            "val_02_01": 21,
+            "val_02_02": 22,
+            "a": 9,
+        }
+        payload = (
+            UNIMessage(msgid=64000, wno=2406, tow=0, **kwargs).payload
+            + b"\x05\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00"
+        )
+        raw = UNIMessage(msgid=64000, wno=2406, tow=0, payload=payload).serialize()
+        msg = UNIReader.parse(raw)
+        body = {
+            "count": 2,
+            "fix": 3,
+            "valid": 1,
+            "outer": [
+                {"numinner": 1, "inner": [{"val": 11}, {"val": 12}]},
+                {"numinner": 2, "inner": [{"val": 21}, {"val": 22}]},
+            ],
+            "a": 9,
+            "tail": [{"x": 5, "y": 0.0}, {"x": 6, "y": 0.0}],
+        }
+        self.assertEqual(msg.to_dict(), {"identity": "MYMSG", **HEADER, **body})
+        self.assertEqual(
+            msg.as_tuple()[9:],
+            (
+                2,
+                3,
+                1,
+                ((1, ((11,), (12,))), (2, ((21,), (22,)))),
+                9,
+                ((5, 0.0), (6, 0.0)),
+            ),
+        )
+        msg = UNIReader.parse(raw, parsebitfield=False)
+        self.assertEqual(list(msg.to_dict())[9:12], ["count", "flags", "outer"])
+        self.assertEqual(msg.to_dict()["flags"], b"\x13")
+        REGISTRY.register(
+            64000, "MYMSG", {"count": U1}
+        )  # schema follows new definition
+        self.assertEqual(
+            list(
+                UNIReader.parse(
+                    UNIMessage(msgid=64000, wno=2406, tow=0, count=1).serialize()
+                ).to_dict()
+            )[9:],
+            ["count"],
+        )
+        REGISTRY.invalidate("MYMSG")
+
+    def testprojected(self):
+        msg = UNIReader.parse(obs([3, 12]), projection={"OBSVM": ("prn",)})
+        self.assertEqual(msg.to_dict(), self.obs.to_dict())
+
+    def testnominal(self):
+        msg = UNIMessage(msgid=12345, wno=2406, tow=0, payload=b"\x01\x02")
+        self.assertEqual(
+            msg.to_dict(),
+            {"identity": "3039-NOMINAL", **HEADER, "payload": b"\x01\x02"},
+        )
+        self.assertEqual(
+            msg.as_tuple(), ("3039-NOMINAL", 0, 0, 0, 2406, 0, 0, 0, 0, b"\x01\x02")
+        )
+        opq = UNIOpaqueMessage(msg.serialize())
+        self.assertEqual(opq.to_dict(), msg.to_dict())
+        self.assertEqual(opq.to_json(), msg.to_json())
+
+    def testjson(self):
+        txt = self.obs.to_json()
+        self.assertNotIn(" ", txt)
+        self.assertEqual(
+            json.loads(txt)["group"][1],
+            {
+                "sysfreq": 0,
+                "prn": 12,
+                "psr": 0.0,
+                "adr": 0.0,
+                "psrstd": 0.0,
+                "adrstd": 0.0,
+                "dopp": 0.0,
+                "cn0": 41.25,
+                "reserved": 0,
+                "locktime": 0.0,
+                "chtrstatus": "00000000",
+            },
+        )
+        self.assertEqual(JSON_ENCODER.encode({"a": memoryview(b"\xff")}), '{"a":"ff"}')
+        self.assertEqual(JSON_ENCODER.encode([date(2022, 2, 8)]), '["2022-02-08"]')
+        with self.assertRaisesRegex(
+            TypeError, "Object of type set is not JSON serializable"
+        ):
+            json_default({1})
+
+    def testwriter(self):
+        nmea = (
+            b"$GNRMC,084159.00,A,3203.94995,N,03446.42914,E,0.000,,080222,,,D,V*1F\r\n"
+        )
+        msgs = [parsed for _, parsed in UNIReader(BytesIO(obs([3]) + nmea))]
+        out = StringIO()
+        writer = UNIJSONWriter(out)
+        for msg in msgs:
+            writer.write(msg)
+        self.assertEqual(writer.count, 2)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(json.loads(lines[0]), json.loads(msgs[0].to_json()))
+        self.assertEqual(json.loads(lines[1])["identity"], "GNRMC")
+        self.assertEqual(json.loads(lines[1])["lat"], 32.0658325)
+        self.assertEqual(json.loads(lines[1])["time"], "08:41:59")
+        out = BytesIO()
+        UNIJSONWriter(out).write(msgs[0])
+        self.assertEqual(out.getvalue(), msgs[0].to_json().encode() + b"\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+"""
+UNI frame filter tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from pyunigps import (
+    REGISTRY,
+    U1,
+    U2,
+    UNI_MSGIDS,
+    UNI_PAYLOADS_GET,
+    UNI_PAYLOADS_GET_VERSIONED,
+    X1,
+    ParameterError,
+    UNIChangeFilter,
+    UNIFieldFilter,
+    UNIMessage,
+    UNIReader,
+)
+
+
+def version(tow: int, swversion: str = "R4.10Build5251", wno: int = 2406) -> bytes:
+    return UNIMessage(
+        msgid=17,
+        wno=wno,
+        tow=tow,
+        device="M982",
+        swversion=swversion,
+        authtype="HRPT00-S10C-P",
+        psn="-",
+        efuseid="ffff48ffff0fffff",
+        comptime="2021/11/26",
+    ).serialize()
+
+
+def dummy(tow: int) -> bytes:
+    return UNIMessage(
+        msgid=65512, wno=2406, tow=tow, payload=b"\x01\x02\x03\x04\x05"
+    ).serialize()
+
+
+def eph(prn: int, health: int = 0) -> bytes:
+    return UNIMessage(
+        msgid=106, wno=2406, tow=prn, prn=prn, health=health, a=26560000.0
+    ).serialize()
+
+
+def obs(prns: list, cn0: float = 45.0) -> bytes:
+    kwargs = {"numobs": len(prns)}
+    for i, prn in enumerate(prns):
+        kwargs[f"prn_{i + 1:02d}"] = prn
+        kwargs[f"cn0_{i + 1:02d}"] = cn0 + i
+        kwargs[f"chtrstatus_{i + 1:02d}"] = bytes((0, prn, 0, 0))
+    return UNIMessage(msgid=12, wno=2406, tow=0, **kwargs).serialize()
+
+
+class FilterTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testchangeonly(self):
+        flt = UNIChangeFilter()
+        frames = [version(1000), version(2000), version(3000, "X"), version(4000, "X")]
+        self.assertEqual([flt(raw) for raw in frames], [True, False, True, False])
+        self.assertEqual((flt.passed, flt.suppressed), (2, 2))
+        flt.reset()
+        self.assertTrue(flt(version(5000, "X")))
+
+    def testnotfiltered(self):  # msgids not subject to filter always pass
+        flt = UNIChangeFilter()
+        self.assertEqual([flt(dummy(1)), flt(dummy(2))], [True, True])
+        flt = UNIChangeFilter(msgids=None)
+        self.assertEqual([flt(dummy(1)), flt(dummy(2))], [True, False])
+
+    def testheartbeat(self):
+        flt = UNIChangeFilter(msgids=("VERSION",), heartbeat=5)
+        tows = [0, 1000, 4999, 5000, 6000, 10000]
+        self.assertEqual(
+            [flt(version(tow)) for tow in tows], [True, False, False, True, False, True]
+        )
+        # week rollover and time going backwards
+        self.assertTrue(flt(version(604799000, wno=2405)))
+        self.assertFalse(flt(version(1000, wno=2406)))
+        self.assertTrue(flt(version(7000, wno=2406)))
+
+    def testreader(self):
+        stream = BytesIO(version(1) + dummy(1) + version(2) + version(3, "X"))
+        flt = UNIChangeFilter()
+        res = [parsed.identity for _, parsed in UNIReader(stream, framefilter=flt)]
+        self.assertEqual(res, ["VERSION", "TEST12", "VERSION"])
+        self.assertEqual(flt.suppressed, 1)
+
+    def testinvalid(self):
+        with self.assertRaisesRegex(ParameterError, "Invalid heartbeat"):
+            UNIChangeFilter(heartbeat=-1)
+        with self.assertRaisesRegex(ParameterError, "Unknown msgid 'XXX'"):
+            UNIChangeFilter(msgids=("XXX",))
+
+    def testfieldsingle(self):
+        flt = UNIFieldFilter({"GPSEPH": [("prn", "<=", 5), ("health", "==", 0)]})
+        frames = [eph(prn, prn % 2) for prn in range(1, 9)]
+        self.assertEqual(
+            [flt(raw) for raw in frames],
+            [False, True, False, True, False, False, False, False],
+        )
+        self.assertEqual((flt.passed, flt.rejected), (2, 6))
+        self.assertFalse(flt(version(1)))  # other msgid discarded
+        flt = UNIFieldFilter(
+            {106: [("prn", "in", (3, 7))], "VERSION": [("device", "==", "M982")]},
+            passthrough=True,
+        )
+        self.assertEqual([flt(raw) for raw in frames].count(True), 2)
+        self.assertTrue(
+            flt(UNIMessage(msgid=17, wno=2406, tow=0, device="M982").serialize())
+        )
+        self.assertFalse(
+            flt(UNIMessage(msgid=17, wno=2406, tow=0, device="UM98").serialize())
+        )
+        self.assertTrue(flt(dummy(1)))  # passthrough
+        flt = UNIFieldFilter({"GPSEPH": [("a", ">", 26000000.0)]})
+        self.assertTrue(flt(frames[0]))
+
+    def testfieldgroup(self):
+        frames = [obs([3, 12, 25]), obs([4, 5]), obs([]), obs([12], 30.0)]
+        flt = UNIFieldFilter({"OBSVM": [("prn", "==", 12)]})  # any repeat
+        self.assertEqual([flt(raw) for raw in frames], [True, False, False, True])
+        flt = UNIFieldFilter(
+            {"OBSVM": [("prn", "==", 12), ("cn0", ">=", 40)]}
+        )  # scaled
+        self.assertEqual([flt(raw) for raw in frames], [True, False, False, False])
+        flt = UNIFieldFilter({"OBSVM": [("prn_02", "==", 5)]})  # specific repeat
+        self.assertEqual([flt(raw) for raw in frames], [False, True, False, False])
+        flt = UNIFieldFilter({"OBSVM": [("numobs", ">", 2)]})
+        self.assertEqual([flt(raw) for raw in frames], [True, False, False, False])
+        flt = UNIFieldFilter({"OBSVM": [("chtrstatus", "==", b"\x00\x19\x00\x00")]})
+        self.assertEqual([flt(raw) for raw in frames], [True, False, False, False])
+        self.assertFalse(flt(frames[0][:-30]))  # truncated
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    @patch.dict(UNI_PAYLOADS_GET_VERSIONED)
+    def testfieldbitfield(
+        self,
+    ):  # bitfield flags, 'variable by size' groups and versions
+        REGISTRY.register(
+            64000,
+            "MYMSG",
+            {
+                "flags": (X1, {"fix": "U002", "valid": "U001"}),
+                "group": ("None", {"sv": U1}),
+            },
+        )
+        REGISTRY.register_version(
+            "MYMSG", {"pad": U2, "flags": (X1, {"fix": "U002", "valid": "U001"})}, 1
+        )
+        flt = UNIFieldFilter({"MYMSG": [("fix", "==", 2), ("valid", "&", 1)]})
+        raw = UNIMessage(
+            msgid=64000, wno=2406, tow=0, payload=b"\x06\x01\x02"
+        ).serialize()
+        self.assertTrue(flt(raw))
+        raw = UNIMessage(
+            msgid=64000, wno=2406, tow=0, payload=b"\x02\x01\x02"
+        ).serialize()
+        self.assertFalse(flt(raw))
+        raw = UNIMessage(
+            msgid=64000, wno=2406, tow=0, version=1, payload=b"\x00\x00\x06"
+        ).serialize()
+        self.assertTrue(flt(raw))
+        flt = UNIFieldFilter({"MYMSG": [("sv", "==", 2)]})
+        raw = UNIMessage(
+            msgid=64000, wno=2406, tow=0, payload=b"\x06\x01\x02"
+        ).serialize()
+        self.assertTrue(flt(raw))
+        raw = UNIMessage(
+            msgid=64000, wno=2406, tow=0, version=1, payload=b"\x00\x00\x06"
+        ).serialize()
+        self.assertFalse(flt(raw))  # no such attribute in version 1 layout
+        self.assertFalse(flt(raw))
+        self.assertEqual((flt.passed, flt.rejected, flt.incompatible), (1, 2, 2))
+        self.assertIs(flt._compiled[(64000, 1)], False)  # cached
+        REGISTRY.invalidate("MYMSG")
+
+    def testfieldreader(self):
+        stream = BytesIO(b"".join(eph(prn, prn % 2) for prn in range(1, 9)) + obs([12]))
+        flt = UNIFieldFilter({"GPSEPH": [("health", "==", 1)]}, passthrough=True)
+        res = [
+            (parsed.identity, getattr(parsed, "prn", 0))
+            for _, parsed in UNIReader(stream, framefilter=flt)
+        ]
+        self.assertEqual(
+            res,
+            [("GPSEPH", 1), ("GPSEPH", 3), ("GPSEPH", 5), ("GPSEPH", 7), ("OBSVM", 0)],
+        )
+
+    def testfieldinvalid(self):
+        errs = (
+            ({"XXX": [("prn", "==", 1)]}, "Unknown msgid 'XXX'"),
+            ({"GPSEPH": [("prn", "~", 1)]}, "Invalid condition"),
+            ({"GPSEPH": [("prn", 1)]}, "Invalid condition"),
+            (
+                {"GPSEPH": [("xxx", "==", 1)]},
+                "Attribute xxx not found at fixed offset in GPSEPH",
+            ),
+            ({"GPSEPH": [("prn_01", "==", 1)]}, "Attribute prn_01 not found"),
+            ({"OBSVMCMP": [("prn", "==", 1)]}, "Attribute prn not found"),  # bit-packed
+            ({"BESTNAV": [("postype", "==", 50)]}, "No payload definition for BESTNAV"),
+        )
+        for conds, err in errs:
+            with self.assertRaisesRegex(ParameterError, err):
+                UNIFieldFilter(conds)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Lazy NMEA / RTCM3 backend import tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import subprocess
+import sys
+import unittest
+
+import pynmeagps
+
+import pyunigps
+from pyunigps.unireader import NMEA_HDR, nmea_backend, rtcm_backend
+
+DIRNAME = os.path.dirname(__file__)
+SRC = os.path.join(DIRNAME, "..", "src")
+
+
+def run(script: str) -> str:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    res = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return res.stdout.strip()
+
+
+class LazyTest(unittest.TestCase):
+    def testimport(self):  # importing pyunigps doesn't load backends
+        out = run(
+            "import sys, pyunigps;"
+            "print('pynmeagps' in sys.modules, 'pyrtcm' in sys.modules)"
+        )
+        self.assertEqual(out, "False False")
+
+    def testuniOnly(self):  # NMEA filtered out of UNI stream doesn't load backends
+        script = (
+            "import sys;"
+            "from io import BytesIO;"
+            "from pyunigps import UNIReader, UNIMessage, UNI_PROTOCOL;"
+            f"nmea = open({os.path.join(DIRNAME, 'pygpsdata_nmea.log')!r}, 'rb').read();"
+            "uni = UNIMessage(msgid=17, wno=2406, tow=1000, device='M982').serialize();"
+            "p = [p for _, p in UNIReader(BytesIO(nmea + uni), protfilter=UNI_PROTOCOL)];"
+            "print(p[0].identity, 'pynmeagps' in sys.modules, 'pyrtcm' in sys.modules)"
+        )
+        self.assertEqual(run(script), "VERSION False False")
+
+    def testnmeaLoaded(self):  # NMEA parse loads pynmeagps only
+        script = (
+            "import sys;"
+            "from pyunigps import UNIReader, NMEA_PROTOCOL;"
+            f"f = open({os.path.join(DIRNAME, 'pygpsdata_nmea.log')!r}, 'rb');"
+            "p = [p for _, p in UNIReader(f, protfilter=NMEA_PROTOCOL)];"
+            "print(len(p) > 0, p[0].__class__.__name__,"
+            " 'pynmeagps' in sys.modules, 'pyrtcm' in sys.modules)"
+        )
+        self.assertEqual(run(script), "True NMEAMessage True False")
+
+    def testrtcmLoaded(self):  # RTCM3 parse loads pyrtcm
+        script = (
+            "import sys;"
+            "from pyunigps import UNIReader, RTCM3_PROTOCOL;"
+            f"f = open({os.path.join(DIRNAME, 'pygpsdata_mixed_rtcm3.log')!r}, 'rb');"
+            "p = [p for _, p in UNIReader(f, protfilter=RTCM3_PROTOCOL)];"
+            "print(len(p) > 0, p[0].__class__.__name__, 'pyrtcm' in sys.modules)"
+        )
+        self.assertEqual(run(script), "True RTCMMessage True")
+
+    def testNMEAHDR(self):  # local copy matches pynmeagps
+        self.assertEqual(NMEA_HDR, frozenset(pynmeagps.NMEA_HDR))
+
+    def testbackends(self):
+        reader, errors = nmea_backend()
+        self.assertIs(reader, pynmeagps.NMEAReader)
+        self.assertIn(pynmeagps.NMEAParseError, errors)
+        reader, errors = rtcm_backend()
+        self.assertEqual(reader.__name__, "RTCMReader")
+        self.assertTrue(len(errors) > 0)
+
+    def testSocketWrapper(self):
+        self.assertIs(pyunigps.SocketWrapper, pynmeagps.SocketWrapper)
+        with self.assertRaisesRegex(AttributeError, "has no attribute 'nosuch'"):
+            pyunigps.nosuch  # pylint: disable=pointless-statement
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Non-blocking (short read tolerant) UNIReader tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import socket
+import unittest
+from io import BytesIO
+
+from pyunigps import (
+    ERR_RAISE,
+    UNIMessage,
+    UNIReader,
+    UNIStreamError,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class TimeoutStream:
+    """
+    Simulates serial port with read timeout - reads return only the
+    bytes which have arrived so far.
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def arrive(self, data: bytes):
+        self._buf += data
+
+    def read(self, size: int) -> bytes:
+        data = bytes(self._buf[:size])
+        del self._buf[:size]
+        return data
+
+    def readline(self) -> bytes:
+        eol = self._buf.find(b"\x0a") + 1
+        return self.read(eol or len(self._buf))
+
+
+def version(tow: int) -> bytes:
+    return UNIMessage(
+        msgid=17, wno=2406, tow=tow, device="M982", swversion="R4.10"
+    ).serialize()
+
+
+class NonBlockingTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.nmea = (
+            b"$GNRMC,084159.00,A,3203.94995,N,03446.42914,E,0.000,,080222,,,D,V*1F\r\n"
+        )
+
+    def tearDown(self):
+        pass
+
+    def testshortread(self):
+        stream = TimeoutStream()
+        unr = UNIReader(stream, nonblocking=True, quitonerror=ERR_RAISE)
+        self.assertEqual(unr.read(), (None, None))  # nothing arrived
+        raw = version(1)
+        stream.arrive(b"\x00" + raw[:2])
+        self.assertEqual(unr.read(), (None, None))
+        stream.arrive(raw[2:30])
+        self.assertEqual(unr.read(), (None, None))
+        stream.arrive(raw[30:] + self.nmea[:20])
+        raw_data, parsed = unr.read()
+        self.assertEqual(raw_data, raw)
+        self.assertEqual(parsed.tow, 1)
+        self.assertEqual(unr.read(), (None, None))
+        stream.arrive(self.nmea[20:] + version(2))
+        self.assertEqual(unr.read()[0], self.nmea)
+        self.assertEqual(unr.read()[1].tow, 2)
+        self.assertEqual(unr.read(), (None, None))
+
+    def testbytebybyte(self):  # same messages however data arrives
+        with open(os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log"), "rb") as stream:
+            data = stream.read()
+        expected = [raw for raw, _ in UNIReader(BytesIO(data))]
+        for size in (1, 5, 100):
+            stream = TimeoutStream()
+            unr = UNIReader(stream, nonblocking=True, quitonerror=ERR_RAISE)
+            msgs = []
+            for i in range(0, len(data), size):
+                stream.arrive(data[i : i + size])
+                msgs += [raw for raw, _ in unr]  # iterate until no complete message
+            self.assertEqual(msgs, expected)
+
+    def testblocking(self):  # default behaviour unchanged
+        stream = TimeoutStream()
+        stream.arrive(version(1)[:30])
+        with self.assertRaisesRegex(
+            UNIStreamError,
+            "Serial stream terminated unexpectedly. 312 bytes requested, 6 bytes returned.",
+        ):
+            UNIReader(stream, quitonerror=ERR_RAISE).read()
+
+    def testsocket(self):
+        raw = version(1)
+        sock1, sock2 = socket.socketpair()
+        with sock1, sock2:
+            sock2.setblocking(False)
+            sock1.sendall(raw[:50])
+            unr = UNIReader(sock2, nonblocking=True, bufsize=16)
+            self.assertEqual(unr.read(), (None, None))
+            sock1.sendall(raw[50:])
+            self.assertEqual(unr.read()[0], raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+"""
+Observation decoder tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import sys
+import unittest
+from unittest.mock import patch
+
+from pyunigps import (
+    UNIMessage,
+    UNIMessageError,
+    UNIReader,
+    decode_obsvcmp,
+    decode_obsvm,
+)
+
+# status, prn, psr, adr, psrstd index, adrstd, dopp, cn0, locktime, glofreq
+OBS = [
+    (0x08109C04, 5, 21234567.25, -1234567.5, 3, 2, -1234.5, 45, 123.5, 0),
+    (0x18119C24, 12, 24000000.0078125, 8000000.25, 15, 0, 3000.25, 51, 0.0, 0),
+    (0x0811BD44, 44, 19876543.5, -3.75, 0, 15, -0.00390625, 20, 65535.96875, -7),
+]
+
+
+def cmprecord(status, prn, psr, adr, psrstd, adrstd, dopp, cn0, lock, glofreq) -> bytes:
+    """Pack record field by field, independently of decoder."""
+    fields = [
+        (status, 32),
+        (round(dopp * 256) & 0xFFFFFFF, 28),
+        (round(psr * 128), 36),
+        (round(adr * 256) & 0xFFFFFFFF, 32),
+        (psrstd, 4),
+        (adrstd, 4),
+        (prn, 8),
+        (round(lock * 32), 21),
+        (cn0 - 20, 5),
+        (glofreq + 7, 6),
+        (0, 16),
+    ]
+    val = 0
+    pos = 0
+    for fval, bits in fields:
+        val |= fval << pos
+        pos += bits
+    return val.to_bytes(24, "little")
+
+
+def cmppayload(obs: list) -> bytes:
+    return len(obs).to_bytes(4, "little") + b"".join(cmprecord(*o) for o in obs)
+
+
+def obsvm(obs: list) -> UNIMessage:
+    kwargs = {"numobs": len(obs)}
+    for i, (status, prn, psr, adr, _, _, dopp, cn0, lock, _) in enumerate(obs):
+        i += 1
+        kwargs.update(
+            {
+                f"prn_{i:02d}": prn,
+                f"psr_{i:02d}": psr,
+                f"adr_{i:02d}": adr,
+                f"psrstd_{i:02d}": 0.17,
+                f"adrstd_{i:02d}": 0.002,
+                f"dopp_{i:02d}": dopp,
+                f"cn0_{i:02d}": float(cn0),
+                f"locktime_{i:02d}": lock,
+                f"chtrstatus_{i:02d}": status.to_bytes(4, "little"),
+            }
+        )
+    return UNIMessage(msgid=12, wno=2406, tow=1000, **kwargs)
+
+
+class ObsTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def _checkcmp(self, res):
+        self.assertEqual(len(res["prn"]), 3)
+        for i, (
+            status,
+            prn,
+            psr,
+            adr,
+            psrstd,
+            adrstd,
+            dopp,
+            cn0,
+            lock,
+            glofreq,
+        ) in enumerate(OBS):
+            self.assertEqual(int(res["status"][i]), status)
+            self.assertEqual(int(res["prn"][i]), prn)
+            self.assertEqual(float(res["psr"][i]), psr)
+            self.assertEqual(float(res["adr"][i]), adr)
+            self.assertEqual(float(res["psrstd"][i]), [0.169, 152.0, 0.05][i])
+            self.assertEqual(float(res["adrstd"][i]), (adrstd + 1) / 512)
+            self.assertEqual(float(res["dopp"][i]), dopp)
+            self.assertEqual(int(res["cn0"][i]), cn0)
+            self.assertEqual(float(res["locktime"][i]), lock)
+            self.assertEqual(int(res["glofreq"][i]), glofreq)
+
+    def testdecodecmp(self):
+        self._checkcmp(decode_obsvcmp(cmppayload(OBS)))
+
+    def testdecodecmpnonumpy(self):
+        with patch.dict(sys.modules, {"numpy": None}):
+            res = decode_obsvcmp(cmppayload(OBS))
+        self.assertIsInstance(res["psr"], list)
+        self._checkcmp(res)
+
+    def testparsecmp(self):  # OBSVMCMP parses bit-packed records as attributes
+        msg = UNIMessage(msgid=138, wno=2406, tow=1000, payload=cmppayload(OBS))
+        parsed = UNIReader.parse(msg.serialize())
+        self.assertEqual(parsed.identity, "OBSVMCMP")
+        self.assertEqual(parsed.numobs, 3)
+        for i, (
+            status,
+            prn,
+            psr,
+            adr,
+            psrstd,
+            adrstd,
+            dopp,
+            cn0,
+            lock,
+            glofreq,
+        ) in enumerate(OBS):
+            i += 1
+            self.assertEqual(getattr(parsed, f"chtrstatus_{i:02d}"), status)
+            self.assertEqual(getattr(parsed, f"prn_{i:02d}"), prn)
+            self.assertEqual(getattr(parsed, f"psr_{i:02d}"), psr)
+            self.assertEqual(getattr(parsed, f"adr_{i:02d}"), adr)
+            self.assertEqual(getattr(parsed, f"psrstdcode_{i:02d}"), psrstd)
+            self.assertEqual(getattr(parsed, f"adrstdcode_{i:02d}"), adrstd)
+            self.assertEqual(getattr(parsed, f"dopp_{i:02d}"), dopp)
+            self.assertEqual(getattr(parsed, f"cn0code_{i:02d}"), cn0 - 20)
+            self.assertEqual(getattr(parsed, f"locktime_{i:02d}"), lock)
+            self.assertEqual(getattr(parsed, f"glofreqcode_{i:02d}"), glofreq + 7)
+        self._checkcmp(decode_obsvcmp(parsed.payload))
+        # generate from attributes
+        kwargs = {key: val for key, val in parsed.__dict__.items() if key[0] != "_"}
+        self.assertEqual(UNIMessage(msgid=138, **kwargs).payload, parsed.payload)
+
+    def testdecodeobsvm(self):
+        parsed = UNIReader.parse(obsvm(OBS).serialize())
+        self.assertEqual(
+            (parsed.identity, parsed.numobs, parsed.prn_03), ("OBSVM", 3, 44)
+        )
+        self.assertEqual(len(parsed.payload), 4 + 3 * 40)
+        for patched in ({}, {"numpy": None}):
+            with patch.dict(sys.modules, patched):
+                res = decode_obsvm(parsed.payload)
+            for i, (status, prn, psr, adr, _, _, dopp, cn0, lock, _) in enumerate(OBS):
+                self.assertEqual(int(res["status"][i]), status)
+                self.assertEqual(int(res["prn"][i]), prn)
+                self.assertEqual(float(res["psr"][i]), psr)
+                self.assertEqual(float(res["adr"][i]), adr)
+                self.assertAlmostEqual(float(res["psrstd"][i]), 0.17)
+                self.assertAlmostEqual(float(res["adrstd"][i]), 0.002)
+                self.assertAlmostEqual(float(res["dopp"][i]), dopp, places=2)
+                self.assertAlmostEqual(float(res["cn0"][i]), cn0)
+                self.assertAlmostEqual(float(res["locktime"][i]), lock, places=2)
+
+    def testinvalid(self):
+        with self.assertRaisesRegex(UNIMessageError, "empty or truncated"):
+            decode_obsvcmp(b"\x01")
+        with self.assertRaisesRegex(
+            UNIMessageError, "inconsistent with 2 records of 24 bytes"
+        ):
+            decode_obsvcmp(cmppayload(OBS[0:2])[:-1])
+        with self.assertRaisesRegex(
+            UNIMessageError, "inconsistent with 1 records of 40 bytes"
+        ):
+            decode_obsvm(b"\x01\x00\x00\x00")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
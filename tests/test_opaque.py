@@ -0,0 +1,132 @@
+"""
+Opaque (undecoded) message tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from pyunigps import (
+    REGISTRY,
+    SET,
+    U1,
+    U4,
+    UNI_PAYLOADS_GET,
+    UNIMessage,
+    UNIMessageError,
+    UNIOpaqueMessage,
+    UNIParseError,
+    UNIReader,
+)
+
+
+def frame(msgid: int, **kwargs) -> bytes:
+    return UNIMessage(
+        msgid=msgid,
+        cpuidle=12,
+        timeref=1,
+        timestatus=2,
+        wno=2406,
+        tow=345000,
+        version=7,
+        leapsecond=18,
+        delay=5,
+        **kwargs,
+    ).serialize()
+
+
+class OpaqueTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.unknown = frame(12345, payload=b"\x01\x02\x03\x04\x05")
+        self.baseinfo = frame(176, payload=b"\x09\x00\x00\x00\x0a")
+        self.version = frame(17, device="M982")
+
+    def tearDown(self):
+        pass
+
+    def testnominal(self):  # unknown msgid identity
+        msg = UNIReader.parse(self.unknown)
+        self.assertIsInstance(msg, UNIMessage)
+        self.assertEqual(msg.identity, "3039-NOMINAL")
+        self.assertEqual(
+            str(msg), "<UNI(3039-NOMINAL, payload=b'\\x01\\x02\\x03\\x04\\x05')>"
+        )
+
+    def testopaque(self):
+        msg = UNIReader.parse(self.unknown, opaque=True)
+        self.assertIsInstance(msg, UNIOpaqueMessage)
+        full = UNIReader.parse(self.unknown)
+        for att in (
+            "cpuidle",
+            "timeref",
+            "timestatus",
+            "wno",
+            "tow",
+            "version",
+            "leapsecond",
+            "delay",
+            "checksum",
+            "msgmode",
+            "identity",
+        ):
+            self.assertEqual(getattr(msg, att), getattr(full, att), att)
+        self.assertEqual((msg.msgid, msg.length), (12345, 5))
+        self.assertIsInstance(msg.payload, memoryview)
+        self.assertEqual(msg.payload, b"\x01\x02\x03\x04\x05")
+        self.assertEqual(msg.serialize(), self.unknown)
+        self.assertEqual(str(msg), "<UNI(3039-NOMINAL, opaque, length=5)>")
+        self.assertEqual(
+            eval(repr(msg)).serialize(), self.unknown
+        )  # pylint: disable=eval-used
+        with self.assertRaises(AttributeError):  # slotted
+            msg.extra = 1  # pylint: disable=assigning-non-slot
+        self.assertEqual(str(msg.decode()), str(full))
+
+    def testopaqueundefined(self):  # documented msgid with no definition yet
+        msg = UNIReader.parse(self.baseinfo, opaque=True)
+        self.assertIsInstance(msg, UNIOpaqueMessage)
+        self.assertEqual(msg.identity, "BASEINFO")
+        self.assertIsInstance(UNIReader.parse(self.version, opaque=True), UNIMessage)
+        with self.assertRaises(UNIMessageError):  # only GET messages are opaque
+            UNIReader.parse(self.baseinfo, msgmode=SET, opaque=True)
+
+    @patch.dict(UNI_PAYLOADS_GET)
+    def testdecodelater(self):  # decode once definition is registered
+        msg = UNIReader.parse(self.baseinfo, opaque=True)
+        REGISTRY.register(176, "BASEINFO", {"status": U4, "flag": U1})
+        decoded = msg.decode()
+        self.assertEqual(
+            (decoded.identity, decoded.status, decoded.flag, decoded.tow),
+            ("BASEINFO", 9, 10, 345000),
+        )
+        self.assertIsInstance(UNIReader.parse(self.baseinfo, opaque=True), UNIMessage)
+        REGISTRY.invalidate("BASEINFO")
+
+    def testcrc(self):  # opaque frames are still validated
+        bad = self.unknown[:-1] + b"\x00"
+        with self.assertRaisesRegex(UNIParseError, "checksum"):
+            UNIReader.parse(bad, opaque=True)
+
+    def testreader(self):
+        stream = BytesIO(self.version + self.unknown + self.baseinfo)
+        msgs = [parsed for _, parsed in UNIReader(stream, opaque=True)]
+        self.assertEqual(
+            [type(msg).__name__ for msg in msgs],
+            ["UNIMessage", "UNIOpaqueMessage", "UNIOpaqueMessage"],
+        )
+        stream = BytesIO(self.version + self.unknown + self.baseinfo)
+        msgs = [parsed for _, parsed in UNIReader(stream)]
+        self.assertEqual([type(msg).__name__ for msg in msgs], ["UNIMessage"] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
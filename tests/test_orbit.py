@@ -0,0 +1,176 @@
+"""
+Vectorised satellite position tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import sys
+import unittest
+from math import atan2, cos, sin, sqrt
+from unittest.mock import patch
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyunigps import ParameterError, UNIMessage, satpos
+
+KEPLER = {
+    "a": 5153.65531**2,
+    "deltan": 4.5e-9,
+    "m0": 1.2,
+    "ecc": 0.005912,
+    "omega": 0.5,
+    "cuc": -6.0e-7,
+    "cus": 8.0e-6,
+    "crc": 230.0,
+    "crs": -12.0,
+    "cic": 1.0e-7,
+    "cis": -5.0e-8,
+    "i0": 0.9748,
+    "idot": 1.0e-10,
+    "omega0": -2.1,
+    "omegadot": -8.0e-9,
+    "af0": 1.0e-4,
+    "af1": -1.0e-12,
+    "af2": 0.0,
+}
+
+
+def eph(
+    msgid: int = 106, prn: int = 1, week: int = 2406, toe: float = 7200.0, **kwargs
+) -> UNIMessage:
+    return UNIMessage(
+        msgid=msgid,
+        wno=week,
+        tow=0,
+        prn=prn,
+        week=week,
+        toe=toe,
+        toc=toe,
+        **{**KEPLER, **kwargs},
+    )
+
+
+def reference(
+    e: UNIMessage, tk: float, gm: float = 3.986005e14, wie: float = 7.2921151467e-5
+) -> tuple:
+    """Scalar IS-GPS-200 reference implementation."""
+    mk = e.m0 + (sqrt(gm / e.a**3) + e.deltan) * tk
+    ek = mk
+    for _ in range(20):
+        ek = mk + e.ecc * sin(ek)
+    vk = atan2(sqrt(1 - e.ecc**2) * sin(ek), cos(ek) - e.ecc)
+    phik = vk + e.omega
+    uk = phik + e.cus * sin(2 * phik) + e.cuc * cos(2 * phik)
+    rk = e.a * (1 - e.ecc * cos(ek)) + e.crs * sin(2 * phik) + e.crc * cos(2 * phik)
+    ik = e.i0 + e.idot * tk + e.cis * sin(2 * phik) + e.cic * cos(2 * phik)
+    xp, yp = rk * cos(uk), rk * sin(uk)
+    om = e.omega0 + (e.omegadot - wie) * tk - wie * e.toe
+    pos = (
+        xp * cos(om) - yp * cos(ik) * sin(om),
+        xp * sin(om) + yp * cos(ik) * cos(om),
+        yp * sin(ik),
+    )
+    clk = (
+        e.af0
+        + e.af1 * tk
+        + e.af2 * tk**2
+        - 4.442807633e-10 * e.ecc * sqrt(e.a) * sin(ek)
+    )
+    return pos, clk
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class OrbitTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testkepler(self):
+        ephs = [eph(prn=1), eph(prn=2, m0=2.5, omega0=0.3)]
+        tows = np.arange(0, 14400, 900)
+        pos, clk = satpos(ephs, 2406, tows)
+        self.assertEqual((pos.shape, clk.shape), ((2, 16, 3), (2, 16)))
+        for s, e in enumerate(ephs):
+            for j, tow in enumerate(tows):
+                rpos, rclk = reference(e, tow - 7200.0)
+                np.testing.assert_allclose(pos[s, j], rpos, atol=1e-6)
+                self.assertAlmostEqual(clk[s, j], rclk, places=15)
+        radius = np.linalg.norm(pos, axis=-1)
+        self.assertTrue(((radius > 2.6e7) & (radius < 2.7e7)).all())
+
+    def testweekcrossover(self):  # tk computed across week boundary
+        pos1, _ = satpos([eph(toe=604000.0)], 2406, 604000.0 + 1800)
+        pos2, _ = satpos([eph(toe=604000.0)], 2407, 1000.0)
+        np.testing.assert_allclose(pos1, pos2, atol=1e-6)
+
+    def testbds(self):
+        meo = eph(108, prn=20, week=1050, toe=3600.0)
+        geo = eph(108, prn=3, week=1050, toe=3600.0, i0=0.05, ecc=0.0002, a=42164000.0)
+        pos, _ = satpos([meo, geo], 2406, [3614.0, 5414.0])
+        rpos, _ = reference(meo, 0.0, 3.986004418e14, 7.292115e-5)
+        np.testing.assert_allclose(pos[0, 0], rpos, atol=1e-6)
+        # GEO remains near-stationary in ECEF
+        self.assertLess(np.linalg.norm(pos[1, 1] - pos[1, 0]), 1.0e6)
+        self.assertAlmostEqual(np.linalg.norm(pos[1, 0]) / 42164000.0, 1.0, places=3)
+
+    def testglonass(self):
+        vel = 3953.0
+        inc = 1.131  # ~64.8 deg
+        glo = UNIMessage(
+            msgid=107,
+            wno=2406,
+            tow=0,
+            slot=38,
+            eweek=2406,
+            etime=900000,
+            posx=25.5e6,
+            posy=0.0,
+            posz=0.0,
+            velx=0.0,
+            vely=vel * cos(inc) - 7.292115e-5 * 25.5e6,
+            velz=vel * sin(inc),
+            taun=1.0e-5,
+            gamma=1.0e-12,
+        )
+        pos, clk = satpos([glo], 2406, [900.0, 1800.0])
+        np.testing.assert_allclose(pos[0, 0], (25.5e6, 0, 0))
+        self.assertAlmostEqual(np.linalg.norm(pos[0, 1]) / 25.5e6, 1.0, places=3)
+        np.testing.assert_allclose(clk[0], (-1.0e-5, -1.0e-5 + 900e-12))
+
+    def testmixed(self):  # kepler and glonass in one call keep input order
+        glo = UNIMessage(
+            msgid=107,
+            wno=2406,
+            tow=0,
+            slot=40,
+            eweek=2406,
+            etime=7200000,
+            posx=2.5e7,
+            vely=3000.0,
+        )
+        pos, _ = satpos([glo, eph()], 2406, 7200.0)
+        np.testing.assert_allclose(pos[0, 0], (2.5e7, 0, 0))
+        np.testing.assert_allclose(pos[1, 0], reference(eph(), 0.0)[0], atol=1e-6)
+
+    def testerrors(self):
+        with self.assertRaisesRegex(ParameterError, "VERSION is not an ephemeris"):
+            satpos([UNIMessage(msgid=17, wno=2406, tow=0)], 2406, 0)
+        with patch.dict(sys.modules, {"numpy": None}):
+            with self.assertRaisesRegex(ParameterError, "requires the 'numpy' package"):
+                satpos([eph()], 2406, 0)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Sans-IO parser tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+
+from pyunigps import (
+    ERR_IGNORE,
+    ERR_RAISE,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    UNI_PROTOCOL,
+    VALNONE,
+    UNIChangeFilter,
+    UNIMessage,
+    UNIParseError,
+    UNIParser,
+    UNIReader,
+    UNIStreamError,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def version(tow: int, swversion: str = "R4.10") -> bytes:
+    return UNIMessage(
+        msgid=17, wno=2406, tow=tow, device="M982", swversion=swversion
+    ).serialize()
+
+
+def chunks(data: bytes, size: int) -> list:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def results(msgs: list) -> list:
+    return [(raw, str(parsed)) for raw, parsed in msgs]
+
+
+class ParserTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.uni = version(1) + version(2)
+        self.nmea = (
+            b"$GNRMC,084159.00,A,3203.94995,N,03446.42914,E,0.000,,080222,,,D,V*1F\r\n"
+        )
+        with open(os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log"), "rb") as stream:
+            self.mixed = stream.read()
+
+    def tearDown(self):
+        pass
+
+    def testsamemessages(self):  # chunking makes no difference, same as UNIReader
+        expected = results(UNIReader(BytesIO(self.mixed), quitonerror=ERR_RAISE))
+        self.assertEqual(len(expected), 9)
+        for size in (1, 2, 7, 64, 1000, len(self.mixed)):
+            parser = UNIParser(quitonerror=ERR_RAISE)
+            msgs = []
+            for chunk in chunks(self.mixed, size):
+                msgs += parser.feed(chunk)
+            self.assertEqual(results(msgs), expected)
+            self.assertEqual(parser.buffered, 0)
+
+    def testpartial(self):
+        parser = UNIParser()
+        raw = version(1)
+        self.assertEqual(parser.feed(raw[:30]), [])
+        self.assertEqual(parser.buffered, 30)
+        msgs = parser.feed(memoryview(raw[30:] + self.nmea[:10]))
+        self.assertEqual(len(msgs), 1)
+        self.assertEqual(msgs[0][0], raw)
+        self.assertEqual(msgs[0][1].tow, 1)
+        self.assertEqual(parser.buffered, 10)
+        msgs = parser.feed(bytearray(self.nmea[10:]))
+        self.assertEqual(msgs[0][0], self.nmea)
+        self.assertEqual(msgs[0][1].identity, "GNRMC")
+        parser.feed(raw[:10])
+        parser.reset()
+        self.assertEqual(parser.buffered, 0)
+        self.assertEqual(results(parser.feed(raw)), [(raw, str(UNIReader.parse(raw)))])
+
+    def testgarbage(self):  # leading and trailing bytes which are not a message header
+        parser = UNIParser(quitonerror=ERR_IGNORE)
+        msgs = parser.feed(
+            b"\x00\x01xyz\xaa\x44\x00"
+            + self.uni
+            + b"\xaa\x01"
+            + self.nmea
+            + b"\x55\x55"
+        )
+        self.assertEqual(
+            [parsed.identity for _, parsed in msgs], ["VERSION", "VERSION", "GNRMC"]
+        )
+        self.assertEqual(parser.buffered, 0)
+
+    def testprotfilter(self):
+        data = self.uni + self.nmea + self.uni
+        msgs = UNIParser(protfilter=NMEA_PROTOCOL).feed(data)
+        self.assertEqual([raw for raw, _ in msgs], [self.nmea])
+        msgs = UNIParser(protfilter=UNI_PROTOCOL | RTCM3_PROTOCOL, parsing=False).feed(
+            data
+        )
+        self.assertEqual(msgs, [(version(1), None), (version(2), None)] * 2)
+
+    def testframefilter(self):
+        data = version(1) + version(2) + version(3, "R4.11")
+        msgs = UNIParser(framefilter=UNIChangeFilter()).feed(data)
+        self.assertEqual([parsed.tow for _, parsed in msgs], [1, 3])
+
+    def testerrors(self):
+        bad = version(3)[:-1] + b"\x00"
+        errs = []
+        parser = UNIParser(errorhandler=errs.append)
+        msgs = parser.feed(version(1) + bad + version(2))
+        self.assertEqual(len(msgs), 2)
+        self.assertIsInstance(errs[0], UNIParseError)
+        parser = UNIParser(quitonerror=ERR_RAISE)
+        with self.assertRaisesRegex(UNIParseError, "Message checksum .* invalid"):
+            parser.feed(bad + self.uni)
+        self.assertEqual(len(parser.feed(b"")), 2)  # resume after error
+        with self.assertRaises(UNIParseError):
+            parser.feed(version(1) + bad + version(2))
+        self.assertEqual(
+            [parsed.tow for _, parsed in parser.feed(b"")], [1, 2]
+        )  # message before error retained
+        with self.assertRaisesRegex(UNIParseError, "Unknown protocol header"):
+            parser.feed(b"\xd3\xff")
+        msgs = UNIParser(validate=VALNONE).feed(bad)
+        self.assertEqual(msgs[0][1].tow, 3)
+        with self.assertRaisesRegex(
+            UNIStreamError, "Invalid stream mode 4 - must be 0, 1, 2 or 3"
+        ):
+            UNIParser(msgmode=4)
+
+    def testerrorreset(self):  # messages retained after error are discarded by reset
+        bad = version(3)[:-1] + b"\x00"
+        parser = UNIParser(quitonerror=ERR_RAISE)
+        with self.assertRaises(UNIParseError):
+            parser.feed(version(1) + bad + version(2)[:10])
+        self.assertEqual(parser.buffered, 10)
+        parser.reset()
+        self.assertEqual(parser.buffered, 0)
+        self.assertEqual(parser.feed(b""), [])
+        self.assertEqual([parsed.tow for _, parsed in parser.feed(version(4))], [4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+UNIMessage pickling tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import copy
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+from pyunigps import (
+    REGISTRY,
+    U1,
+    UNI_MSGIDS,
+    UNI_PAYLOADS_GET,
+    VALNONE,
+    X1,
+    UNIMessage,
+    UNIMessageError,
+    UNIMessageView,
+    UNIOpaqueMessage,
+    UNIReader,
+)
+
+
+def obs(prns: list) -> bytes:
+    kwargs = {"numobs": len(prns)}
+    for i, prn in enumerate(prns):
+        kwargs[f"prn_{i + 1:02d}"] = prn
+        kwargs[f"psr_{i + 1:02d}"] = 2.1e7 + prn
+    return UNIMessage(msgid=12, wno=2406, tow=1000, **kwargs).serialize()
+
+
+def roundtrip(msg: object) -> object:
+    return pickle.loads(pickle.dumps(msg))
+
+
+def summary(msg: UNIMessage) -> tuple:  # called in worker process
+    return msg.tow, msg.prn_02, msg
+
+
+class PickleTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.obs = obs(list(range(1, 31)))
+
+    def testroundtrip(self):
+        for raw in (
+            self.obs,
+            UNIMessage(
+                msgid=17, wno=2406, tow=1, device="M982", swversion="R4.10"
+            ).serialize(),
+            UNIMessage(
+                msgid=106, wno=2406, tow=1, prn=5, health=1, toe=345600.0, ecc=0.01
+            ).serialize(),
+            UNIMessage(msgid=138, wno=2406, tow=0, numobs=1, prn_01=7).serialize(),
+            UNIMessage(msgid=12345, wno=2406, tow=0, payload=b"\x01\x02").serialize(),
+        ):
+            for parsebf in (True, False):
+                msg = UNIReader.parse(raw, parsebitfield=parsebf)
+                msg2 = roundtrip(msg)
+                self.assertEqual(str(msg2), str(msg))
+                self.assertEqual(msg2.to_dict(), msg.to_dict())
+                self.assertEqual(msg2.serialize(), raw)
+                self.assertEqual(msg2._parsebf, parsebf)
+        msg = UNIMessage(msgid=17, wno=2406, tow=1)  # no payload
+        self.assertEqual(
+            (roundtrip(msg).payload, str(roundtrip(msg))), (None, "<UNI(VERSION)>")
+        )
+        bad = self.obs[:-1] + b"\x00"
+        self.assertEqual(
+            roundtrip(UNIReader.parse(bad, validate=VALNONE)).checksum, bad[-4:]
+        )  # checksum preserved
+
+    def testcompact(self):
+        msg = UNIReader.parse(self.obs)
+        self.assertLess(len(pickle.dumps(msg)), len(self.obs) + 100)
+        msg2 = roundtrip(msg)
+        self.assertNotIn("prn_01", msg2.__dict__)  # decoded on first access
+        self.assertEqual((msg2.prn_30, msg2.psr_02), (30, 2.1e7 + 2))
+        self.assertIn("prn_01", msg2.__dict__)
+        with self.assertRaisesRegex(UNIMessageError, "Object is immutable"):
+            msg2.tow = 2
+
+    def testprojected(self):
+        msg = UNIReader.parse(self.obs, projection={"OBSVM": ("numobs",)})
+        msg2 = roundtrip(msg)
+        self.assertEqual((msg2.numobs, msg2.prn_03), (30, 3))
+        self.assertEqual(str(msg2), str(UNIReader.parse(self.obs)))
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    def testbitfield(self):
+        REGISTRY.register(
+            64000,
+            "MYMSG",
+            {
+                "count": U1,
+                "flags": (X1, {"fix": "U002", "reserved": "U002", "valid": "U001"}),
+            },
+        )
+        msg = UNIReader.parse(
+            UNIMessage(
+                msgid=64000, wno=2406, tow=0, count=3, fix=2, valid=1
+            ).serialize()
+        )
+        self.assertEqual((roundtrip(msg).fix, roundtrip(msg).valid), (2, 1))
+        REGISTRY.invalidate("MYMSG")
+
+    def testcopy(self):
+        msg = UNIReader.parse(self.obs)
+        msg2 = copy.copy(msg)
+        self.assertIsNot(msg2.__dict__, msg.__dict__)
+        self.assertIs(msg2.__dict__["_payload"], msg.__dict__["_payload"])
+        self.assertEqual(str(msg2), str(msg))
+        self.assertEqual(str(copy.deepcopy(msg)), str(msg))
+
+    def testopaque(self):
+        raw = UNIMessage(msgid=12345, wno=2406, tow=0, payload=b"\x01\x02").serialize()
+        msg = roundtrip(UNIReader.parse(raw, opaque=True))
+        self.assertIsInstance(msg, UNIOpaqueMessage)
+        self.assertEqual(msg.serialize(), raw)
+        view = roundtrip(UNIMessageView(memoryview(self.obs)))
+        self.assertIsInstance(view, UNIMessageView)
+        self.assertEqual(view.prn_30, 30)
+
+    def testprocesspool(self):
+        msgs = [UNIReader.parse(obs([i, i + 1])) for i in range(1, 5)]
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results = list(pool.map(summary, msgs))
+        self.assertEqual(
+            [res[0:2] for res in results], [(1000, 2), (1000, 3), (1000, 4), (1000, 5)]
+        )
+        self.assertEqual([str(res[2]) for res in results], [str(msg) for msg in msgs])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+"""
+Attribute projection tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from pyunigps import (
+    REGISTRY,
+    U1,
+    UNI_MSGIDS,
+    UNI_PAYLOADS_GET,
+    X1,
+    UNIMessage,
+    UNIMessageError,
+    UNIReader,
+    UNITypeError,
+)
+
+
+def obs(prns: list) -> bytes:
+    kwargs = {"numobs": len(prns)}
+    for i, prn in enumerate(prns):
+        kwargs[f"prn_{i + 1:02d}"] = prn
+        kwargs[f"psr_{i + 1:02d}"] = 2.1e7 + prn
+        kwargs[f"cn0_{i + 1:02d}"] = 40.25 + i
+    return UNIMessage(msgid=12, wno=2406, tow=0, **kwargs).serialize()
+
+
+def public(msg: UNIMessage) -> dict:
+    return {key: val for key, val in msg.__dict__.items() if key[0] != "_"}
+
+
+class ProjectionTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.obs = obs([3, 12, 25])
+        self.eph = UNIMessage(
+            msgid=106,
+            wno=2406,
+            tow=1,
+            prn=5,
+            health=1,
+            toe=345600.0,
+            a=26560000.5,
+            ecc=0.01,
+        ).serialize()
+        self.version = UNIMessage(
+            msgid=17, wno=2406, tow=1, device="M982", swversion="R4.10"
+        ).serialize()
+
+    def tearDown(self):
+        pass
+
+    def testprojected(self):
+        full = UNIReader.parse(self.obs)
+        msg = UNIReader.parse(self.obs, projection={"OBSVM": ("numobs", "prn", "cn0")})
+        self.assertEqual(
+            public(msg),
+            {
+                key: val
+                for key, val in public(full).items()
+                if key
+                in (
+                    "numobs",
+                    "prn_01",
+                    "prn_02",
+                    "prn_03",
+                    "cn0_01",
+                    "cn0_02",
+                    "cn0_03",
+                )
+                or key in UNI_HEADER
+            },
+        )
+        self.assertEqual(msg.cn0_02, 41.25)
+        self.assertNotIn("psr_01", msg.__dict__)
+        self.assertEqual(msg.serialize(), self.obs)
+        self.assertEqual(
+            str(msg),
+            "<UNI(OBSVM, cpuidle=0, timeref=0, timestatus=0, wno=2406, tow=0, version=0, leapsecond=0, delay=0, numobs=3, prn_01=3, prn_02=12, prn_03=25, cn0_01=40.25, cn0_02=41.25, cn0_03=42.25)>",
+        )
+
+    def testlazy(self):  # unprojected attributes decoded on first access
+        full = UNIReader.parse(self.obs)
+        msg = UNIReader.parse(self.obs, projection={12: ("prn",)})
+        self.assertEqual(msg.psr_02, 2.1e7 + 12)
+        self.assertEqual(public(msg), public(full))
+        with self.assertRaises(AttributeError):
+            msg.xxx  # pylint: disable=pointless-statement
+        with self.assertRaises(UNIMessageError):  # still immutable
+            msg.prn_01 = 4
+
+    def testsingle(self):
+        full = UNIReader.parse(self.eph)
+        msg = UNIReader.parse(
+            self.eph, projection={"GPSEPH": ("prn", "health", "toe", "a", "ecc")}
+        )
+        self.assertEqual(
+            (msg.prn, msg.health, msg.toe, msg.a, msg.ecc),
+            (full.prn, full.health, full.toe, full.a, full.ecc),
+        )
+        self.assertNotIn("omega", msg.__dict__)
+        msg = UNIReader.parse(self.version, projection={"VERSION": ("device",)})
+        self.assertEqual(msg.device, UNIReader.parse(self.version).device)
+
+    def testindexed(self):
+        msg = UNIReader.parse(self.obs, projection={"OBSVM": ("prn_02", "prn_05")})
+        self.assertEqual(msg.prn_02, 12)
+        self.assertNotIn("prn_01", msg.__dict__)
+        self.assertNotIn("prn_05", msg.__dict__)
+
+    def testfallback(
+        self,
+    ):  # attributes not at fixed offset, or unknown, decode in full
+        cmp = UNIMessage(msgid=138, wno=2406, tow=0, numobs=1, prn_01=7).serialize()
+        for raw, proj in (
+            (cmp, {"OBSVMCMP": ("prn",)}),
+            (self.obs, {"OBSVM": ("prn", "xxx")}),
+        ):
+            msg = UNIReader.parse(raw, projection=proj)
+            self.assertEqual(public(msg), public(UNIReader.parse(raw)))
+        raw = UNIMessage(msgid=12345, wno=2406, tow=0, payload=b"\x01").serialize()
+        self.assertEqual(
+            UNIReader.parse(raw, projection={12345: ("a",)}).identity, "3039-NOMINAL"
+        )
+
+    def testtruncated(self):
+        with self.assertRaisesRegex(
+            UNITypeError, "Payload too short for attribute 'prn'"
+        ):
+            UNIMessage(
+                msgid=12,
+                wno=2406,
+                tow=0,
+                payload=b"\x05\x00\x00\x00\x01",
+                projection=("prn",),
+            )
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    def testbitfield(self):
+        REGISTRY.register(
+            64000,
+            "MYMSG",
+            {
+                "count": U1,
+                "flags": (X1, {"fix": "U002", "reserved": "U002", "valid": "U001"}),
+            },
+        )
+        raw = UNIMessage(
+            msgid=64000, wno=2406, tow=0, count=3, fix=2, valid=1
+        ).serialize()
+        msg = UNIReader.parse(raw, projection={"MYMSG": ("valid", "fix")})
+        self.assertEqual((msg.valid, msg.fix), (1, 2))
+        self.assertNotIn("count", msg.__dict__)
+        self.assertEqual(msg.count, 3)
+        REGISTRY.invalidate("MYMSG")
+
+    def testreader(self):
+        stream = BytesIO(self.obs + self.eph + self.version)
+        res = list(UNIReader(stream, projection={"OBSVM": ("numobs",), 106: ("prn",)}))
+        self.assertEqual([len(public(parsed)) for _, parsed in res], [9, 9, 14])
+        self.assertEqual(res[1][1].prn, 5)
+
+
+UNI_HEADER = (
+    "cpuidle",
+    "timeref",
+    "timestatus",
+    "wno",
+    "tow",
+    "version",
+    "leapsecond",
+    "delay",
+)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+"""
+Payload definition registry tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import re
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyunigps import (
+    GET,
+    OBS_RECORD,
+    R4,
+    R8,
+    REGISTRY,
+    SET,
+    U1,
+    U2,
+    U4,
+    UNI_MSGIDS,
+    UNI_PAYLOADS_GET,
+    UNI_PAYLOADS_GET_VERSIONED,
+    X1,
+    ParameterError,
+    UNIMessage,
+    UNIPayloadCache,
+    UNIPayloadRegistry,
+    UNIReader,
+    UNITypeError,
+)
+from pyunigps.uniregistry import BITFIELD, GROUP, SINGLE, compile_payload
+from pyunigps.unitypes_set import UNI_PAYLOADS_SET
+
+MYMSG = {
+    "count": U1,
+    "flags": (X1, {"valid": "U001", "mode": "U003"}),
+    "group": ("count", {"val": R8, "scaled": [U2, 0.01]}),
+}
+
+
+class RegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cachefile = os.path.join(self.tmpdir.name, "pyunigps.reg")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def testcompileall(self):  # all built-in definitions are valid
+        reg = UNIPayloadRegistry()
+        self.assertEqual(reg.compile_all(), len(UNI_PAYLOADS_GET))
+        self.assertEqual(len(reg), len(UNI_PAYLOADS_GET))
+        self.assertEqual(reg.size(GET, "VERSION"), 308)
+        self.assertEqual(reg.size(GET, "OBSVM"), -1)
+
+    def testcompiled(self):
+        table, size = compile_payload("OBSVM", OBS_RECORD)
+        self.assertEqual(size, -1)
+        self.assertEqual(table[0], (SINGLE, "numobs", U4, 4, 1))
+        self.assertEqual(table[1][0:3], (GROUP, "group", "numobs"))
+        self.assertEqual(table[1][3][4], (SINGLE, "psrstd", U2, 2, 0.01))
+        self.assertEqual(table[1][4], 40)
+        table, size = compile_payload("MYMSG", MYMSG)
+        self.assertEqual(
+            table[1], (BITFIELD, "flags", X1, 1, (("valid", 1), ("mode", 3)))
+        )
+        self.assertEqual(size, -1)
+        self.assertEqual(
+            compile_payload("FIXED", {"a": U1, "b": (3, {"c": R4})})[1], 13
+        )
+
+    def testinvalid(self):
+        defs = {
+            "duplicate attribute name 'a'": {"a": U1, "g": (2, {"a": U2})},
+            "group 'g' counter 'n' not defined before use": {
+                "g": ("n", {"a": U1}),
+                "n": U1,
+            },
+            "group 'g' counter 'a' not defined before use": {
+                "a": R8,
+                "g": ("a", {"b": U1}),
+            },
+            "'variable by size' group 'g' must be last attribute": {
+                "g": ("None", {"a": U1}),
+                "b": U1,
+            },
+            "'variable by size' group 'g' must have fixed size": {
+                "g": ("None", {"n": U1, "h": ("n", {"a": U1})})
+            },
+            "unknown type 'Q004' for 'a'": {"a": "Q004"},
+            "invalid size 'R002' for 'a'": {"a": "R002"},
+            "invalid size 'CXXX' for 'a'": {"a": "CXXX"},
+            "invalid scaling for 'a'": {"a": [U2]},
+            "bitfield 'f' flags (9 bits) exceed X001": {
+                "f": (X1, {"a": "U008", "b": "U001"})
+            },
+        }
+        for err, pdict in defs.items():
+            with self.assertRaisesRegex(
+                UNITypeError, re.escape(f"Invalid payload definition BAD - {err}")
+            ):
+                compile_payload("BAD", pdict)
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    def testregister(self):
+        reg = UNIPayloadRegistry()
+        reg.register(64000, "MYMSG", MYMSG)
+        self.assertEqual(UNI_MSGIDS[64000], "MYMSG")
+        self.assertEqual(reg.compiled, 1)
+        raw = UNIMessage(
+            msgid=64000,
+            wno=2406,
+            tow=0,
+            count=2,
+            valid=1,
+            mode=5,
+            val_01=1.5,
+            scaled_01=2.5,
+            val_02=-3.25,
+            scaled_02=0.07,
+        ).serialize()
+        msg = UNIReader.parse(raw)
+        self.assertEqual(msg.identity, "MYMSG")
+        self.assertEqual((msg.count, msg.valid, msg.mode), (2, 1, 5))
+        self.assertEqual(
+            (msg.val_01, msg.scaled_01, msg.val_02, msg.scaled_02),
+            (1.5, 2.5, -3.25, 0.07),
+        )
+        with self.assertRaisesRegex(
+            ParameterError, "msgid 17 is already assigned to VERSION"
+        ):
+            reg.register(17, "MYMSG", MYMSG)
+        with self.assertRaisesRegex(ParameterError, "Invalid msgmode 3"):
+            reg.register(64000, "MYMSG", MYMSG, 3)
+        with self.assertRaises(UNITypeError):  # invalid definition not registered
+            reg.register(64001, "BADMSG", {"a": "Q001"})
+        self.assertNotIn(64001, UNI_MSGIDS)
+        self.assertNotIn("BADMSG", UNI_PAYLOADS_GET)
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_SET)
+    def testregisterset(self):
+        REGISTRY.register(64000, "MYCMD", {"enable": U1}, SET)
+        msg = UNIMessage(msgid=64000, msgmode=SET, enable=1)
+        self.assertEqual(msg.payload, b"\x01")
+        REGISTRY.invalidate("MYCMD")
+
+    @patch.dict(UNI_PAYLOADS_GET)
+    def testrecompile(self):  # replaced definition is recompiled on next use
+        reg = UNIPayloadRegistry()
+        table = reg.table(GET, "VERSION")
+        self.assertIs(reg.table(GET, "VERSION"), table)
+        UNI_PAYLOADS_GET["VERSION"] = {"device": "C004"}
+        self.assertEqual(len(reg.table(GET, "VERSION")), 1)
+        self.assertEqual(reg.compiled, 2)
+        reg.invalidate()
+        self.assertEqual(len(reg), 0)
+
+    def testcache(self):
+        reg = UNIPayloadRegistry()
+        self.assertFalse(reg.load(self.cachefile))  # no cache, so compiled and saved
+        self.assertTrue(os.path.exists(self.cachefile))
+        reg2 = UNIPayloadRegistry()
+        self.assertTrue(reg2.load(self.cachefile))
+        self.assertEqual(reg2.compiled, 0)
+        self.assertEqual(len(reg2), len(reg))
+        self.assertEqual(reg2.table(GET, "OBSVMCMP"), reg.table(GET, "OBSVMCMP"))
+        self.assertEqual(reg2.compiled, 0)  # bound to current definitions
+        reg2.invalidate(cachefile=self.cachefile)
+        self.assertFalse(os.path.exists(self.cachefile))
+        self.assertEqual(len(reg2), 0)
+
+    def testcachestale(self):
+        reg = UNIPayloadRegistry()
+        reg.compile_all()
+        with patch("pyunigps.uniregistry.__version__", "0.0.1"):
+            reg.save(self.cachefile)
+        reg2 = UNIPayloadRegistry()
+        self.assertFalse(reg2.load(self.cachefile))  # different version
+        self.assertTrue(UNIPayloadRegistry().load(self.cachefile))  # rewritten
+        with open(self.cachefile, "wb") as outfile:
+            outfile.write(b"\x00corrupt")
+        self.assertFalse(UNIPayloadRegistry().load(self.cachefile))
+
+    @patch.dict(UNI_PAYLOADS_GET)
+    def testcachedefs(self):  # cache saved from different definitions is rejected
+        UNIPayloadRegistry().compile_all()
+        UNIPayloadRegistry().save(self.cachefile)
+        self.assertTrue(UNIPayloadRegistry().load(self.cachefile))
+        UNI_PAYLOADS_GET["VERSION"] = {"device": "C004"}
+        reg = UNIPayloadRegistry()
+        self.assertFalse(reg.load(self.cachefile))
+        self.assertEqual(len(reg.table(GET, "VERSION")), 1)
+        self.assertTrue(UNIPayloadRegistry().load(self.cachefile))  # rewritten
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    @patch.dict(UNI_PAYLOADS_GET_VERSIONED)
+    def testversioned(self):
+        reg = REGISTRY
+        reg.register(64000, "MYMSG", {"count": U1, "val": R8})
+        reg.register_version("MYMSG", {"count": U2, "val": R4}, 3, 5)
+        reg.register_version("MYMSG", {"flag": U1, "count": U2, "val": R8}, 10)
+        self.assertEqual(
+            [lay[0:2] for lay in UNI_PAYLOADS_GET_VERSIONED["MYMSG"]],
+            [(3, 5), (10, None)],
+        )
+        for version, size, att in (
+            (0, 9, "count"),
+            (3, 6, "count"),
+            (5, 6, "count"),
+            (7, 9, "count"),
+            (10, 11, "flag"),
+            (99, 11, "flag"),
+        ):
+            raw = UNIMessage(
+                msgid=64000, wno=2406, tow=0, version=version, count=2, val=1.5
+            ).serialize()
+            msg = UNIReader.parse(raw)
+            self.assertEqual(len(msg.payload), size)
+            self.assertEqual((msg.version, msg.count, msg.val), (version, 2, 1.5))
+            self.assertTrue(hasattr(msg, att))
+        with self.assertRaisesRegex(
+            ParameterError, "Version range 4 - 12 overlaps existing MYMSG layout 3 - 5"
+        ):
+            reg.register_version("MYMSG", {"count": U1}, 4, 12)
+        with self.assertRaisesRegex(
+            ParameterError,
+            "Version range 6 - None overlaps existing MYMSG layout 10 - None",
+        ):
+            reg.register_version("MYMSG", {"count": U1}, 6)
+        with self.assertRaisesRegex(ParameterError, "Invalid version range 5 - 4"):
+            reg.register_version("MYMSG", {"count": U1}, 5, 4)
+        with self.assertRaises(UNITypeError):
+            reg.register_version("MYMSG", {"count": "Q001"}, 6, 7)
+        reg.invalidate("MYMSG")
+        self.assertEqual(UNIReader.parse(raw).flag, 0)  # recompiled
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    @patch.dict(UNI_PAYLOADS_GET_VERSIONED)
+    def testversionedcache(self):  # payload cache distinguishes layouts
+        REGISTRY.register(64000, "MYMSG", {"count": U2})
+        REGISTRY.register_version("MYMSG", {"a": U1, "b": U1}, 1, 1)
+        cache = UNIPayloadCache(msgids=None)
+        msg0 = UNIReader.parse(
+            UNIMessage(msgid=64000, wno=2406, tow=0, count=513).serialize(), cache=cache
+        )
+        msg1 = UNIReader.parse(
+            UNIMessage(msgid=64000, wno=2406, tow=0, version=1, a=1, b=2).serialize(),
+            cache=cache,
+        )
+        self.assertEqual(msg0.payload, msg1.payload)
+        self.assertEqual((msg0.count, msg1.a, msg1.b), (513, 1, 2))
+        self.assertEqual(cache.misses, 2)
+        REGISTRY.invalidate("MYMSG")
+
+
+if __name__ == "__main__":
+    unittest.main()
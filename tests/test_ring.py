@@ -0,0 +1,215 @@
+"""
+Shared memory ring buffer tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from multiprocessing.shared_memory import SharedMemory
+from time import sleep
+
+from pyunigps import (
+    UNI_HDR,
+    ParameterError,
+    UNIMessage,
+    UNIMessageView,
+    UNIReader,
+    UNIRingReader,
+    UNIRingWriter,
+    UNIStreamError,
+)
+
+
+def obs(tow: int, numobs: int) -> bytes:
+    kwargs = {"numobs": numobs}
+    for i in range(numobs):
+        kwargs[f"prn_{i + 1:02d}"] = i + 1
+        kwargs[f"psr_{i + 1:02d}"] = 2.1e7 + i
+    return UNIMessage(msgid=12, wno=2406, tow=tow, **kwargs).serialize()
+
+
+def consume(name: str, consumer: int, count: int) -> list:  # called in worker process
+    tows = []
+    with UNIRingReader(name, consumer) as ring:
+        while len(tows) < count:
+            frame = ring.read()
+            if frame is None:
+                sleep(0.001)
+                continue
+            tows.append(UNIReader.parse(frame).tow)
+            del frame
+    return tows
+
+
+class RingTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.frames = [obs(tow, tow % 5 + 1) for tow in range(20)]
+
+    def testreadwrite(self):
+        with UNIRingWriter(consumers=2) as writer:
+            for raw in self.frames:
+                writer.write(raw)
+            self.assertEqual(writer.count, 20)
+            with (
+                UNIRingReader(writer.name, 0) as ring0,
+                UNIRingReader(writer.name, 1) as ring1,
+            ):
+                for raw in self.frames:
+                    frame = ring0.read()
+                    self.assertIsInstance(frame, memoryview)
+                    self.assertEqual(frame, raw)
+                    self.assertEqual(
+                        str(UNIReader.parse(frame)), str(UNIReader.parse(raw))
+                    )
+                    del frame
+                self.assertIsNone(ring0.read())
+                self.assertEqual(ring0.lag, 0)
+                self.assertEqual(writer.lag(0), 0)
+                self.assertEqual(writer.lag(1), ring1.lag)
+                self.assertEqual(bytes(ring1.read()), self.frames[0])
+                self.assertEqual(ring0.overruns + ring1.overruns, 0)
+
+    def testwrap(self):
+        with UNIRingWriter(size=1000) as writer, UNIRingReader(writer.name) as ring:
+            for _ in range(5):
+                for raw in self.frames:
+                    writer.write(raw)
+                    self.assertEqual(ring.read(), raw)
+                    self.assertTrue(ring.intact())
+            self.assertIsNone(ring.read())
+            self.assertEqual(ring.overruns, 0)
+
+    def testoverrun(self):
+        with UNIRingWriter(size=1000) as writer, UNIRingReader(writer.name) as ring:
+            writer.write(self.frames[0])
+            frame = ring.read()
+            self.assertTrue(ring.intact())
+            for raw in self.frames[1:8]:
+                writer.write(raw)
+            self.assertFalse(ring.intact())  # lapped while in use
+            del frame
+            self.assertIsNone(ring.read())
+            self.assertEqual(ring.overruns, 1)
+            self.assertGreater(ring.lost, 0)
+            self.assertEqual(ring.lag, 0)
+            writer.write(self.frames[8])  # resumes at newest frame
+            self.assertEqual(ring.read(), self.frames[8])
+            self.assertEqual(ring.overruns, 1)
+
+    def testresume(self):
+        with UNIRingWriter() as writer:
+            for raw in self.frames[0:3]:
+                writer.write(raw)
+            with UNIRingReader(writer.name) as ring:
+                ring.read()
+            self.assertEqual(
+                writer.lag(0), 120 + 160
+            )  # records padded to multiple of 8
+            with UNIRingReader(writer.name) as ring:
+                self.assertEqual(ring.read(), self.frames[1])
+
+    def testiterate(self):
+        writer = UNIRingWriter()
+        ring = UNIRingReader(writer.name)
+        for raw in self.frames:
+            writer.write(raw)
+        writer.close()  # consumer reads remaining frames then stops
+        tows = [UNIReader.parse(frame).tow for frame in ring if frame[0:3] == UNI_HDR]
+        self.assertEqual(tows, list(range(20)))
+        ring.close()
+        with self.assertRaises(FileNotFoundError):
+            UNIRingReader(writer.name)
+
+    def testview(self):
+        with UNIRingWriter() as writer, UNIRingReader(writer.name) as ring:
+            for raw in self.frames[0:5]:
+                writer.write(raw)
+            view = None
+            for tow in range(5):
+                frame = ring.read()
+                view = UNIMessageView(frame) if view is None else view.bind(frame)
+                self.assertEqual(view.tow, tow)
+                self.assertEqual(view.prn, list(range(1, tow % 5 + 2)))
+            self.assertTrue(ring.intact())
+            del view, frame
+
+    def testclose(
+        self,
+    ):  # frames other than the last read must be released before close
+        with UNIRingWriter() as writer:
+            for raw in self.frames[0:3]:
+                writer.write(raw)
+            ring = UNIRingReader(writer.name)
+            frame0 = ring.read()
+            frame1 = ring.read()
+            self.assertEqual(frame0, self.frames[0])
+            with self.assertRaisesRegex(
+                UNIStreamError, "Cannot close ring while frames returned by read"
+            ):
+                ring.close()
+            with self.assertRaises(ValueError):
+                _ = frame1[0]  # last frame read is released
+            del frame0
+            ring.close()
+            ring.close()
+
+    def testparsecopy(self):
+        buf = bytearray(self.frames[3])
+        msg = UNIReader.parse(memoryview(buf), parsebitfield=False)
+        buf[24:] = bytes(len(buf) - 24)
+        self.assertEqual(msg.serialize(), self.frames[3])
+        self.assertEqual(msg.psr_04, 2.1e7 + 3)
+
+    def testinvalid(self):
+        with self.assertRaisesRegex(
+            ParameterError, "Invalid consumers 0 - must be >= 1"
+        ):
+            UNIRingWriter(consumers=0)
+        with self.assertRaisesRegex(
+            ParameterError, "Invalid ring size 8 - must be >= 64"
+        ):
+            UNIRingWriter(size=5)
+        with UNIRingWriter(size=64, consumers=2) as writer:
+            with self.assertRaisesRegex(
+                ParameterError, "Frame length 100 exceeds ring capacity 64"
+            ):
+                writer.write(bytes(100))
+            with self.assertRaisesRegex(
+                ParameterError, "Invalid consumer 2 - must be 0 to 1"
+            ):
+                writer.lag(2)
+            with self.assertRaisesRegex(
+                ParameterError, "Invalid consumer 2 - must be 0 to 1"
+            ):
+                UNIRingReader(writer.name, 2)
+        shm = SharedMemory(create=True, size=64)
+        try:
+            with self.assertRaisesRegex(UNIStreamError, "Invalid ring header"):
+                UNIRingReader(shm.name)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def testprocess(self):
+        raw = BytesIO(b"".join(self.frames))
+        with UNIRingWriter(consumers=2) as writer:
+            self.assertEqual(writer.record(UNIReader(raw, parsing=False)), 20)
+            with ProcessPoolExecutor(2) as pool:
+                results = [pool.submit(consume, writer.name, i, 20) for i in range(2)]
+                for result in results:
+                    self.assertEqual(result.result(timeout=60), list(range(20)))
+            self.assertEqual((writer.lag(0), writer.lag(1)), (0, 0))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
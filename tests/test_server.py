@@ -0,0 +1,185 @@
+"""
+UNISocketServer fan-out tests (loopback)
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import socket
+import time
+import unittest
+from io import BytesIO
+
+from pyunigps import (
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    UNI_PROTOCOL,
+    ParameterError,
+    UNIReader,
+    UNISocketServer,
+)
+from pyunigps.unihelpers import frame_id
+from pyunigps.uniserver import MAXREQUEST, UNIClient, parse_subscription
+
+DIRNAME = os.path.dirname(__file__)
+
+TEST12 = b"\xaa\x44\xb5\x00\xe8\xff\x05\x00\x11\x22\x33\x44\x55\x66\x77\x88\x99\x00\x11\x22\x33\x44\x55\x66\x01\x02\x03\x04\x05\xc1\xff\xd2\xaa"
+TEST14 = b"\xaa\x44\xb5\x00\xea\xff\x07\x00\x11\x22\x33\x44\x55\x66\x77\x88\x99\x00\x11\x22\x33\x44\x55\x66\x01\x02\x03\x04\x05\x06\x07\xaa\x81\xa3\x7a"
+
+
+def waitfor(condition, timeout: float = 5.0) -> bool:
+    """
+    Wait for condition to become true.
+    """
+
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def readframes(sock, num: int) -> list:
+    """
+    Read num frames from client socket.
+    """
+
+    sock.settimeout(5)
+    fin = sock.makefile("rb")
+    unr = UNIReader(fin, parsing=False)
+    frames = []
+    for _ in range(num):
+        raw, _ = unr.read()
+        frames.append(raw)
+    return frames
+
+
+class ServerTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        with open(os.path.join(DIRNAME, "pygpsdata_mixed_rtcm3.log"), "rb") as stream:
+            self.mixed = stream.read()
+
+    def tearDown(self):
+        pass
+
+    def testframeid(self):
+        self.assertEqual(frame_id(TEST12), (UNI_PROTOCOL, 65512))
+        unr = UNIReader(BytesIO(self.mixed), parsing=False)
+        ids = [frame_id(raw) for raw, _ in unr]
+        self.assertEqual(ids[0], (NMEA_PROTOCOL, "GNGLL"))
+        self.assertEqual(ids[1], (RTCM3_PROTOCOL, 1005))
+        self.assertEqual(ids[3], (RTCM3_PROTOCOL, 1077))
+        self.assertEqual(frame_id(b"\x00\x01"), (0, None))
+
+    def testparsesubscription(self):
+        self.assertEqual(
+            parse_subscription("protfilter=3 msgids=VERSION,1005,GGA,"),
+            (3, {17, 1005, "GGA"}),
+        )
+        self.assertEqual(parse_subscription(""), (7, None))
+        with self.assertRaisesRegex(ParameterError, "Invalid subscription request"):
+            parse_subscription("protfilter=x")
+        with self.assertRaisesRegex(ParameterError, "Invalid subscription request"):
+            parse_subscription("dodgy=1")
+
+    def testclientfilter(self):
+        client = UNIClient(None, ("127.0.0.1", 1), 2)
+        self.assertTrue(client.wants(UNI_PROTOCOL, 17))
+        client.filter = parse_subscription("protfilter=3 msgids=VERSION,GLL")
+        self.assertTrue(client.wants(UNI_PROTOCOL, 17))
+        self.assertFalse(client.wants(UNI_PROTOCOL, 18))
+        self.assertTrue(client.wants(NMEA_PROTOCOL, "GNGLL"))
+        self.assertFalse(client.wants(NMEA_PROTOCOL, "GNRMC"))
+        self.assertFalse(client.wants(RTCM3_PROTOCOL, 1005))
+
+    def testinvalid(self):
+        with self.assertRaisesRegex(ParameterError, "maxclients and queuesize"):
+            UNISocketServer(BytesIO(b""), queuesize=0)
+
+    def testdropslow(self):  # slow client is dropped, others unaffected
+        server = UNISocketServer(BytesIO(b""), port=0, queuesize=2)
+        slow = UNIClient(None, ("127.0.0.1", 1), 2)
+        fast = UNIClient(None, ("127.0.0.1", 2), 10)
+        server._clients = [slow, fast]
+        for _ in range(3):
+            server.broadcast(TEST12)
+        self.assertTrue(slow.dropped)
+        self.assertFalse(fast.dropped)
+        self.assertEqual(fast.queue.qsize(), 3)
+        self.assertEqual(slow.queue.get_nowait(), None)
+
+    def testfanout(self):  # loopback fan-out to filtered and unfiltered clients
+        producer, consumer = socket.socketpair()
+        stream = consumer.makefile("rb")
+        with UNISocketServer(stream, port=0, maxclients=2) as server:
+            cl1 = socket.create_connection(server.address)
+            cl2 = socket.create_connection(server.address)
+            self.assertTrue(waitfor(lambda: server.clients == 2))
+            cl3 = socket.create_connection(server.address)  # exceeds maxclients
+            cl2.sendall(b"protfilter=2 msgids=TEST14\n")
+            addr2 = cl2.getsockname()
+            self.assertTrue(
+                waitfor(
+                    lambda: any(
+                        c.address == addr2 and c.filter[1] is not None
+                        for c in server._clients
+                    )
+                )
+            )
+            producer.sendall(TEST12 + self.mixed + TEST14)
+            frames1 = readframes(cl1, 11)
+            frames2 = readframes(cl2, 1)
+            self.assertEqual(frames1[0], TEST12)
+            self.assertEqual(frames1[-1], TEST14)
+            expected = [raw for raw, _ in UNIReader(BytesIO(self.mixed), parsing=False)]
+            self.assertEqual(frames1[1:-1], expected)
+            self.assertEqual(frames2, [TEST14])
+            self.assertEqual(cl3.recv(10), b"")
+            for cl in (cl1, cl2, cl3):
+                cl.close()
+            self.assertTrue(waitfor(lambda: server.clients == 0))
+            producer.close()  # EOF ends producer
+        stream.close()
+        consumer.close()
+
+    def testrequestoverflow(self):  # client sending unterminated request is dropped
+        producer, consumer = socket.socketpair()
+        stream = consumer.makefile("rb")
+        with UNISocketServer(stream, port=0) as server:
+            cl1 = socket.create_connection(server.address)
+            self.assertTrue(waitfor(lambda: server.clients == 1))
+            with self.assertLogs("pyunigps.uniserver", level="WARNING") as log:
+                cl1.sendall(b"msgids=" + b"X" * MAXREQUEST)
+                self.assertTrue(waitfor(lambda: server.clients == 0))
+            self.assertIn("subscription request exceeds 4096 bytes", log.output[0])
+            cl1.settimeout(5)
+            self.assertEqual(cl1.recv(10), b"")
+            cl1.close()
+            producer.close()
+        stream.close()
+        consumer.close()
+
+    def testproducererror(self):  # producer error is logged and clients dropped
+        server = UNISocketServer(BytesIO(b"\xaa\x44\xb5\x00"), port=0, quitonerror=2)
+        client = UNIClient(None, ("127.0.0.1", 1), 2)
+        server._clients = [client]
+        with self.assertLogs("pyunigps.uniserver", level="ERROR") as log:
+            server._produce()
+        self.assertIn("Producer terminated", log.output[0])
+        self.assertTrue(client.dropped)
+        server.stop()
+        server.broadcast(TEST12)  # ignored once stopped
+        self.assertEqual(client.queue.get_nowait(), None)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -17,6 +17,7 @@ import pyunigps.unitypes_core as unt
 import pyunigps.exceptions as une
 from pyunigps.unitypes_core import CV, UNI_MSGIDS
 from pyunigps.unihelpers import (
+    CRCTABLE,
     calc_crc,
     escapeall,
     att2idx,
@@ -53,6 +54,16 @@ class StaticTest(unittest.TestCase):
         # print(escapeall(res))
         self.assertEqual(res, b"\x70\x19\x8f\x95")
 
+    def testcrcreference(self):  # zlib implementation matches table lookup
+
+        data = bytes((i * 37 + 11) & 0xFF for i in range(300))
+        for size in range(301):
+            crc = 0
+            for byte in data[:size]:
+                crc = CRCTABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+            self.assertEqual(calc_crc(data[:size]), crc.to_bytes(4, "little"))
+        self.assertEqual(calc_crc(memoryview(data)), calc_crc(data))
+
     def testVal2Bytes(self):  # test conversion of value to bytes
         INPUTS = [
             (2345, unt.U2),
@@ -0,0 +1,190 @@
+"""
+UNIMessageView (flyweight) tests
+
+Created on 19 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import copy
+import os
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from pyunigps import (
+    ERR_RAISE,
+    REGISTRY,
+    SET,
+    U1,
+    U2,
+    UNI_MSGIDS,
+    UNI_PAYLOADS_GET,
+    UNI_PAYLOADS_GET_VERSIONED,
+    VALNONE,
+    X1,
+    UNIMessage,
+    UNIMessageError,
+    UNIMessageView,
+    UNIParseError,
+    UNIReader,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def obs(prns: list, tow: int = 0) -> bytes:
+    kwargs = {"numobs": len(prns)}
+    for i, prn in enumerate(prns):
+        kwargs[f"prn_{i + 1:02d}"] = prn
+        kwargs[f"psr_{i + 1:02d}"] = 2.1e7 + prn
+        kwargs[f"cn0_{i + 1:02d}"] = 40.25 + i
+    return UNIMessage(msgid=12, wno=2406, tow=tow, **kwargs).serialize()
+
+
+def version(tow: int) -> bytes:
+    return UNIMessage(
+        msgid=17, wno=2406, tow=tow, device="M982", swversion="R4.10"
+    ).serialize()
+
+
+class ViewTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.obs = obs([3, 7, 12], 1000)
+
+    def testattributes(self):
+        view = UNIMessageView(self.obs)
+        msg = UNIReader.parse(self.obs)
+        self.assertEqual(
+            (view.identity, view.msgid, view.length, view.wno, view.tow),
+            ("OBSVM", 12, len(msg.payload), 2406, 1000),
+        )
+        self.assertEqual(view.numobs, 3)
+        self.assertEqual(
+            (view.prn_02, view.psr_03, view.cn0_02), (7, 2.1e7 + 12, 41.25)
+        )
+        self.assertEqual(view.prn, [3, 7, 12])
+        self.assertEqual(view.cn0, [msg.cn0_01, msg.cn0_02, msg.cn0_03])
+        self.assertEqual(view.chtrstatus_01, b"\x00\x00\x00\x00")
+        self.assertEqual(view.checksum, msg.checksum)
+        self.assertEqual(view.serialize(), self.obs)
+        with self.assertRaisesRegex(
+            AttributeError,
+            r"'OBSVM' message has no attribute 'prn_04' \(prn has 3 repeats\)",
+        ):
+            _ = view.prn_04
+        with self.assertRaises(AttributeError):
+            _ = view.xxx
+        self.assertEqual(view.to_dict(), msg.to_dict())
+        self.assertEqual(str(view), str(msg))
+        self.assertEqual(repr(view), f"UNIMessageView({self.obs!r})")
+        self.assertEqual(eval(repr(view)).prn, [3, 7, 12])  # pylint: disable=eval-used
+        self.assertEqual(copy.copy(view).prn_01, 3)
+
+    def testbind(self):
+        view = UNIMessageView(self.obs)
+        fields = view._fields
+        self.assertIs(view.bind(obs([9], 2000)), view)
+        self.assertIs(
+            view._fields, fields
+        )  # same msgid and version, layout not looked up again
+        self.assertEqual((view.tow, view.numobs, view.prn), (2000, 1, [9]))
+        view.bind(version(3000))
+        self.assertEqual(
+            (view.identity, view.tow, view.device), ("VERSION", 3000, "M982")
+        )
+        view.bind(memoryview(bytearray(self.obs)))
+        self.assertEqual(view.prn_03, 12)
+
+    def testfallback(
+        self,
+    ):  # attributes not at fixed offset, or undefined, are not decoded implicitly
+        raw = UNIMessage(msgid=138, wno=2406, tow=0, numobs=1, prn_01=7).serialize()
+        view = UNIMessageView(raw)
+        with self.assertRaisesRegex(
+            AttributeError,
+            r"'OBSVMCMP' message view has no fixed offset attribute 'prn_01' - use decode\(\).prn_01",
+        ):
+            _ = view.prn_01
+        self.assertEqual(view.decode().prn_01, 7)
+        self.assertFalse(hasattr(view, "xxx"))
+        raw = UNIMessage(msgid=12345, wno=2406, tow=0, payload=b"\x01\x02").serialize()
+        view = UNIMessageView(raw)
+        self.assertEqual(
+            (view.identity, bytes(view.payload)), ("3039-NOMINAL", b"\x01\x02")
+        )
+        with self.assertRaises(AttributeError):
+            _ = view.prn
+
+    @patch.dict(UNI_MSGIDS)
+    @patch.dict(UNI_PAYLOADS_GET)
+    @patch.dict(UNI_PAYLOADS_GET_VERSIONED)
+    def testlayouts(self):
+        REGISTRY.register(
+            64000,
+            "MYMSG",
+            {
+                "count": U1,
+                "flags": (X1, {"fix": "U002", "reserved": "U002", "valid": "U001"}),
+            },
+        )
+        REGISTRY.register_version("MYMSG", {"val": U2}, 2)
+        view = UNIMessageView(
+            UNIMessage(
+                msgid=64000, wno=2406, tow=0, count=3, fix=2, valid=1
+            ).serialize()
+        )
+        self.assertEqual(
+            (view.count, view.fix, view.valid, view.flags), (3, 2, 1, b"\x12")
+        )
+        view.bind(
+            UNIMessage(msgid=64000, wno=2406, tow=0, version=2, val=513).serialize()
+        )
+        self.assertEqual(view.val, 513)
+        REGISTRY.invalidate("MYMSG")
+
+    def testreader(self):
+        data = self.obs + version(1) + obs([5], 2000) + version(2)
+        with open(f"{DIRNAME}/pygpsdata_mixed_rtcm3.log", "rb") as stream:
+            data += stream.read()
+        expected = [(raw, str(parsed)) for raw, parsed in UNIReader(BytesIO(data))]
+        views = list(UNIReader(BytesIO(data), flyweight=True))
+        self.assertEqual([raw for raw, _ in views], [raw for raw, _ in expected])
+        self.assertIs(
+            views[0][1], views[2][1]
+        )  # one view per msgid, re-bound to each frame
+        self.assertIsNot(views[0][1], views[1][1])
+        self.assertEqual(views[0][1].tow, 2000)  # now bound to later frame
+        reader = UNIReader(BytesIO(data), flyweight=True)
+        results = []
+        for raw, parsed in reader:
+            results.append((raw, str(parsed)))  # consumed before next read
+        self.assertEqual(results, expected)
+
+    def testvalidate(self):
+        bad = version(2)[:-1] + b"\x00"
+        reader = UNIReader(
+            BytesIO(bad + version(3)), flyweight=True, quitonerror=ERR_RAISE
+        )
+        with self.assertRaisesRegex(
+            UNIParseError, r"Message checksum .* invalid - should be "
+        ):
+            reader.read()
+        self.assertEqual(reader.read()[1].tow, 3)
+        _, view = UNIReader(BytesIO(bad), flyweight=True, validate=VALNONE).read()
+        self.assertEqual(view.tow, 2)
+        with self.assertRaisesRegex(
+            UNIMessageError, "Unknown message type 17, mode SET"
+        ):  # flyweight applies to GET messages only
+            UNIReader(
+                BytesIO(version(2)), flyweight=True, msgmode=SET, quitonerror=ERR_RAISE
+            ).read()
+
+
+if __name__ == "__main__":
+    unittest.main()